@@ -0,0 +1,300 @@
+import argparse
+import functools
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import selenium
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage, Locator
+from utilities.command_budget import command_budget
+from utilities.config_reader import ConfigReader
+from utilities.file_utils import atomic_write_json, read_json
+from utilities.logger import get_logger
+from utilities.webdriver_factory import WebDriverFactory
+
+logger = get_logger(__name__)
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+RESULTS_DIR = ROOT_DIR / "reports" / "benchmarks"
+DEFAULT_BASELINE = RESULTS_DIR / "primitives-baseline.json"
+
+
+class Case(NamedTuple):
+    """One benchmarked primitive: the fixture page it runs on and the call that is timed."""
+    name: str
+    fixture: str
+    run: Callable[[BasePage], Any]
+
+
+def _locator(css: str) -> Locator:
+    return By.CSS_SELECTOR, css
+
+
+CASES = (
+    Case("find", "product_grid.html",
+         lambda page: page.find(_locator(".features_items .col-sm-4:last-child .product-image-wrapper"))),
+    Case("find_visible", "product_grid.html",
+         lambda page: page.find_visible(_locator(".productinfo p"))),
+    Case("find_all", "product_grid.html",
+         lambda page: page.find_all(_locator(".product-image-wrapper"))),
+    Case("click", "product_grid.html",
+         lambda page: page.click(_locator("a.add-to-cart[data-product-id='1']"))),
+    Case("send_keys", "signup_form.html",
+         lambda page: page.send_keys(_locator("#address1"), "4 Privet Drive, Little Whinging")),
+    Case("get_text", "cart_table.html",
+         lambda page: page.get_text(_locator("#product-3 .cart_total_price"))),
+    Case("is_displayed", "cart_table.html",
+         lambda page: page.is_displayed(_locator("#cart_info_table"))),
+    Case("hover", "product_grid.html",
+         lambda page: page.hover(_locator(".product-image-wrapper"))),
+    Case("scroll_into_view", "product_grid.html",
+         lambda page: page.scroll_into_view(_locator("#footer"))),
+)
+
+
+class FixtureServer:
+    """
+    Serves the static HTML fixtures on 127.0.0.1:<random port>, so the browser loads them
+    over HTTP like a real site but without network latency.
+    """
+
+    def __init__(self, directory: Path = FIXTURE_DIR) -> None:
+        handler = functools.partial(_QuietHandler, directory=str(directory))
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "FixtureServer":
+        threading.Thread(target=self._httpd.serve_forever, name="benchmark-fixtures", daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+# ---------- Running ----------
+
+def benchmark_config(backend: Optional[str] = None) -> Dict[str, Any]:
+    """The suite's config with a local headless Chrome and every per-test feature switched off."""
+    config = dict(ConfigReader().get_config())
+    config.update({
+        "browser": "chrome",
+        "headless": True,
+        "remote_url": None,  # a remote browser cannot reach the local fixture server
+        "wait_backend": backend or config.get("wait_backend", "observer"),
+        "request_blocking": {"enabled": False},
+        "har": {"mode": "off"},
+        "browser_cache": {"enabled": False},
+        "profiler": {"enabled": False},
+    })
+    return config
+
+
+def time_case(page: BasePage, case: Case, iterations: int, warmup: int) -> dict:
+    """Times `iterations` calls of the case after `warmup` untimed ones; counts its WebDriver commands once."""
+    for _ in range(warmup):
+        case.run(page)
+    with command_budget(max_commands=sys.maxsize) as budget:
+        case.run(page)
+
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        case.run(page)
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples, commands=len(budget.commands))
+
+
+def summarize(samples_ms: list[float], commands: int) -> dict:
+    ordered = sorted(samples_ms)
+    return {
+        "iterations": len(ordered),
+        "commands": commands,
+        "min_ms": round(ordered[0], 3),
+        "median_ms": round(statistics.median(ordered), 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "stdev_ms": round(statistics.stdev(ordered), 3) if len(ordered) > 1 else 0.0,
+    }
+
+
+def run_benchmarks(cases: tuple[Case, ...], iterations: int, warmup: int, backend: Optional[str] = None) -> dict:
+    """Runs the cases in one headless Chrome against the fixture server and returns the results document."""
+    config = benchmark_config(backend)
+    previous_backend = BasePage.WAIT_BACKEND
+    BasePage.WAIT_BACKEND = config["wait_backend"]
+    driver = WebDriverFactory(config).get_driver()
+    try:
+        results = {}
+        with FixtureServer() as server:
+            for case in cases:
+                driver.get(f"{server.url}/{case.fixture}")  # fresh document per case
+                results[case.name] = time_case(BasePage(driver), case, iterations, warmup)
+                logger.info("%-16s median %8.3f ms  p95 %8.3f ms  %s commands", case.name,
+                            results[case.name]["median_ms"], results[case.name]["p95_ms"],
+                            results[case.name]["commands"])
+        machine = machine_metadata(driver.capabilities)
+    finally:
+        driver.quit()
+        BasePage.WAIT_BACKEND = previous_backend
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": machine,
+        "settings": {"iterations": iterations, "warmup": warmup, "wait_backend": config["wait_backend"]},
+        "results": results,
+    }
+
+
+def machine_metadata(capabilities: Optional[dict] = None) -> dict:
+    """Where the numbers were measured; `capabilities` adds the browser."""
+    capabilities = capabilities or {}
+    return {
+        "host": socket.gethostname(),
+        "platform": platform.platform(),
+        "cpu": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "selenium": selenium.__version__,
+        "browser": capabilities.get("browserName"),
+        "browser_version": capabilities.get("browserVersion"),
+        "commit": _git_commit(),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True,
+                              text=True, timeout=5, check=True).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+# ---------- Comparing ----------
+
+# Machine fields that make timings incomparable when they differ
+COMPARABLE_MACHINE = ("host", "cpu", "cpu_count", "browser", "browser_version")
+
+
+def compare_results(current: dict, baseline: dict, threshold: float) -> dict:
+    """
+    Compares the median of every primitive with the baseline. A primitive regresses when its
+    median grows by more than `threshold` (0.2 = 20%) or it issues more WebDriver commands.
+    """
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append({"name": name, "median_ms": result["median_ms"], "status": "new"})
+            continue
+        change = result["median_ms"] / base["median_ms"] - 1 if base["median_ms"] else 0.0
+        if change > threshold or result["commands"] > base["commands"]:
+            status = "regressed"
+        elif change < -threshold or result["commands"] < base["commands"]:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({"name": name, "median_ms": result["median_ms"], "baseline_ms": base["median_ms"],
+                     "change": round(change, 3), "commands": result["commands"],
+                     "baseline_commands": base["commands"], "status": status})
+
+    machine, base_machine = current.get("machine", {}), baseline.get("machine", {})
+    return {
+        "threshold": threshold,
+        "rows": rows,
+        "regressions": [row["name"] for row in rows if row["status"] == "regressed"],
+        "machine_differences": {key: [base_machine.get(key), machine.get(key)] for key in COMPARABLE_MACHINE
+                                if base_machine.get(key) != machine.get(key)},
+    }
+
+
+def format_comparison(comparison: dict) -> str:
+    lines = [f"{'primitive':<18}{'median ms':>11}{'baseline':>11}{'change':>9}{'cmds':>7}  status"]
+    for row in comparison["rows"]:
+        if row["status"] == "new":
+            lines.append(f"{row['name']:<18}{row['median_ms']:>11.3f}{'-':>11}{'-':>9}{'-':>7}  new")
+            continue
+        commands = f"{row['baseline_commands']}>{row['commands']}" if row["commands"] != row["baseline_commands"] \
+            else str(row["commands"])
+        lines.append(f"{row['name']:<18}{row['median_ms']:>11.3f}{row['baseline_ms']:>11.3f}"
+                     f"{row['change']:>+9.1%}{commands:>7}  {row['status']}")
+    for key, (before, now) in comparison["machine_differences"].items():
+        lines.append(f"warning: baseline ran with {key}={before}, this run with {key}={now}")
+    return "\n".join(lines)
+
+
+# ---------- CLI ----------
+
+def main(argv: Optional[list[str]] = None) -> int:
+    settings = ConfigReader().get_config().get("benchmarks") or {}
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.primitives",
+                                     description="Micro-benchmarks for the BasePage primitives")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="benchmark the primitives in headless Chrome")
+    run.add_argument("--iterations", type=int, default=settings.get("iterations", 50))
+    run.add_argument("--warmup", type=int, default=settings.get("warmup", 5))
+    run.add_argument("--only", help="comma-separated primitives, e.g. find,click")
+    run.add_argument("--backend", choices=("observer", "polling"), help="wait backend (defaults to wait_backend)")
+    run.add_argument("--out", type=Path, help="results file (defaults to reports/benchmarks/primitives-<time>.json)")
+    run.add_argument("--save-baseline", action="store_true", help="also store the results as the baseline")
+
+    compare = commands.add_parser("compare", help="compare a results file with a baseline")
+    compare.add_argument("results", type=Path)
+
+    for command in (run, compare):
+        command.add_argument("--baseline", type=Path, default=Path(settings.get("baseline") or DEFAULT_BASELINE))
+        command.add_argument("--threshold", type=float, default=settings.get("threshold", 0.2),
+                             help="allowed median slowdown before a primitive counts as regressed (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        names = set(args.only.split(",")) if args.only else None
+        unknown = (names or set()) - {case.name for case in CASES}
+        if unknown:
+            parser.error(f"unknown primitives: {', '.join(sorted(unknown))}")
+        current = run_benchmarks(tuple(case for case in CASES if names is None or case.name in names),
+                                 args.iterations, args.warmup, args.backend)
+        out = args.out or RESULTS_DIR / f"primitives-{datetime.now():%Y%m%d-%H%M%S}.json"
+        atomic_write_json(out, current)
+        print(f"Results written to {out}")
+        if args.save_baseline:
+            atomic_write_json(args.baseline, current)
+            print(f"Baseline saved to {args.baseline}")
+            return 0
+    else:
+        current = read_json(args.results)
+
+    baseline = read_json(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    comparison = compare_results(current, baseline, args.threshold)
+    print(format_comparison(comparison))
+    return 1 if comparison["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ElementTree
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+import yaml
+
+from benchmarks.primitives import RESULTS_DIR, ROOT_DIR, machine_metadata
+from stand_in.server import StandInServer
+from utilities.file_utils import atomic_write_json
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Existing tests that walk each flow through the page objects
+FLOWS = {
+    "register": "tests/test_register_user.py",
+    "login": "tests/test_login_user_with_correct_email_and_password.py",
+    "add_to_cart": "tests/test_add_products_in_cart.py",
+    "checkout": "tests/test_place_order_login_before_checkout.py",
+    "invoice": "tests/test_download_invoice_after_purchase_order.py",
+}
+
+
+class Mode(NamedTuple):
+    """One execution mode: config overrides on top of BASELINE and the number of xdist workers (0 = serial)."""
+    name: str
+    description: str
+    overrides: Dict[str, Any]
+    workers: int = 0
+
+
+# Every mode changes one setting of the baseline, so each row isolates one decision
+BASELINE = {
+    "headless": True,
+    "remote_url": None,
+    "driver_pool": {"enabled": False},
+    "driver_prewarm": {"size": 0},
+    "provisioning": {"mode": "api"},
+    "account_pool": {"enabled": False},
+    "login": {"mode": "cookie"},
+    "request_blocking": {"enabled": True},
+    "har": {"mode": "off"},
+}
+MODES = (
+    Mode("baseline", "fresh driver, API provisioning, cookie login, blocking on, serial", {}),
+    Mode("pooled", "drivers reused across tests", {"driver_pool": {"enabled": True}}),
+    Mode("ui_provisioning", "accounts registered through the signup form", {"provisioning": {"mode": "ui"}}),
+    Mode("ui_login", "login form instead of injected session cookies", {"login": {"mode": "ui"}}),
+    Mode("no_blocking", "request blocking off", {"request_blocking": {"enabled": False}}),
+    Mode("xdist", "pytest-xdist workers (--workers)", {}, workers=-1),
+)
+
+
+def run_mode(mode: Mode, test_paths: list[str], run_dir: Path, workers: int) -> dict:
+    """
+    Runs the flow tests once in a pytest subprocess against a fresh stand-in site and returns
+    wall time, WebDriver commands (from the command profiler) and HTML page loads.
+    """
+    run_dir.mkdir(parents=True, exist_ok=True)
+    with StandInServer() as server:
+        overrides = _merge(BASELINE, mode.overrides)
+        overrides.update({
+            "base_url": server.url,
+            "stand_in": {"enabled": False},  # this process serves it, so page loads can be counted
+            "profiler": {"enabled": True, "dir": str(run_dir / "profiles")},
+        })
+        overrides_path = run_dir / "config.yaml"
+        overrides_path.write_text(yaml.safe_dump(overrides), encoding="utf-8")
+
+        command = [sys.executable, "-m", "pytest", *test_paths, "-p", "no:cacheprovider",
+                   f"--junitxml={run_dir / 'junit.xml'}", f"--alluredir={run_dir / 'allure-results'}"]
+        if mode.workers:
+            command += ["-n", str(workers if mode.workers < 0 else mode.workers), "--dist", "load"]
+        started = time.perf_counter()
+        with open(run_dir / "pytest.log", "w", encoding="utf-8") as log:
+            subprocess.run(command, cwd=ROOT_DIR, stdout=log, stderr=subprocess.STDOUT,
+                           env={**os.environ, "TEST_CONFIG_OVERRIDES": str(overrides_path)})
+        wall = time.perf_counter() - started
+        page_loads = sum(server.page_loads().values())
+
+    passed, total = _outcomes(run_dir / "junit.xml")
+    if passed < total:
+        logger.warning("%s: %s of %s tests failed, see %s", mode.name, total - passed, total, run_dir / "pytest.log")
+    return {
+        "wall_seconds": round(wall, 2),
+        "commands": sum(profile["commands"] for profile in _profiles(run_dir / "profiles")),
+        "page_loads": page_loads,
+        "passed": passed,
+        "tests": total,
+    }
+
+
+def run_scenarios(modes: tuple[Mode, ...], test_paths: list[str], repeat: int, workers: int, out_dir: Path) -> dict:
+    """Runs every mode `repeat` times; each figure is the median over the repeats."""
+    results = {}
+    for mode in modes:
+        runs = [run_mode(mode, test_paths, out_dir / f"{mode.name}-{number}", workers)
+                for number in range(1, repeat + 1)]
+        results[mode.name] = {
+            "description": mode.description,
+            **{key: statistics.median(run[key] for run in runs) for key in ("wall_seconds", "commands", "page_loads")},
+            "passed": min(run["passed"] for run in runs),
+            "tests": runs[0]["tests"],
+            "runs": runs,
+        }
+        logger.info("%s: %ss, %s commands, %s page loads", mode.name, results[mode.name]["wall_seconds"],
+                    results[mode.name]["commands"], results[mode.name]["page_loads"])
+    return results
+
+
+def format_table(results: Dict[str, dict]) -> str:
+    """One row per mode; wall time also relative to the first mode (the baseline)."""
+    reference = next(iter(results.values()))["wall_seconds"]
+    lines = [f"{'mode':<17}{'wall s':>9}{'vs first':>10}{'commands':>10}{'page loads':>12}{'passed':>9}  description"]
+    for name, result in results.items():
+        change = result["wall_seconds"] / reference - 1 if reference else 0.0
+        lines.append(f"{name:<17}{result['wall_seconds']:>9.1f}{change:>+10.0%}{result['commands']:>10g}"
+                     f"{result['page_loads']:>12g}{result['passed']:>5}/{result['tests']:<3}  {result['description']}")
+    return "\n".join(lines)
+
+
+def _merge(base: dict, override: dict) -> dict:
+    merged = {key: dict(value) if isinstance(value, dict) else value for key, value in base.items()}
+    for key, value in override.items():
+        merged[key] = {**merged.get(key, {}), **value} if isinstance(value, dict) else value
+    return merged
+
+
+def _outcomes(junit_path: Path) -> tuple[int, int]:
+    """(passed, total) from a JUnit XML report; (0, 0) when pytest did not get that far."""
+    try:
+        suite = ElementTree.parse(junit_path).getroot().find("testsuite")
+    except (OSError, ElementTree.ParseError):
+        return 0, 0
+    total = int(suite.get("tests", 0)) - int(suite.get("skipped", 0))
+    return total - int(suite.get("failures", 0)) - int(suite.get("errors", 0)), total
+
+
+def _profiles(profile_dir: Path) -> list[dict]:
+    return [json.loads(path.read_text(encoding="utf-8")) for path in sorted(profile_dir.glob("*.json"))]
+
+
+# ---------- CLI ----------
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scenarios",
+                                     description="Time the main flows against the stand-in site in each execution mode")
+    parser.add_argument("--modes", help=f"comma-separated, default all: {','.join(mode.name for mode in MODES)}")
+    parser.add_argument("--flows", help=f"comma-separated, default all: {','.join(FLOWS)}")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per mode; the table shows medians")
+    parser.add_argument("--workers", type=int, default=2, help="xdist workers for the 'xdist' mode")
+    parser.add_argument("--out", type=Path, help="results file (defaults to reports/benchmarks/scenarios-<time>.json)")
+    args = parser.parse_args(argv)
+
+    modes = _select(parser, "modes", args.modes, [mode.name for mode in MODES])
+    flows = _select(parser, "flows", args.flows, list(FLOWS))
+    stamp = f"{datetime.now():%Y%m%d-%H%M%S}"
+    out = args.out or RESULTS_DIR / f"scenarios-{stamp}.json"
+
+    results = run_scenarios(tuple(mode for mode in MODES if mode.name in modes), [FLOWS[flow] for flow in flows],
+                            args.repeat, args.workers, RESULTS_DIR / f"scenarios-{stamp}")
+    atomic_write_json(out, {
+        "created": stamp,
+        "machine": machine_metadata(),
+        "settings": {"flows": flows, "repeat": args.repeat, "workers": args.workers, "baseline": BASELINE},
+        "results": results,
+    })
+    print(format_table(results))
+    print(f"Results written to {out}")
+    return 0 if all(result["passed"] == result["tests"] > 0 for result in results.values()) else 1
+
+
+def _select(parser: argparse.ArgumentParser, option: str, value: Optional[str], choices: list[str]) -> list[str]:
+    if not value:
+        return choices
+    selected = value.split(",")
+    unknown = set(selected) - set(choices)
+    if unknown:
+        parser.error(f"unknown {option}: {', '.join(sorted(unknown))}")
+    return [choice for choice in choices if choice in selected]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,8 @@ class AddToCartComponent:
     Modal displayed after adding product to cart
     """
 
+    __slots__ = ("base",)
+
     MODAL_CONTAINER = (By.CSS_SELECTOR, ".modal-content")
     BTN_CONTINUE_SHOPPING = (By.XPATH, "//button[normalize-space()='Continue Shopping']")
     BTN_VIEW_CART = (By.XPATH, "//u[normalize-space()='View Cart']")
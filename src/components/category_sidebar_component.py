@@ -10,6 +10,8 @@ class CategorySidebarComponent:
     Left sidebar component for Categories and Brands navigation.
     """
 
+    __slots__ = ("base",)
+
     SIDEBAR_CONTAINER = (By.ID, "accordian")
     LBL_CATEGORY_TITLE = (By.CSS_SELECTOR, ".features_items .title")
     BRANDS_CONTAINER = (By.CLASS_NAME, "brands_products")
@@ -45,20 +47,20 @@ class CategorySidebarComponent:
 
     def expand_category(self, category_name: str) -> None:
         """Expands a main category like 'Women' or 'Men'."""
-        logger.info(f"Expanding category: {category_name}")
+        logger.info("Expanding category: %s", category_name)
         locator = self._get_category_locator(category_name)
         self.base.scroll_into_view(locator)
         self.base.click(locator)
 
     def click_sub_category(self, sub_category_name: str) -> None:
         """Clicks on a sub-category link."""
-        logger.info(f"Clicking sub-category: {sub_category_name}")
+        logger.info("Clicking sub-category: %s", sub_category_name)
         locator = self._get_sub_category_locator(sub_category_name)
         self.base.click(locator)
 
     def click_brand(self, brand_name: str) -> None:
         """Clicks on the brand link."""
-        logger.info(f"Clicking brand: {brand_name}")
+        logger.info("Clicking brand: %s", brand_name)
         locator = self._get_brand_locator(brand_name)
         self.base.scroll_into_view(locator)
         self.base.click(locator)
@@ -10,6 +10,8 @@ class FooterComponent:
     Reusable Footer component shared across multiple pages.
     """
 
+    __slots__ = ("base",)
+
     # ---------- Locators ----------
     LBL_SUBSCRIPTION = (By.XPATH, "//h2[normalize-space()='Subscription']")
     INPUT_EMAIL = (By.ID, "susbscribe_email")
@@ -48,7 +50,7 @@ class FooterComponent:
         """
         Performs the subscription flow: enters email and clicks the arrow button.
         """
-        logger.info(f"Subscribing to newsletter with email {email}")
+        logger.info("Subscribing to newsletter with email %s", email)
         self.base.send_keys(self.INPUT_EMAIL, email, clear_first=True)
         self.base.click(self.BTN_SUBSCRIBE)
 
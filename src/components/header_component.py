@@ -11,6 +11,8 @@ class HeaderComponent:
     Handles navigation by returning Page Objects via the Navigator.
     """
 
+    __slots__ = ("base",)
+
     HDR_MAIN = (By.CSS_SELECTOR, ".header-middle")
     BTN_SIGNUP_LOGIN = (By.CSS_SELECTOR, "a[href='/login']")
     BTN_LOGOUT = (By.CSS_SELECTOR, "a[href='/logout']")
@@ -33,12 +35,13 @@ class HeaderComponent:
         logger.info("Checking header visibility")
         return self.base.is_displayed(self.HDR_MAIN)
 
-    def is_logged_user_visible(self) -> bool:
+    def is_logged_user_visible(self, timeout=None) -> bool:
         """
         Verify that the Logged-in user label is displayed.
+        Pass timeout=0 for an immediate check once the page has rendered.
         """
         logger.info("Checking logged user label visibility")
-        return self.base.is_displayed(self.LBL_LOGGED_USER)
+        return self.base.is_displayed(self.LBL_LOGGED_USER, timeout)
 
     # ---------- Actions (Returning Page Objects) ----------
 
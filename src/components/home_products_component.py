@@ -10,6 +10,8 @@ class HomeProductsComponent:
     Reusable Product component representing the product lists and recommended carousel.
     """
 
+    __slots__ = ("base",)
+
     LBL_RECOMMENDED_TITLE = (By.XPATH, "//h2[normalize-space()='recommended items']")
     PRODUCT_CARDS = (By.CLASS_NAME, "product-image-wrapper")
     RECOMMENDED_ITEMS_SECTION = (By.CSS_SELECTOR, ".recommended_items")
@@ -21,18 +23,30 @@ class HomeProductsComponent:
 
     def _get_product_container(self, name: str):
         # Locator for the whole product card to hover
+        product_id = self.base.product_id(name)
+        if product_id is not None:
+            return By.CSS_SELECTOR, f".features_items .productinfo a[data-product-id='{product_id}']"
         return By.XPATH, f"//div[@class='single-products'][.//p[normalize-space()='{name}']]"
 
     def _get_view_product_btn(self, name: str):
         # Locator for 'View Product' link based on name
-        return f"//div[@class='product-image-wrapper'][.//p[normalize-space()='{name}']]//a[contains(text(),'View Product')]"
+        product_id = self.base.product_id(name)
+        if product_id is not None:
+            return By.CSS_SELECTOR, f".features_items a[href='/product_details/{product_id}']"
+        return By.XPATH, f"//div[@class='product-image-wrapper'][.//p[normalize-space()='{name}']]//a[contains(text(),'View Product')]"
 
     def _get_add_to_cart_overlay_btn(self, name: str):
         # Locator for 'Add to cart' inside the hover overlay
-        return f"//div[@class='overlay-content'][.//p[normalize-space()='{name}']]//a[contains(@class,'add-to-cart')]"
+        product_id = self.base.product_id(name)
+        if product_id is not None:
+            return By.CSS_SELECTOR, f".features_items .overlay-content a[data-product-id='{product_id}']"
+        return By.XPATH, f"//div[@class='overlay-content'][.//p[normalize-space()='{name}']]//a[contains(@class,'add-to-cart')]"
 
     def _get_recommended_add_btn(self, name: str):
         # Locator for 'Add to cart' in the Recommended Carousel section
+        product_id = self.base.product_id(name)
+        if product_id is not None:
+            return By.CSS_SELECTOR, f"#recommended-item-carousel a[data-product-id='{product_id}']"
         return By.XPATH, f"//div[@id='recommended-item-carousel']//p[text()='{name}']/following-sibling::a"
 
     # ---------- Visibility ----------
@@ -48,7 +62,7 @@ class HomeProductsComponent:
         """
         Clicks on 'View Product' and returns ProductDetailsPage instance.
         """
-        logger.info(f"Navigating to details for product: {name}")
+        logger.info("Navigating to details for product: %s", name)
         locator = self._get_view_product_btn(name)
         self.base.scroll_into_view(locator)
         self.base.click(locator)
@@ -57,7 +71,7 @@ class HomeProductsComponent:
         """
         Standard product add: Scrolled -> Hover -> Click 'Add to cart' in overlay.
         """
-        logger.info(f"Adding standard product to cart: {name}")
+        logger.info("Adding standard product to cart: %s", name)
         container = self._get_product_container(name)
         add_btn = self._get_add_to_cart_overlay_btn(name)
 
@@ -69,7 +83,7 @@ class HomeProductsComponent:
         """
         Adds item from the Recommended carousel section.
         """
-        logger.info(f"Adding recommended product to cart: {name}")
+        logger.info("Adding recommended product to cart: %s", name)
         locator = self._get_recommended_add_btn(name)
         self.scroll_to_recommended_item()
         self.base.click(locator)
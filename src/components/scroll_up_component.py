@@ -10,6 +10,8 @@ class ScrollUpComponent:
     Component for the scroll-to-top arrow button.
     """
 
+    __slots__ = ("base",)
+
     BTN_SCROLL_UP = (By.ID, "scrollUp")
 
     def __init__(self, base_page):
@@ -12,6 +12,8 @@ class AccountCreatedPage(BasePage):
     URL: https://automationpractice.com/account_created
     """
 
+    __slots__ = ()
+
     LBL_ACCOUNT_CREATED = (By.XPATH, "//b[normalize-space()='Account Created!']")
     BTN_CONTINUE = (By.XPATH, "//a[normalize-space()='Continue']")
 
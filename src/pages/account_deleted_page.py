@@ -12,6 +12,8 @@ class AccountDeletedPage(BasePage):
     URL: https://automationpractice.com/delete_account
     """
 
+    __slots__ = ()
+
     LBL_ACCOUNT_DELETED = (By.XPATH, "//b[normalize-space()='Account Deleted!']")
     BTN_CONTINUE = (By.XPATH, "//a[@data-qa='continue-button']")
 
@@ -1,11 +1,12 @@
 import time
 from pathlib import Path
-from typing import Tuple, Optional, Any
+from typing import Tuple, Type, Optional, Any, Callable
 
 import allure
 from selenium.common import NoSuchElementException
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
+    JavascriptException,
     StaleElementReferenceException,
     TimeoutException,
     WebDriverException,
@@ -24,41 +25,123 @@ from components.footer_component import FooterComponent
 from components.header_component import HeaderComponent
 from components.home_products_component import HomeProductsComponent
 from components.scroll_up_component import ScrollUpComponent
+from utilities.dom_scripts import ATTRIBUTES_JS, OBSERVER_JS, TEXTS_JS, to_dom_locator
+from utilities.driver_context import get_context, mark_navigation
 from utilities.logger import get_logger
+from utilities.product_catalog import ProductCatalog
 
 Locator = Tuple[str, str]  # (By.CSS_SELECTOR, "selector") or (By.XPATH, "//...")
 
 logger = get_logger(__name__)
 
 
+class WaitStats:
+    """
+    Records how long every BasePage wait actually took for one driver.
+    The driver fixture reports and resets it after each test.
+    """
+
+    __slots__ = ("records",)
+
+    def __init__(self) -> None:
+        self.records: list[dict] = []
+
+    @classmethod
+    def for_driver(cls, driver: WebDriver) -> "WaitStats":
+        return get_context(driver).setdefault("wait_stats", cls())
+
+    def record(self, kind: str, locator: Optional[Locator], timeout: float, elapsed: float, timed_out: bool) -> None:
+        self.records.append({
+            "kind": kind,
+            "locator": list(locator) if locator else None,
+            "timeout": timeout,
+            "elapsed": round(elapsed, 4),
+            "timed_out": timed_out,
+        })
+
+    def summary(self, slowest: int = 5) -> dict:
+        timed_out = [r for r in self.records if r["timed_out"]]
+        return {
+            "waits": len(self.records),
+            "total_seconds": round(sum(r["elapsed"] for r in self.records), 3),
+            "timeouts": len(timed_out),
+            "timeout_seconds": round(sum(r["elapsed"] for r in timed_out), 3),
+            "slowest": sorted(self.records, key=lambda r: r["elapsed"], reverse=True)[:slowest],
+        }
+
+    def reset(self) -> None:
+        self.records.clear()
+
+
+class LazyComponent:
+    """
+    Descriptor that creates a component on first access and caches it on the page instance.
+    A component is always bound to the page it is accessed through (`component.base is page`);
+    it is never shared between pages. Pages themselves are reused per driver by the Navigator,
+    so their components are too.
+    """
+
+    __slots__ = ("component_cls", "name")
+
+    def __init__(self, component_cls: type) -> None:
+        self.component_cls = component_cls
+        self.name = component_cls.__name__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, page: Optional["BasePage"], owner: type) -> Any:
+        if page is None:
+            return self
+        component = page._components.get(self.name)
+        if component is None:
+            component = page._components[self.name] = self.component_cls(page)
+        return component
+
+
 class BasePage:
     """
     Base class for all Page Objects.
     Provides common interaction methods and centralized navigation
     """
 
+    __slots__ = ("driver", "timeout", "_components")
+
+    # ---------- Components (created lazily on first access) ----------
+
+    header = LazyComponent(HeaderComponent)
+    footer = LazyComponent(FooterComponent)
+    products = LazyComponent(HomeProductsComponent)
+    add_to_cart_modal = LazyComponent(AddToCartComponent)
+    category_sidebar = LazyComponent(CategorySidebarComponent)
+    scroll_up = LazyComponent(ScrollUpComponent)
+
     # ---------- Constants ----------
 
+    # All timing lives here: drivers run with implicit wait 0, so waits never compound.
     DEFAULT_TIMEOUT: int = 10
     POLL_FREQUENCY: float = 0.25
 
+    # "observer" resolves waits inside the page (MutationObserver); "polling" uses WebDriverWait.
+    # The observer falls back to polling for locators or errors it cannot handle.
+    WAIT_BACKEND: str = "observer"
+    OBSERVER_CHUNK: float = 10
+    OBSERVABLE_KINDS = frozenset({"present", "visible", "clickable", "invisible"})
+
+    # Deep links: canonical path relative to base_url and the element proving the page rendered.
+    # Pages without a URL_PATH can only be reached by clicking through.
+    URL_PATH: Optional[str] = None
+    READY_LOCATOR: Optional[Locator] = None
+
     # ---------- Initialization ----------
 
-    def __init__(self, driver: WebDriver, timeout: Optional[int] = None) -> None:
+    def __init__(self, driver: WebDriver, timeout: Optional[float] = None) -> None:
         """
-        Initializes the Page Object with WebDriver and common components.
+        Initializes the Page Object with WebDriver. Components are attached lazily.
         """
         self.driver = driver
-        self.timeout = timeout or self.DEFAULT_TIMEOUT
-        self._navigate = None
-
-        # Components initialization
-        self.header = HeaderComponent(self)
-        self.footer = FooterComponent(self)
-        self.products = HomeProductsComponent(self)
-        self.add_to_cart_modal = AddToCartComponent(self)
-        self.category_sidebar = CategorySidebarComponent(self)
-        self.scroll_up = ScrollUpComponent(self)
+        self.timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        self._components: dict[str, Any] = {}
 
         logger.debug("BasePage initialized with timeout=%s", self.timeout)
 
@@ -67,65 +150,138 @@ class BasePage:
         """
         Lazy-loaded property to access the Application Controller (Navigator).
         Allows jumping between pages without circular imports.
+        The Navigator is a per-driver singleton, so page objects it hands out are reused.
         """
         from pages.navigator import Navigator
-        if self._navigate is None:
-            self._navigate = Navigator(self.driver)
-        return self._navigate
+        return Navigator.for_driver(self.driver)
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for the page's READY_LOCATOR to be visible (no-op for pages without one).
+        """
+        if self.READY_LOCATOR is not None:
+            self.find_visible(self.READY_LOCATOR, timeout)
+
+    def product_id(self, name: str) -> Optional[int]:
+        """
+        Resolves a product name to its id through the session product catalog.
+        Returns None when no catalog is attached or the product is unknown.
+        """
+        catalog = ProductCatalog.for_driver(self.driver)
+        return catalog.product_id(name) if catalog else None
 
     # ---------- Wait Helpers ----------
 
-    def _wait_for(self, condition, timeout: Optional[int] = None) -> Any:
+    def _wait_for(self, condition: Callable[[WebDriver], Any], timeout: Optional[float] = None,
+                  kind: str = "wait", locator: Optional[Locator] = None,
+                  ignored_exceptions: Tuple[Type[Exception], ...] = ()) -> Any:
         """
-        Internal helper for WebDriverWait.
+        Single entry point for every wait. A timeout of 0 checks the condition once
+        without sleeping (fast-fail path); the time spent is recorded in WaitStats against
+        the requested timeout. Exceptions in `ignored_exceptions` count as "not yet".
         """
-        _timeout = timeout or self.timeout
-        return WebDriverWait(self.driver, _timeout, self.POLL_FREQUENCY).until(condition)
+        _timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            if _timeout <= 0:
+                return self._check_once(condition, ignored_exceptions)
+            remaining = _timeout
+            if self.WAIT_BACKEND == "observer" and kind in self.OBSERVABLE_KINDS:
+                result = self._observe(kind, locator, condition, start + _timeout)
+                if result is not None:
+                    return result
+                remaining = max(0.0, start + _timeout - time.perf_counter())
+            return WebDriverWait(self.driver, remaining, self.POLL_FREQUENCY,
+                                 ignored_exceptions=ignored_exceptions).until(condition)
+        except TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            WaitStats.for_driver(self.driver).record(kind, locator, _timeout, elapsed, timed_out)
+
+    def _observe(self, kind: str, locator: Optional[Locator], condition: Callable[[WebDriver], Any],
+                 deadline: float) -> Any:
+        """
+        Observer backend: pushes the condition into the page and resolves the moment
+        the DOM satisfies it. Returns None to hand the remaining time to the polling backend.
+        """
+        dom_locator = to_dom_locator(locator) if locator else None
+        if dom_locator is None:
+            return None
+        strategy, value = dom_locator
+
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutException(f"Timed out waiting for {kind} {locator or ''}".strip())
+            wait_ms = int(min(remaining, self.OBSERVER_CHUNK) * 1000)
+            try:
+                result = self.driver.execute_async_script(OBSERVER_JS, strategy, value, kind, wait_ms)
+            except JavascriptException as e:
+                if "unloaded" in (e.msg or ""):
+                    # The page navigated mid-wait; observe the new document
+                    continue
+                logger.debug("Observer script failed (%s), falling back to polling", e.msg)
+                return None
+            except WebDriverException as e:
+                logger.debug("Observer backend unavailable (%s), falling back to polling", e.msg)
+                return None
+
+            if result:
+                return result
+
+    def _check_once(self, condition: Callable[[WebDriver], Any],
+                    ignored_exceptions: Tuple[Type[Exception], ...] = ()) -> Any:
+        try:
+            result = condition(self.driver)
+        except (NoSuchElementException, StaleElementReferenceException, *ignored_exceptions):
+            result = None
+        if not result:
+            raise TimeoutException("Condition not met on immediate check")
+        return result
 
     # ---------- Find Elements ----------
 
-    def find(self, locator: Locator, timeout: Optional[int] = None) -> WebElement:
+    def find(self, locator: Locator, timeout: Optional[float] = None) -> WebElement:
         """
         Finds an element present in the DOM.
         """
         by, value = locator
-        return self._wait_for(EC.presence_of_element_located((by, value)), timeout)
+        return self._wait_for(EC.presence_of_element_located((by, value)), timeout, "present", locator)
 
-    def find_visible(self, locator: Locator, timeout: Optional[int] = None) -> WebElement:
+    def find_visible(self, locator: Locator, timeout: Optional[float] = None) -> WebElement:
         """
         Finds an element that is both present and visible.
         """
         by, value = locator
-        return self._wait_for(EC.visibility_of_element_located((by, value)), timeout)
+        return self._wait_for(EC.visibility_of_element_located((by, value)), timeout, "visible", locator)
 
-    def find_all(self, locator: Locator, timeout: Optional[int] = None) -> list[WebElement]:
+    def find_all(self, locator: Locator, timeout: Optional[float] = None) -> list[WebElement]:
         """
-        Returns a list of all elements matching the locator.
+        Returns a list of all elements matching the locator, or [] when none appear within the timeout.
+        Transient WebDriver errors (e.g. a stale document mid-navigation) are retried until then.
         """
         by, value = locator
-        _timeout = timeout or self.timeout
-        end = time.time() + _timeout
-        while time.time() < end:
-            try:
-                elems = self.driver.find_elements(by, value)
-                if elems:
-                    return elems
-            except WebDriverException:
-                pass
-            time.sleep(self.POLL_FREQUENCY)
-        return []
+        try:
+            return self._wait_for(lambda d: d.find_elements(by, value), timeout, "find_all", locator,
+                                  ignored_exceptions=(WebDriverException,))
+        except TimeoutException:
+            return []
 
     # ---------- Interaction Actions ----------
 
-    def click(self, locator: Locator, timeout: Optional[int] = None) -> None:
+    def click(self, locator: Locator, timeout: Optional[float] = None) -> None:
         """
         Waits for element to be clickable then clicks it.
         """
-        elem = self._wait_for(EC.element_to_be_clickable(locator), timeout)
+        elem = self._wait_for(EC.element_to_be_clickable(locator), timeout, "clickable", locator)
         logger.info("Clicking element %s", locator)
         elem.click()
+        mark_navigation(self.driver)
 
-    def safe_click(self, locator: Locator, retries: int = 2, timeout: Optional[int] = None) -> bool:
+    def safe_click(self, locator: Locator, retries: int = 2, timeout: Optional[float] = None) -> bool:
         """
         Attempts to click with retries for stale or intercepted elements.
         """
@@ -142,7 +298,7 @@ class BasePage:
                 return False
         return False
 
-    def send_keys(self, locator: Locator, text: str, clear_first: bool = True, timeout: Optional[int] = None) -> None:
+    def send_keys(self, locator: Locator, text: str, clear_first: bool = True, timeout: Optional[float] = None) -> None:
         """
         Sends text to an input field.
         """
@@ -154,21 +310,55 @@ class BasePage:
 
     # ---------- Getters & State ----------
 
-    def get_text(self, locator: Locator, timeout: Optional[int] = None) -> str:
+    def get_text(self, locator: Locator, timeout: Optional[float] = None) -> str:
         """
         Retrieves and trims text from an element.
         """
         elem = self.find_visible(locator, timeout)
         return (elem.text or "").strip()
 
-    def get_attribute(self, locator: Locator, attribute: str, timeout: Optional[int] = None) -> Optional[str]:
+    def get_attribute(self, locator: Locator, attribute: str, timeout: Optional[float] = None) -> Optional[str]:
         """
         Retrieves a specific attribute from an element.
         """
         elem = self.find(locator, timeout)
         return elem.get_attribute(attribute)
 
-    def is_displayed(self, locator: Locator, timeout: Optional[int] = None) -> bool:
+    def get_texts(self, locator: Locator, timeout: Optional[float] = None) -> list[str]:
+        """
+        Retrieves the trimmed, non-empty text of every matching element in a single script execution
+        (instead of one WebDriver command per element). Waits for the first match like find_all.
+        """
+        texts = self._collect(locator, TEXTS_JS, timeout)
+        if texts is None:
+            texts = [(elem.text or "").strip() for elem in self.find_all(locator, timeout)]
+        return [text for text in texts if text]
+
+    def get_attributes(self, locator: Locator, names: list[str], timeout: Optional[float] = None) -> list[dict]:
+        """
+        Retrieves the given raw attributes of every matching element in a single script execution.
+        Returns one {name: value} dict per element.
+        """
+        values = self._collect(locator, ATTRIBUTES_JS, timeout, list(names))
+        if values is None:
+            values = [{name: elem.get_attribute(name) for name in names} for elem in self.find_all(locator, timeout)]
+        return values
+
+    def _collect(self, locator: Locator, script: str, timeout: Optional[float], *args: Any) -> Optional[list]:
+        """
+        Runs a bulk extraction script. Reads immediately (one round trip when the elements are
+        already rendered) and only waits for a first match when nothing is found.
+        Returns None when the locator strategy cannot be evaluated in the page.
+        """
+        dom_locator = to_dom_locator(locator)
+        if dom_locator is None:
+            return None
+        result = self.driver.execute_script(script, *dom_locator, *args)
+        if not result and self.find_all(locator, timeout):
+            result = self.driver.execute_script(script, *dom_locator, *args)
+        return result or []
+
+    def is_displayed(self, locator: Locator, timeout: Optional[float] = None) -> bool:
         """
         Checks if an element is currently visible.
         """
@@ -178,7 +368,7 @@ class BasePage:
         except TimeoutException:
             return False
 
-    def is_present(self, locator: Locator, timeout: Optional[int] = None) -> bool:
+    def is_present(self, locator: Locator, timeout: Optional[float] = None) -> bool:
         """
         Checks if an element exists in the DOM.
         """
@@ -188,7 +378,20 @@ class BasePage:
         except TimeoutException:
             return False
 
-    def is_selected(self, locator: Locator, timeout: Optional[int] = None) -> bool:
+    def is_absent(self, locator: Locator, timeout: Optional[float] = 0) -> bool:
+        """
+        Checks that no element matches the locator.
+        Fast-fail path for expected-absent elements: a single check by default,
+        optionally waiting up to `timeout` for the element to go away.
+        """
+        by, value = locator
+        try:
+            self._wait_for(lambda d: not d.find_elements(by, value), timeout, "absent", locator)
+            return True
+        except TimeoutException:
+            return False
+
+    def is_selected(self, locator: Locator, timeout: Optional[float] = None) -> bool:
         """
         Checks if a checkbox or radio button is selected.
         """
@@ -198,28 +401,28 @@ class BasePage:
         except (TimeoutException, NoSuchElementException):
             return False
 
-    def wait_until_not_present(self, locator: Locator, timeout: Optional[int] = None) -> None:
+    def wait_until_not_present(self, locator: Locator, timeout: Optional[float] = None) -> None:
         """
         Waits for an element to disappear from the DOM.
         """
-        self._wait_for(EC.invisibility_of_element_located(locator), timeout)
+        self._wait_for(EC.invisibility_of_element_located(locator), timeout, "invisible", locator)
 
-    def wait_until_present(self, locator: Locator, timeout: Optional[int] = None) -> None:
+    def wait_until_present(self, locator: Locator, timeout: Optional[float] = None) -> None:
         """
         Waits for an element to appear from the DOM.
         """
-        self._wait_for(EC.visibility_of_element_located(locator), timeout)
+        self._wait_for(EC.visibility_of_element_located(locator), timeout, "visible", locator)
 
     # ---------- JavaScript & Actions ----------
 
-    def scroll_into_view(self, locator: Locator, timeout: Optional[int] = None) -> None:
+    def scroll_into_view(self, locator: Locator, timeout: Optional[float] = None) -> None:
         """
         Scrolls the element into the center of the viewport using JS.
         """
         elem = self.find(locator, timeout)
         self.driver.execute_script("arguments[0].scrollIntoView({block:'center', inline:'center'});", elem)
 
-    def hover(self, locator: Locator, timeout: Optional[int] = None) -> None:
+    def hover(self, locator: Locator, timeout: Optional[float] = None) -> None:
         """
         Hover the mouse over an element.
         """
@@ -228,7 +431,7 @@ class BasePage:
 
     # ---------- Dropdowns & Files ----------
 
-    def select_dropdown_by_value(self, locator: Locator, value: str, timeout: Optional[int] = None) -> None:
+    def select_dropdown_by_value(self, locator: Locator, value: str, timeout: Optional[float] = None) -> None:
         """
         Selects an option from a standard <select> dropdown by value.
         """
@@ -244,23 +447,24 @@ class BasePage:
 
     # ---------- Alerts ----------
 
-    def wait_for_alert(self, timeout: Optional[int] = None) -> Alert:
+    def wait_for_alert(self, timeout: Optional[float] = None) -> Alert:
         """
         Waits for a browser alert to be present.
         """
-        return self._wait_for(EC.alert_is_present(), timeout)
+        return self._wait_for(EC.alert_is_present(), timeout, "alert")
 
-    def accept_alert(self, timeout: Optional[int] = None) -> None:
+    def accept_alert(self, timeout: Optional[float] = None) -> None:
         """
         Accepts the current browser alert.
         """
-        self.wait_for_alert().accept()
+        self.wait_for_alert(timeout).accept()
+        mark_navigation(self.driver)
 
-    def dismiss_alert(self, timeout: Optional[int] = None) -> None:
+    def dismiss_alert(self, timeout: Optional[float] = None) -> None:
         """
         Dismisses the current browser alert.
         """
-        self.wait_for_alert().dismiss()
+        self.wait_for_alert(timeout).dismiss()
 
     # ---------- Screenshots & Allure ----------
 
@@ -283,7 +487,7 @@ class BasePage:
 
     # ---------- Context Switching ----------
 
-    def switch_to_frame(self, locator: Locator, timeout: Optional[int] = None) -> None:
+    def switch_to_frame(self, locator: Locator, timeout: Optional[float] = None) -> None:
         """
         Switches context to an iframe.
         """
@@ -1,43 +1,60 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
 
 from pages.base_page import BasePage
+from utilities.dom_scripts import CART_SNAPSHOT_JS
+from utilities.driver_context import navigation_epoch
 from utilities.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class CartRow:
+    """
+    One product row of the cart table.
+    """
+    name: str
+    product_id: int
+    price: int
+    quantity: int
+    total: int
+
+    @property
+    def is_total_correct(self) -> bool:
+        return self.total == self.price * self.quantity
+
+
 class CartPage(BasePage):
     """
     Page Object for AutomationExercise Cart Page
     URL: https://automationpractice.com/view_cart
     """
 
-    ROW_CART_ITEMS = (By.CSS_SELECTOR, "td.cart_product")
+    __slots__ = ("_snapshot", "_snapshot_epoch")
+
     LBL_CART_TITLE = (By.XPATH, "//li[@class='active' and normalize-space()='Shopping Cart']")
     TABLE_CART = (By.ID, "cart_info_table")
     BTN_CHECKOUT = (By.XPATH, "//a[normalize-space()='Proceed To Checkout']")
     BTN_REGISTER_LOGIN = (By.XPATH, "//u[normalize-space()='Register / Login']")
 
-    def PRICE_BY_INDEX(self, i: int):
-        return By.XPATH, f"(//td[@class='cart_price'])[{i}]"
-
-    def QUANTITY_BY_INDEX(self, i: int):
-        return By.XPATH, f"(//td[@class='cart_quantity']/button)[{i}]"
+    URL_PATH = "/view_cart"
+    READY_LOCATOR = LBL_CART_TITLE
 
-    def TOTAL_BY_INDEX(self, i: int):
-        return By.XPATH, f"(//td[@class='cart_total'])[{i}]"
+    def __init__(self, driver: WebDriver, timeout: Optional[float] = None) -> None:
+        super().__init__(driver, timeout)
+        self._snapshot: Optional[list[CartRow]] = None
+        self._snapshot_epoch = -1
 
     def _parse_price(self, text: str) -> int:
         return int(text.replace("Rs.", "").strip())
 
     # ---------- Dynamic Locators ----------
 
-    def _quantity_of_item(self, name: str):
-        return (
-            By.XPATH,
-            f"//h4/a[contains(text(),'{name}')]/ancestor::td[@class='cart_description']/following-sibling::td[@class='cart_quantity']/button"
-        )
-
     def _btn_remove_by_item(self, name: str):
         return (
             By.XPATH,
@@ -50,17 +67,44 @@ class CartPage(BasePage):
             f"//h4/a[normalize-space()='{name}']/ancestor::tr"
         )
 
-    def _cart_item_names(self):
-        return (
-            By.CSS_SELECTOR,
-            "td.cart_description h4 a"
+    # ---------- Snapshot ----------
+
+    def snapshot(self, refresh: bool = False) -> list[CartRow]:
+        """
+        Reads the whole cart table into CartRow objects in a single round trip.
+        The result is cached until the next click/navigation on this driver, remove_item() or refresh=True.
+        """
+        epoch = navigation_epoch(self.driver)
+        if self._snapshot is None or refresh or epoch != self._snapshot_epoch:
+            raw_rows = self.driver.execute_script(CART_SNAPSHOT_JS)
+            if raw_rows is None:
+                try:
+                    self.find(self.TABLE_CART)
+                    raw_rows = self.driver.execute_script(CART_SNAPSHOT_JS) or []
+                except TimeoutException:
+                    logger.warning("Cart table not found, treating cart as empty")
+                    raw_rows = []
+            self._snapshot = [self._to_row(raw) for raw in raw_rows]
+            self._snapshot_epoch = epoch
+            logger.debug("Cart snapshot: %s", self._snapshot)
+        return self._snapshot
+
+    def invalidate_snapshot(self) -> None:
+        self._snapshot = None
+
+    def _to_row(self, raw: dict) -> CartRow:
+        return CartRow(
+            name=raw["name"],
+            product_id=int(raw["product_id"]),
+            price=self._parse_price(raw["price"]),
+            quantity=int(raw["quantity"]),
+            total=self._parse_price(raw["total"]),
         )
 
-    def _item_in_cart(self, name: str):
-        return (
-            By.XPATH,
-            f"//tr//td[@class='cart_description']//a[contains(.,'{name}')]"
-        )
+    def _find_row(self, name: str) -> Optional[CartRow]:
+        rows = self.snapshot()
+        exact = next((row for row in rows if row.name == name), None)
+        return exact or next((row for row in rows if name in row.name), None)
 
     # ---------- Getters ----------
 
@@ -68,42 +112,42 @@ class CartPage(BasePage):
         """
         Get number of products in cart
         """
-        logger.info(f"Getting number of cart items")
-        return len(self.find_all(self.ROW_CART_ITEMS))
+        logger.info("Getting number of cart items")
+        return len(self.snapshot())
 
     def get_quantity_of_item(self, name: str) -> str:
         """
         Get number of products in cart
         """
-        logger.info(f"Getting number of product {name}")
-        return self.get_text(self._quantity_of_item(name))
+        logger.info("Getting number of product %s", name)
+        row = self._find_row(name)
+        if row is None:
+            raise ValueError(f"Product '{name}' is not in the cart")
+        return str(row.quantity)
 
     def get_cart_product_names(self) -> list[str]:
         """
         Get all product names in cart
         """
         logger.info("Getting all product names in cart")
-        elems = self.find_all(self._cart_item_names())
-        return [elem.text.strip() for elem in elems if elem.text.strip()]
+        return [row.name for row in self.snapshot() if row.name]
 
     # ---------- Verifications ----------
 
     def verify_product_price_quantity_total(self, index: int) -> bool:
         """
-        Verify price, quantity and total price for a product row
+        Verify price, quantity and total price for a product row (1-based index)
         """
-        price = self._parse_price(self.get_text(self.PRICE_BY_INDEX(index)))
-        total = self._parse_price(self.get_text(self.TOTAL_BY_INDEX(index)))
-        quantity = int(self.get_text(self.QUANTITY_BY_INDEX(index)))
-        return total == quantity * price
+        rows = self.snapshot()
+        if not 1 <= index <= len(rows):
+            raise ValueError(f"Cart has {len(rows)} product rows, there is no row {index}")
+        return rows[index - 1].is_total_correct
 
     def are_all_cart_items_price_quantity_correct(self) -> bool:
         """
-        Verify price == quantity * total for all cart items\
+        Verify price == quantity * total for all cart items
         """
-        return all(self.verify_product_price_quantity_total(i)
-                   for i in range(1, self.get_cart_item_count() + 1)
-                   )
+        return all(row.is_total_correct for row in self.snapshot())
 
     def are_products_in_cart(self, expected_products: list[str]) -> bool:
         """
@@ -138,14 +182,14 @@ class CartPage(BasePage):
         Verify if item is removed
         """
         logger.info("Verifying if item is removed")
-        return not self.is_present(self._cart_row_by_item(name))
+        return all(row.name != name for row in self.snapshot())
 
     def is_item_visible(self, name: str) -> bool:
         """
         Verify if item is visible
         """
         logger.info("Verifying if item is visible")
-        return self.is_displayed(self._item_in_cart(name))
+        return self._find_row(name) is not None
 
     # ---------- Actions ----------
 
@@ -172,3 +216,4 @@ class CartPage(BasePage):
         logger.info("Click remove item")
         self.click(self._btn_remove_by_item(name))
         self.wait_until_not_present(self._cart_row_by_item(name))
+        self.invalidate_snapshot()
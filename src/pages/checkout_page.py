@@ -12,6 +12,8 @@ class CheckoutPage(BasePage):
     Handles address verification and order review before payment.
     """
 
+    __slots__ = ()
+
     # ---------- Address Locators ----------
     LBL_DELIVERY_ADDRESS = (By.XPATH, "//h2[text()='Address Details']")
     DELIVERY_ADDRESS_LIST = (By.CSS_SELECTOR, "#address_delivery li")
@@ -44,22 +46,20 @@ class CheckoutPage(BasePage):
         Expected: [Title, Name, Company, Address1, Address2, City, State, Zip, Country, Phone]
         """
         logger.info("Extracting delivery address details")
-        elements = self.find_all(self.DELIVERY_ADDRESS_LIST)
-        return [el.text.strip() for el in elements if el.text.strip()][1:]
+        return self.get_texts(self.DELIVERY_ADDRESS_LIST)[1:]
 
     def get_billing_address_details(self) -> list[str]:
         """
         Returns a list of strings containing billing address lines.
         """
         logger.info("Extracting billing address details")
-        elements = self.find_all(self.BILLING_ADDRESS_LIST)
-        return [el.text.strip() for el in elements if el.text.strip()][1:]
+        return self.get_texts(self.BILLING_ADDRESS_LIST)[1:]
 
     # ---------- Actions ----------
 
     def enter_description(self, message: str) -> None:
         """Enter comments in the text area."""
-        logger.info(f"Adding order comment: {message}")
+        logger.info("Adding order comment: %s", message)
         self.send_keys(self.INPUT_DESCRIPTION, message, clear_first=True)
 
     def place_order(self):
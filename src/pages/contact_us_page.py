@@ -13,6 +13,8 @@ class ContactUsPage(BasePage):
     URL: https://automationexercise.com/contact_us
     """
 
+    __slots__ = ()
+
     # ---------- Locators ----------
     LBL_GET_IN_TOUCH = (By.XPATH, "//h2[normalize-space()='Get In Touch']")
     INPUT_NAME = (By.CSS_SELECTOR, "input[placeholder='Name']")
@@ -24,6 +26,9 @@ class ContactUsPage(BasePage):
     MSG_SUCCESS_SUBMITTED = (By.XPATH, "//div[@class='status alert alert-success']")
     BTN_HOME = (By.CSS_SELECTOR, ".btn.btn-success")
 
+    URL_PATH = "/contact_us"
+    READY_LOCATOR = LBL_GET_IN_TOUCH
+
     # ---------- Verifications ----------
 
     def get_get_in_touch_message(self) -> str:
@@ -52,7 +57,7 @@ class ContactUsPage(BasePage):
 
     def upload_attachment(self, file_path: Union[str, Path]) -> None:
         """Uploads a file by sending the absolute path to the file input."""
-        logger.info(f"Uploading file: {file_path}")
+        logger.info("Uploading file: %s", file_path)
         self.upload_file(self.BTN_UPLOAD_FILE, str(file_path))
 
     def click_submit(self) -> None:
@@ -66,7 +71,7 @@ class ContactUsPage(BasePage):
         """
         High-levl method to fill all text fields in the contact form.
         """
-        logger.info(f"Filling contact form for: {name}")
+        logger.info("Filling contact form for: %s", name)
         self.enter_name(name)
         self.enter_email(email)
         self.enter_subject(subject)
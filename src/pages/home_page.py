@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 
+from components.header_component import HeaderComponent
 from pages.base_page import BasePage
 from utilities.logger import get_logger
 
@@ -11,10 +12,18 @@ class HomePage(BasePage):
     Page Object for AutomationExercise Home Page
     """
 
+    __slots__ = ()
+
     LBL_SLIDER_ACTIVE_TEXT = (By.XPATH, "//div[@class='item active']//h2")
 
+    URL_PATH = "/"
+    READY_LOCATOR = HeaderComponent.HDR_MAIN
+
     # ---------- Locators ----------
     def _get_view_product_btn(self, product_name: str):
+        product_id = self.product_id(product_name)
+        if product_id is not None:
+            return By.CSS_SELECTOR, f".features_items a[href='/product_details/{product_id}']"
         return By.XPATH, f"//div[@class='features_items']//p[text()='{product_name}']/ancestor::div[@class='product-image-wrapper']//a[text()='View Product']"
 
     # ---------- Verifications ----------
@@ -31,7 +40,7 @@ class HomePage(BasePage):
         """
         Clicks on 'View Product' for a specific product on the Home Page.
         """
-        logger.info(f"Viewing product details for {product_name} from Home Page")
+        logger.info("Viewing product details for %s from Home Page", product_name)
         locator = self._get_view_product_btn(product_name)
         self.scroll_into_view(locator)
         self.click(locator)
@@ -12,6 +12,8 @@ class LoginPage(BasePage):
     URL: https://automationpractice.com/login
     """
 
+    __slots__ = ()
+
     # ---------- Signup Locators ----------
     LBL_NEW_USER_SIGNUP = (By.CSS_SELECTOR, "div[class='signup-form'] h2")
     INPUT_SIGNUP_NAME = (By.CSS_SELECTOR, "input[placeholder='Name']")
@@ -26,6 +28,9 @@ class LoginPage(BasePage):
     BTN_LOGIN = (By.CSS_SELECTOR, "button[data-qa='login-button']")
     MSG_LOGIN_ERROR = (By.XPATH, "//p[normalize-space()='Your email or password is incorrect!']")
 
+    URL_PATH = "/login"
+    READY_LOCATOR = INPUT_LOGIN_EMAIL
+
     # ---------- Signup Getters ----------
 
     def get_new_user_signup_message(self) -> str:
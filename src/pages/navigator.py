@@ -1,7 +1,12 @@
+from typing import Optional, Type, TypeVar
+from urllib.parse import quote
+
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from pages.account_created_page import AccountCreatedPage
 from pages.account_deleted_page import AccountDeletedPage
+from pages.base_page import BasePage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
 from pages.contact_us_page import ContactUsPage
@@ -13,6 +18,12 @@ from pages.product_details_page import ProductDetailsPage
 from pages.products_page import ProductsPage
 from pages.signup_page import SignUpPage
 from pages.test_cases_page import TestCasesPage
+from utilities.driver_context import get_context, mark_navigation, navigation_epoch
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+PageT = TypeVar("PageT", bound=BasePage)
 
 
 # Import all Page Objects here
@@ -23,69 +34,161 @@ class Navigator:
     """
     Centralized place to initialize and access all Page Objects
     Acts as an Application Controller to manage the flow of the entire system.
+
+    One Navigator exists per driver (see for_driver). It caches the page objects it hands out,
+    so element and snapshot caches on a page survive while the browser stays on the same page state.
+    The cache is dropped when the navigation counter moved and driver.current_url changed.
     """
 
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: WebDriver, base_url: Optional[str] = None):
         self.driver = driver
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self._pages: dict[type, BasePage] = {}
+        self._epoch = navigation_epoch(driver)
+        self._url: Optional[str] = None
+
+    @classmethod
+    def for_driver(cls, driver: WebDriver, base_url: Optional[str] = None) -> "Navigator":
+        """
+        Returns the Navigator shared by every page object of this driver.
+        base_url (used by goto) is remembered on the shared instance.
+        """
+        context = get_context(driver)
+        navigator = context.get("navigator")
+        if navigator is None:
+            navigator = context["navigator"] = cls(driver, base_url)
+        elif base_url:
+            navigator.base_url = base_url.rstrip("/")
+        return navigator
 
     def open_site(self, url: str) -> HomePage:
         """
         Opens the browser with the given URL and returns the HomePage.
         This is the entry point of the test application.
         """
+        if self.base_url is None:
+            self.base_url = url.rstrip("/")
         self.driver.get(url)
+        mark_navigation(self.driver)
         return self.home_page
 
+    # ---------- Deep Links ----------
+
+    def goto(self, page_cls: Type[PageT], path: Optional[str] = None) -> PageT:
+        """
+        Loads the canonical URL of page_cls (or the given path) directly and waits for
+        the page's readiness probe. Skips the home page load and header click-through;
+        tests that verify navigation itself keep using the header components.
+        """
+        path = path or page_cls.URL_PATH
+        if path is None:
+            raise ValueError(f"{page_cls.__name__} has no URL_PATH and cannot be opened directly")
+        if self.base_url is None:
+            raise ValueError("Navigator has no base_url; pass it to for_driver() or call open_site() first")
+
+        url = f"{self.base_url}{path}"
+        logger.info("Opening %s directly: %s", page_cls.__name__, url)
+        self.driver.get(url)
+        mark_navigation(self.driver)
+        page = self._page(page_cls)
+        page.wait_until_ready()
+        return page
+
+    def goto_category_products(self, category_id: int) -> ProductsPage:
+        """
+        Opens the product listing of a sidebar category, e.g. 1 for 'Women > Dress'.
+        """
+        return self.goto(ProductsPage, ProductsPage.CATEGORY_PATH.format(category_id=category_id))
+
+    def goto_brand_products(self, brand: str) -> ProductsPage:
+        """
+        Opens the product listing of a brand, e.g. 'Polo'.
+        """
+        return self.goto(ProductsPage, ProductsPage.BRAND_PATH.format(brand=quote(brand)))
+
+    # ---------- Page Cache ----------
+
+    def _page(self, page_cls: Type[PageT]) -> PageT:
+        self._sync()
+        page = self._pages.get(page_cls)
+        if page is None:
+            page = self._pages[page_cls] = page_cls(self.driver)
+        return page
+
+    def _sync(self) -> None:
+        """
+        Drops cached pages when a navigation happened since the last lookup and the URL changed.
+        current_url is only read after the counter moved, so repeated lookups cost no round trip.
+        """
+        epoch = navigation_epoch(self.driver)
+        if epoch == self._epoch:
+            return
+        self._epoch = epoch
+        try:
+            url = self.driver.current_url
+        except WebDriverException:
+            url = None
+        if url != self._url or url is None:
+            logger.debug("Page transition detected (%s -> %s), dropping %s cached pages", self._url, url, len(self._pages))
+            self._pages.clear()
+            self._url = url
+
+    def invalidate(self) -> None:
+        """
+        Forgets every cached page object, e.g. after an action that re-renders the same URL.
+        """
+        self._pages.clear()
+
     # ---------- Page Object Properties ----------
 
     @property
     def login_page(self) -> LoginPage:
-        return LoginPage(self.driver)
+        return self._page(LoginPage)
 
     @property
     def signup_page(self) -> SignUpPage:
-        return SignUpPage(self.driver)
+        return self._page(SignUpPage)
 
     @property
     def home_page(self) -> HomePage:
-        return HomePage(self.driver)
+        return self._page(HomePage)
 
     @property
     def cart_page(self) -> CartPage:
-        return CartPage(self.driver)
+        return self._page(CartPage)
 
     @property
     def products_page(self) -> ProductsPage:
-        return ProductsPage(self.driver)
+        return self._page(ProductsPage)
 
     @property
     def product_details_page(self) -> ProductDetailsPage:
-        return ProductDetailsPage(self.driver)
+        return self._page(ProductDetailsPage)
 
     @property
     def contact_us_page(self) -> ContactUsPage:
-        return ContactUsPage(self.driver)
+        return self._page(ContactUsPage)
 
     @property
     def checkout_page(self) -> CheckoutPage:
-        return CheckoutPage(self.driver)
+        return self._page(CheckoutPage)
 
     @property
     def payment_page(self) -> PaymentPage:
-        return PaymentPage(self.driver)
+        return self._page(PaymentPage)
 
     @property
     def order_placed_page(self) -> OrderPlacedPage:
-        return OrderPlacedPage(self.driver)
+        return self._page(OrderPlacedPage)
 
     @property
     def account_created_page(self) -> AccountCreatedPage:
-        return AccountCreatedPage(self.driver)
+        return self._page(AccountCreatedPage)
 
     @property
     def account_deleted_page(self) -> AccountDeletedPage:
-        return AccountDeletedPage(self.driver)
+        return self._page(AccountDeletedPage)
 
     @property
     def test_cases_page(self) -> TestCasesPage:
-        return TestCasesPage(self.driver)
+        return self._page(TestCasesPage)
@@ -12,6 +12,8 @@ class OrderPlacedPage(BasePage):
     URL: https://automationpractice.com/payment_done/0
     """
 
+    __slots__ = ()
+
     LBL_ORDER_PLACED = (By.XPATH, "//b[normalize-space()='Order Placed!']")
     BTN_CONTINUE = (By.XPATH, "//a[normalize-space()='Continue']")
     BTN_DOWNLOAD_INVOICE = (By.XPATH, "//a[normalize-space()='Download Invoice']")
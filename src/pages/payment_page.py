@@ -12,6 +12,8 @@ class PaymentPage(BasePage):
     URL: https://automationpractice.com/payment
     """
 
+    __slots__ = ()
+
     # ---------- Inputs ----------
     INPUT_NAME_ON_CARD = (By.XPATH, "//input[@name='name_on_card']")
     INPUT_CARD_NUMBER = (By.XPATH, "//input[@name='card_number']")
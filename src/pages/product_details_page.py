@@ -12,6 +12,8 @@ class ProductDetailsPage(BasePage):
     Handles detailed product information and review submission.
     """
 
+    __slots__ = ()
+
     # ---------- Locators ----------
     PRODUCT_INFO_CONTAINER = (By.CLASS_NAME, "product-information")
     LBL_PRODUCT_NAME = (By.CSS_SELECTOR, ".product-information h2")
@@ -64,7 +66,7 @@ class ProductDetailsPage(BasePage):
 
     def set_quantity(self, quantity: str) -> None:
         """Enters the desired quantity into the input field."""
-        logger.info(f"Setting product quantity to: {quantity}")
+        logger.info("Setting product quantity to: %s", quantity)
         self.send_keys(self.INPUT_QUANTITY, quantity, clear_first=True)
 
     def click_add_to_cart(self) -> None:
@@ -79,7 +81,7 @@ class ProductDetailsPage(BasePage):
         """
         Fills out and submits the product review form.
         """
-        logger.info(f"Submitting review for user: {email}")
+        logger.info("Submitting review for user: %s", email)
         self.send_keys(self.INPUT_REVIEW_NAME, name)
         self.send_keys(self.INPUT_REVIEW_EMAIL, email)
         self.send_keys(self.INPUT_REVIEW_CONTENT, content)
@@ -13,6 +13,8 @@ class ProductsPage(BasePage):
     URL: https://automationpractice.com/products
     """
 
+    __slots__ = ()
+
     # ---------- Static Locators ----------
     LBL_ALL_PRODUCTS_TITLE = (By.XPATH, "//h2[normalize-space()='All Products']")
     LST_PRODUCT_ITEMS = (By.XPATH, "//div[@class='single-products']")
@@ -20,6 +22,12 @@ class ProductsPage(BasePage):
     BTN_SEARCH = (By.XPATH, "//button[@id='submit_search']")
     LBL_SEARCHED_PRODUCTS = (By.XPATH, "//h2[normalize-space()='Searched Products']")
     LBL_PRODUCT_NAMES = (By.CSS_SELECTOR, ".productinfo p")
+    LBL_LISTING_TITLE = (By.CSS_SELECTOR, ".features_items h2.title")
+
+    URL_PATH = "/products"
+    READY_LOCATOR = LBL_LISTING_TITLE
+    CATEGORY_PATH = "/category_products/{category_id}"
+    BRAND_PATH = "/brand_products/{brand}"
 
     # ---------- Visibility Checks ----------
 
@@ -33,6 +41,10 @@ class ProductsPage(BasePage):
         logger.info("Verifying Products list visibility")
         return self.is_displayed(self.LST_PRODUCT_ITEMS)
 
+    def get_listing_title(self) -> str:
+        """Returns the grid title, e.g. 'Women - Dress Products' or 'Brand - Polo Products'."""
+        return self.get_text(self.LBL_LISTING_TITLE)
+
     def is_searched_products_visible(self) -> bool:
         """Verifies if the 'Searched Products' header is displayed after a search."""
         logger.info("Verifying Searched Products section visibility")
@@ -42,14 +54,23 @@ class ProductsPage(BasePage):
 
     def _get_btn_view_product(self, item_name: str):
         """Generates locator for 'View Product' button based on product name."""
+        product_id = self.product_id(item_name)
+        if product_id is not None:
+            return By.CSS_SELECTOR, f".features_items a[href='/product_details/{product_id}']"
         return By.XPATH, f"//div[contains(@class,'product-image-wrapper')][.//p[normalize-space()='{item_name}']]//a[normalize-space()='View Product']"
 
     def _get_product_container(self, item_name: str):
-        """Generates locator for the main product container box."""
+        """Generates locator for the main product container box (hover target)."""
+        product_id = self.product_id(item_name)
+        if product_id is not None:
+            return By.CSS_SELECTOR, f".features_items .productinfo a[data-product-id='{product_id}']"
         return By.XPATH, f"//p[contains(.,'{item_name}')]/parent::div[contains(@class ,'productinfo')]"
 
     def _get_btn_add_to_cart(self, item_name: str):
         """Generates locator for 'Add to Cart' button (usually in the hover overlay)."""
+        product_id = self.product_id(item_name)
+        if product_id is not None:
+            return By.CSS_SELECTOR, f".features_items .overlay-content a[data-product-id='{product_id}']"
         return By.XPATH, f"//p[normalize-space()='{item_name}']/parent::div[@class='overlay-content']//a[contains(@class,'add-to-cart')]"
 
     # ---------- Search Actions ----------
@@ -59,21 +80,20 @@ class ProductsPage(BasePage):
         Performs a product search.
         :param product_name: The string to search for.
         """
-        logger.info(f"Searching for product: {product_name}")
+        logger.info("Searching for product: %s", product_name)
         self.send_keys(self.INPUT_SEARCH, product_name, clear_first=True)
         self.click(self.BTN_SEARCH)
 
     def get_displayed_product_names(self) -> list[str]:
         """Returns a list of all product names currently visible on the page."""
         logger.info("Retrieves all visible product names")
-        elements = self.find_all(self.LBL_PRODUCT_NAMES)
-        return [el.text.strip() for el in elements if el.text.strip()]
+        return self.get_texts(self.LBL_PRODUCT_NAMES)
 
     def are_all_products_related_to_search(self, keyword: str) -> bool:
         """
         Validates that all displayed products contain search keyword.
         """
-        logger.info(f"Validating search results for keyword: {keyword}")
+        logger.info("Validating search results for keyword: %s", keyword)
         names = self.get_displayed_product_names()
         if not names:
             logger.warning("No products found to validate.")
@@ -86,7 +106,7 @@ class ProductsPage(BasePage):
         """
         Navigates to the details page of a specific product.
         """
-        logger.info(f"Navigating to details of: {item_name}")
+        logger.info("Navigating to details of: %s", item_name)
         locator = self._get_btn_view_product(item_name)
         self.scroll_into_view(locator)
         self.click(locator)
@@ -96,7 +116,7 @@ class ProductsPage(BasePage):
         """
         Hovers over a product and clicks 'Add to Cart'.
         """
-        logger.info(f"Adding '{item_name}' to cart")
+        logger.info("Adding '%s' to cart", item_name)
         product_box = self._get_product_container(item_name)
         add_btn = self._get_btn_add_to_cart(item_name)
 
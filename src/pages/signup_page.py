@@ -12,6 +12,8 @@ class SignUpPage(BasePage):
     Handles the detailed registration form.
     """
 
+    __slots__ = ()
+
     # ---------- Locators ----------
     LBL_ENTER_ACCOUNT_INFORMATION = (By.XPATH, "//b[normalize-space()='Enter Account Information']")
 
@@ -61,7 +63,7 @@ class SignUpPage(BasePage):
         """
         Selects the gender based on the provided string (Mr/Mrs).
         """
-        logger.info(f"Selecting title: {title}")
+        logger.info("Selecting title: %s", title)
         if title.lower() == "mr":
             self.click(self.RAD_TITLE_MR)
         elif title.lower() in ["mrs", "ms"]:
@@ -73,7 +75,7 @@ class SignUpPage(BasePage):
         """
         Enters the user's name.
         """
-        logger.info(f"Entering name: {name}")
+        logger.info("Entering name: %s", name)
         self.send_keys(self.INPUT_NAME, name)
 
     def enter_password(self, password: str) -> None:
@@ -87,7 +89,7 @@ class SignUpPage(BasePage):
         """
         Selects the full date of birth from dropdowns.
         """
-        logger.info(f"Selecting DOB: {day}/{month}/{year}")
+        logger.info("Selecting DOB: %s/%s/%s", day, month, year)
         self.select_dropdown_by_value(self.DDL_DAY, day)
         self.select_dropdown_by_value(self.DDL_MONTH, month)
         self.select_dropdown_by_value(self.DDL_YEAR, year)
@@ -112,7 +114,7 @@ class SignUpPage(BasePage):
         """
         Selects the country from the dropdown.
         """
-        logger.info(f"Selecting country: {country}")
+        logger.info("Selecting country: %s", country)
         self.select_dropdown_by_value(self.DDL_COUNTRY, country)
 
     def fill_address_details(self, personal_info: dict, address_info: dict, contact_info: dict) -> None:
@@ -12,8 +12,13 @@ class TestCasesPage(BasePage):
     URL: https://automationpractice.com/test_cases
     """
 
+    __slots__ = ()
+
     LBL_TEST_CASES_TITLE = (By.XPATH, "//b[normalize-space()='Test Cases']")
 
+    URL_PATH = "/test_cases"
+    READY_LOCATOR = LBL_TEST_CASES_TITLE
+
     # ---------- Verifications ----------
 
     def is_test_cases_page_visible(self):
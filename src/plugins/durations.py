@@ -0,0 +1,172 @@
+import heapq
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set
+
+import pytest
+
+from utilities.file_utils import read_json
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DurationStore:
+    """
+    Per-test durations (setup + call + teardown, in seconds) from previous runs,
+    kept in the pytest cache (.pytest_cache/v/durations/v1).
+
+    Measurements are smoothed with the previous value, so one slow run does not
+    reorder the whole suite. Tests whose file no longer exists are dropped on update.
+    With '--durations-file' the estimates come from that JSON file only (e.g. merged by
+    'plugins.sharding merge'), so every CI node plans from the same numbers.
+    """
+
+    CACHE_KEY = "durations/v1"
+    SMOOTHING = 0.5  # weight of the latest measurement
+    DEFAULT_SECONDS = 1.0  # estimate for unknown tests when nothing is known at all
+
+    def __init__(self, config: pytest.Config) -> None:
+        self.cache = getattr(config, "cache", None)  # None with -p no:cacheprovider
+        self.rootpath = config.rootpath
+        durations_file = config.getoption("durations_file", None)
+        if durations_file:
+            self.durations: Dict[str, float] = dict(read_json(durations_file, default={}))
+        else:
+            self.durations = dict(self.cache.get(self.CACHE_KEY, {}) if self.cache else {})
+
+    def estimate(self, nodeids: Iterable[str]) -> Dict[str, float]:
+        """
+        Expected duration per test. A test without history gets the mean of the known tests
+        of its module, else the median of all known tests, so new tests neither jump the
+        queue nor get stuck at the end of it.
+        """
+        known = self.durations
+        by_module: Dict[str, list[float]] = defaultdict(list)
+        for nodeid, seconds in known.items():
+            by_module[_module(nodeid)].append(seconds)
+        fallback = statistics.median(known.values()) if known else self.DEFAULT_SECONDS
+
+        estimates = {}
+        for nodeid in nodeids:
+            if nodeid in known:
+                estimates[nodeid] = known[nodeid]
+            elif by_module.get(_module(nodeid)):
+                estimates[nodeid] = statistics.fmean(by_module[_module(nodeid)])
+            else:
+                estimates[nodeid] = fallback
+        return estimates
+
+    def unknown(self, nodeids: Iterable[str]) -> list[str]:
+        return [nodeid for nodeid in nodeids if nodeid not in self.durations]
+
+    def update(self, measured: Dict[str, float]) -> None:
+        """Merges this run's measurements and writes the store back to the cache."""
+        self.durations = {
+            nodeid: seconds for nodeid, seconds in self.merge(self.durations, measured).items()
+            if (self.rootpath / _module(nodeid)).exists()
+        }
+        if self.cache:
+            self.cache.set(self.CACHE_KEY, self.durations)
+        logger.debug("Saved durations of %s tests", len(self.durations))
+
+    @classmethod
+    def merge(cls, previous: Dict[str, float], measured: Dict[str, float]) -> Dict[str, float]:
+        """Smooths new measurements into previous durations; returns a new, sorted mapping."""
+        merged = dict(previous)
+        for nodeid, seconds in measured.items():
+            before = merged.get(nodeid)
+            merged[nodeid] = seconds if before is None else cls.SMOOTHING * seconds + (1 - cls.SMOOTHING) * before
+        return {nodeid: round(seconds, 3) for nodeid, seconds in sorted(merged.items())}
+
+
+def longest_first_makespan(durations: Iterable[float], workers: int) -> float:
+    """
+    Makespan of longest-processing-time-first list scheduling: each test, longest first,
+    goes to the worker that becomes free first.
+    """
+    loads = [0.0] * max(1, workers)
+    for seconds in sorted(durations, reverse=True):
+        heapq.heapreplace(loads, loads[0] + seconds)
+    return max(loads)
+
+
+class DurationPlugin:
+    """
+    Records the durations of passed tests for the DurationStore and schedules xdist runs longest test first
+    (LongestFirstScheduling, for the default '--dist load'). Registered in the xdist controller
+    only when '-n' starts workers; disable with '-p no:duration_scheduling'.
+
+    The terminal summary compares the expected makespan of the plan with the actual one,
+    the busy time of the busiest worker.
+    """
+
+    NAME = "duration_scheduling"
+
+    def __init__(self, config: pytest.Config) -> None:
+        self.store = DurationStore(config)
+        self.measured: Dict[str, float] = {}
+        self.attempts: Dict[str, float] = defaultdict(float)  # setup + call + teardown of the running attempt
+        self.unsuccessful: Set[str] = set()  # running attempts with a failed or skipped phase
+        self.worker_busy: Dict[str, float] = defaultdict(float)
+        self.expected: Optional[float] = None
+        self.workers = 1
+        self.unknown_tests = 0
+        self.started = time.monotonic()
+
+    def plan(self, nodeids: list[str], workers: int) -> Dict[str, float]:
+        """Estimates for the collected tests; remembers the expected makespan for the summary."""
+        estimates = self.store.estimate(nodeids)
+        self.workers = workers
+        self.unknown_tests = len(self.store.unknown(nodeids))
+        self.expected = longest_first_makespan(estimates.values(), workers)
+        return estimates
+
+    # ---------- Hooks ----------
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if config.getoption("dist") != "load":
+            return None
+        from plugins.xdist_scheduling import LongestFirstScheduling
+        return LongestFirstScheduling(config, log, self)
+
+    def pytest_runtest_logreport(self, report):
+        node = getattr(report, "node", None)  # set on reports coming from xdist workers
+        worker = node.gateway.id if node else "main"
+        self.worker_busy[worker] += report.duration
+
+        # Only a passed attempt is a duration estimate: failures may have waited out timeouts, and a
+        # pytest-rerunfailures rerun report ends the attempt (no teardown report follows it)
+        if report.outcome == "rerun":
+            self.attempts.pop(report.nodeid, None)
+            self.unsuccessful.discard(report.nodeid)
+            return
+        self.attempts[report.nodeid] += report.duration
+        if report.outcome != "passed":
+            self.unsuccessful.add(report.nodeid)
+        if report.when == "teardown":
+            seconds = self.attempts.pop(report.nodeid)
+            if report.nodeid in self.unsuccessful:
+                self.unsuccessful.discard(report.nodeid)
+            else:
+                self.measured[report.nodeid] = seconds
+
+    def pytest_sessionfinish(self, session):
+        if self.measured:
+            self.store.update(self.measured)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.expected is None or not self.worker_busy:
+            return
+        busiest, actual = max(self.worker_busy.items(), key=lambda item: item[1])
+        terminalreporter.write_line(
+            f"Duration scheduling: expected makespan {self.expected:.1f}s on {self.workers} worker(s) "
+            f"({self.unknown_tests} tests without history), actual {actual:.1f}s ({busiest} busiest), "
+            f"wall {time.monotonic() - self.started:.1f}s"
+        )
+
+
+def _module(nodeid: str) -> str:
+    return nodeid.split("::", 1)[0]
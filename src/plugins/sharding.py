@@ -0,0 +1,213 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+from plugins.durations import DurationStore
+from utilities.file_utils import atomic_write_json, read_json
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parses '--shard=i/n' (1-based) into (i, n)."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/n, got {value!r}") from None
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard index must be between 1 and {count}, got {index}")
+    return index, count
+
+
+def assign_shards(estimates: Dict[str, float], count: int, slack: float = 0.1) -> Dict[str, int]:
+    """
+    Partitions tests into `count` shards (0-based) balanced by expected duration.
+
+    Each test ranks the shards by a hash of (shard, test id) and goes to its best ranked
+    shard that stays within the average load plus `slack`; when all are full, the least
+    loaded one. Tests are placed longest first. The result only depends on the test ids and
+    their estimates, and adding a test moves few others, so per-shard caches stay warm.
+    """
+    capacity = sum(estimates.values()) / count * (1 + slack)
+    loads = [0.0] * count
+    assignment = {}
+    for nodeid in sorted(estimates, key=lambda test: (-estimates[test], test)):
+        seconds = estimates[nodeid]
+        ranking = sorted(range(count), key=lambda shard: _weight(shard, nodeid), reverse=True)
+        shard = next((shard for shard in ranking if loads[shard] + seconds <= capacity),
+                     min(range(count), key=loads.__getitem__))
+        assignment[nodeid] = shard
+        loads[shard] += seconds
+    return assignment
+
+
+def partition_fingerprint(assignment: Dict[str, int]) -> str:
+    """Identifies a partition; every shard of one run must report the same fingerprint."""
+    return hashlib.sha1(json.dumps(sorted(assignment.items())).encode()).hexdigest()
+
+
+def _weight(shard: int, nodeid: str) -> int:
+    return int.from_bytes(hashlib.sha1(f"{shard}:{nodeid}".encode()).digest()[:8], "big")
+
+
+class ShardPlugin:
+    """
+    Runs one shard of the suite ('--shard=i/n'): keeps the collected tests assigned to shard i
+    and deselects the rest. Registered in every process, since xdist workers collect on their own.
+
+    The controller (or the only process) writes a shard manifest at the end of the run: the
+    partition fingerprint, expected and actual seconds, every test's outcome and duration, and
+    where the Allure results are. 'python -m plugins.sharding merge' combines the manifests.
+    """
+
+    NAME = "sharding"
+    DEFAULT_MANIFEST = "reports/shard-{index}-of-{count}.json"
+
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.index, self.count = config.getoption("shard")
+        if not config.getoption("durations_file") and not hasattr(config, "workerinput"):
+            logger.warning("--shard without --durations-file: shards on machines with different "
+                           ".pytest_cache contents may plan different partitions")
+        self.plan: Optional[dict] = None
+        self.results: Dict[str, dict] = {}
+        self.rerun_seconds = 0.0  # attempts that pytest-rerunfailures repeated
+
+    @pytest.hookimpl(trylast=True)  # after -k/-m deselection
+    def pytest_collection_modifyitems(self, config, items):
+        estimates = DurationStore(config).estimate(item.nodeid for item in items)
+        assignment = assign_shards(estimates, self.count)
+        selected = [item for item in items if assignment[item.nodeid] == self.index - 1]
+        deselected = [item for item in items if assignment[item.nodeid] != self.index - 1]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+        self.plan = {
+            "partition": partition_fingerprint(assignment),
+            "collected": len(assignment),
+            "expected_seconds": round(sum(estimates[item.nodeid] for item in selected), 1),
+        }
+        logger.info("Shard %s/%s: %s of %s tests, expected %ss", self.index, self.count,
+                    len(selected), len(assignment), self.plan["expected_seconds"])
+        if hasattr(config, "workeroutput"):
+            config.workeroutput["shard_plan"] = self.plan
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        if self.plan is None:
+            self.plan = getattr(node, "workeroutput", {}).get("shard_plan")
+
+    def pytest_runtest_logreport(self, report):
+        result = self.results.setdefault(report.nodeid, {"outcome": "passed", "duration": 0.0})
+        if report.outcome == "rerun":
+            # pytest-rerunfailures starts the test over: a test's duration is its final attempt
+            self.rerun_seconds += result["duration"] + report.duration
+            self.results[report.nodeid] = {"outcome": "passed", "duration": 0.0}
+            return
+        result["duration"] = round(result["duration"] + report.duration, 3)
+        if report.when == "call" or report.outcome != "passed":
+            result["outcome"] = "error" if report.failed and report.when != "call" else report.outcome
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or self.plan is None:
+            return
+        manifest_path = Path(self.config.getoption("shard_manifest") or
+                             self.DEFAULT_MANIFEST.format(index=self.index, count=self.count))
+        if not manifest_path.is_absolute():
+            manifest_path = self.config.rootpath / manifest_path
+        alluredir = self.config.getoption("allure_report_dir", None)
+
+        atomic_write_json(manifest_path, {
+            "shard": self.index,
+            "of": self.count,
+            **self.plan,
+            "actual_seconds": round(sum(result["duration"] for result in self.results.values())
+                                    + self.rerun_seconds, 1),
+            # Relative to the manifest, so the reports/ folder can be moved as a CI artifact
+            "allure_results": os.path.relpath(self.config.rootpath / alluredir, manifest_path.parent)
+            if alluredir else None,
+            "tests": self.results,
+        })
+        logger.info("Shard manifest written to %s", manifest_path)
+
+
+# ---------- Merge ----------
+
+def merge_shards(manifest_paths: list[Path], allure_dir: Optional[Path] = None,
+                 durations_out: Optional[Path] = None) -> dict:
+    """
+    Checks that the shard manifests form one complete run (same partition, every shard
+    present, every test run once), copies their Allure results into `allure_dir`, and merges
+    the durations of the passed tests into `durations_out` (the file for the next '--durations-file').
+    """
+    manifests = [(Path(path), read_json(path)) for path in manifest_paths]
+    problems = []
+    counts = {manifest["of"] for _, manifest in manifests}
+    partitions = {manifest["partition"] for _, manifest in manifests}
+    if len(counts) != 1 or len(partitions) != 1:
+        problems.append("shards were planned differently (pass the same --durations-file to every shard)")
+    count = max(counts)
+    missing = sorted(set(range(1, count + 1)) - {manifest["shard"] for _, manifest in manifests})
+    if missing:
+        problems.append(f"missing shards: {missing}")
+
+    tests: Dict[str, dict] = {}
+    for _, manifest in manifests:
+        duplicates = tests.keys() & manifest["tests"].keys()
+        if duplicates:
+            problems.append(f"shard {manifest['shard']} repeats {len(duplicates)} tests")
+        tests.update(manifest["tests"])
+    collected = max(manifest["collected"] for _, manifest in manifests)
+    if len(tests) < collected:
+        problems.append(f"{collected - len(tests)} of {collected} tests did not run")
+
+    if allure_dir:
+        allure_dir.mkdir(parents=True, exist_ok=True)
+        for path, manifest in manifests:
+            if manifest.get("allure_results"):
+                results = (path.parent / manifest["allure_results"]).resolve()
+                if results.is_dir() and results != allure_dir.resolve():
+                    shutil.copytree(results, allure_dir, dirs_exist_ok=True)
+
+    if durations_out:
+        measured = {nodeid: result["duration"] for nodeid, result in tests.items() if result["outcome"] == "passed"}
+        atomic_write_json(durations_out, DurationStore.merge(read_json(durations_out, default={}), measured))
+
+    outcomes: Dict[str, int] = {}
+    for result in tests.values():
+        outcomes[result["outcome"]] = outcomes.get(result["outcome"], 0) + 1
+    return {
+        "shards": [{key: manifest[key] for key in ("shard", "expected_seconds", "actual_seconds")}
+                   for _, manifest in sorted(manifests, key=lambda item: item[1]["shard"])],
+        "tests": len(tests),
+        "outcomes": outcomes,
+        "problems": problems,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m plugins.sharding",
+                                     description="Merge the manifests of a sharded run")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge = commands.add_parser("merge", help="validate shard manifests and merge their results")
+    merge.add_argument("manifests", nargs="+", type=Path)
+    merge.add_argument("--allure-dir", type=Path, help="copy all shards' Allure results here")
+    merge.add_argument("--durations-out", type=Path, help="merge measured durations into this JSON file")
+    args = parser.parse_args(argv)
+
+    summary = merge_shards(args.manifests, args.allure_dir, args.durations_out)
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["problems"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from xdist.scheduler import LoadScheduling
+from xdist.workermanage import WorkerController
+
+if TYPE_CHECKING:
+    from plugins.durations import DurationPlugin
+
+
+class LongestFirstScheduling(LoadScheduling):
+    """
+    Longest-processing-time-first variant of xdist's load scheduling.
+
+    Pending tests are ordered by expected duration, longest first, and handed out one at a
+    time to whichever worker asks next, so long checkout flows start early and short tests
+    fill the gaps at the end. A worker needs its next test before it can finish the current
+    one (teardown depends on it), so each worker holds at most two tests. The first two
+    rounds go out in snake order (gw0..gwN, gwN..gw0) to pair the longest tests with shorter ones.
+    """
+
+    def __init__(self, config: pytest.Config, log, durations: "DurationPlugin") -> None:
+        super().__init__(config, log)
+        self.durations = durations
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        estimates = self.durations.plan(self.collection, len(self.nodes))
+        self.pending[:] = sorted(range(len(self.collection)),
+                                 key=lambda index: estimates[self.collection[index]], reverse=True)
+        if not self.collection:
+            return
+
+        for node in self.nodes + self.nodes[::-1]:
+            self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node: WorkerController, duration: float = 0) -> None:
+        if node.shutting_down:
+            return
+
+        if self.pending:
+            node_pending = self.node2pending[node]
+            if len(node_pending) < 2:
+                self._send_tests(node, 2 - len(node_pending))
+        else:
+            node.shutdown()
+
+        self.log("num items waiting for node:", len(self.pending))
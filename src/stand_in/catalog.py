@@ -0,0 +1,92 @@
+"""
+Product, category and brand data served by the stand-in site.
+Modelled on the automationexercise.com catalog: same ids, names, prices and sidebar structure
+for the products the test suite touches, plus enough others to keep listings realistic.
+"""
+
+# category id -> (sidebar panel, sub-category)
+CATEGORIES = {
+    1: ("Women", "Dress"),
+    2: ("Women", "Tops"),
+    7: ("Women", "Saree"),
+    3: ("Men", "Tshirts"),
+    6: ("Men", "Jeans"),
+    4: ("Kids", "Dress"),
+    5: ("Kids", "Tops & Shirts"),
+}
+
+PANELS = ("Women", "Men", "Kids")
+
+BRANDS = (
+    "Polo",
+    "H&M",
+    "Madame",
+    "Mast & Harbour",
+    "Babyhug",
+    "Allen Solly Junior",
+    "Kookie Kids",
+    "Biba",
+)
+
+# (id, name, price, category id, brand)
+_PRODUCT_ROWS = (
+    (1, "Blue Top", 500, 2, "Polo"),
+    (2, "Men Tshirt", 400, 3, "H&M"),
+    (3, "Sleeveless Dress", 1000, 1, "Madame"),
+    (4, "Stylish Dress", 1500, 1, "Madame"),
+    (5, "Winter Top", 600, 2, "Mast & Harbour"),
+    (6, "Summer White Top", 400, 2, "H&M"),
+    (7, "Madame Top For Women", 1000, 2, "Madame"),
+    (8, "Fancy Green Top", 700, 2, "Polo"),
+    (11, "Sleeves Printed Top - White", 499, 2, "H&M"),
+    (12, "Half Sleeves Top Schiffli Detailing - Pink", 359, 2, "Mast & Harbour"),
+    (13, "Frozen Tops For Kids", 278, 5, "Allen Solly Junior"),
+    (14, "Full Sleeves Top Cherry - Pink", 679, 2, "Biba"),
+    (15, "Printed Off Shoulder Top - White", 315, 2, "Mast & Harbour"),
+    (16, "Sleeves Top and Short - Blue & Pink", 478, 5, "Babyhug"),
+    (18, "Little Girls Mr. Panda Shirt", 543, 5, "Allen Solly Junior"),
+    (19, "Sleeveless Unicorn Patch Gown - Pink", 1050, 4, "Kookie Kids"),
+    (20, "Cotton Mull Embroidered Dress", 1500, 1, "Biba"),
+    (21, "Blue Cotton Indie Mickey Dress", 1530, 4, "Babyhug"),
+    (22, "Long Maxi Tulle Fancy Dress Up Outfits -Pink", 1440, 4, "Kookie Kids"),
+    (23, "Colour Blocked Shirt – Sky Blue", 1000, 3, "Polo"),
+    (24, "Pure Cotton V-Neck T-Shirt", 1299, 3, "H&M"),
+    (28, "Pure Cotton Neon Green Tshirt", 850, 3, "Polo"),
+    (29, "Green Side Placket Detail T-Shirt", 1000, 3, "Polo"),
+    (30, "Premium Polo T-Shirts", 1500, 3, "Polo"),
+    (31, "Soft Stretch Jeans", 799, 6, "H&M"),
+    (33, "Regular Fit Straight Jeans", 1200, 6, "Polo"),
+    (35, "Grunt Blue Slim Fit Jeans", 1400, 6, "H&M"),
+    (37, "Rose Pink Embroidered Maxi Dress", 1600, 1, "Biba"),
+    (38, "Cotton Silk Hand Block Print Saree", 3000, 7, "Biba"),
+    (39, "Rust Red Linen Saree", 3500, 7, "Biba"),
+    (40, "Beautiful Peacock Blue Cotton Linen Saree", 5000, 7, "Biba"),
+    (41, "Lace Top For Women", 1400, 2, "Madame"),
+    (42, "GRAPHIC DESIGN MEN T SHIRT - BLUE", 1389, 3, "Mast & Harbour"),
+)
+
+PRODUCTS = {
+    product_id: {
+        "id": product_id,
+        "name": name,
+        "price": price,
+        "category_id": category_id,
+        "brand": brand,
+    }
+    for product_id, name, price, category_id, brand in _PRODUCT_ROWS
+}
+
+# Shown in the home page "recommended items" carousel
+RECOMMENDED_IDS = (1, 2, 3, 4, 5, 6)
+
+
+def category_label(product: dict) -> str:
+    """Returns the "Women > Tops" label of a product."""
+    panel, name = CATEGORIES[product["category_id"]]
+    return f"{panel} > {name}"
+
+
+def search(term: str) -> list[dict]:
+    """Case-insensitive substring search on product names, like the real site."""
+    term = term.strip().lower()
+    return [product for product in PRODUCTS.values() if term in product["name"].lower()]
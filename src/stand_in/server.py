@@ -0,0 +1,392 @@
+import email.parser
+import email.policy
+import json
+import re
+import threading
+from collections import Counter
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from stand_in import catalog, views
+from stand_in.store import Store
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+Route = Tuple[str, "re.Pattern[str]", Callable]
+
+
+class StandInServer:
+    """
+    Local, in-memory stand-in for automationexercise.com on 127.0.0.1:<random port>.
+
+    Serves the pages, forms and flows the page objects use (products, search, cart,
+    signup/login, checkout, payment, invoice download, contact upload, subscription)
+    plus the account API, with stateful accounts and carts. Nothing leaves the machine,
+    so runs are offline and deterministic.
+
+    Usage:
+        server = StandInServer().start()
+        ...  # point base_url at server.url
+        server.stop()
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.store = Store()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.store = self.store
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stand-in-server", daemon=True)
+        self._thread.start()
+        logger.info("Stand-in site listening on %s", self.url)
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        logger.info("Stand-in site stopped after %s page loads", sum(self.store.page_loads.values()))
+
+    def page_loads(self) -> Counter:
+        """HTML page loads served so far, per path."""
+        return Counter(self.store.page_loads)
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Routes requests to the page handlers below. Responses mirror the real site where
+    clients depend on them: the API always answers HTTP 200 with the outcome in the JSON
+    body, /login carries a csrf token, and sessions use a 'sessionid' cookie.
+    """
+
+    protocol_version = "HTTP/1.1"
+    SESSION_COOKIE = "sessionid"
+
+    # ---------- Routing ----------
+
+    ROUTES: list = []  # (method, path pattern, handler), assigned below the class
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        self.query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        # Always drain the body so keep-alive connections stay in sync
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+        self.session_id = self._session_cookie()
+        self.new_session = False
+        if self.store.session(self.session_id) is None:
+            self.session_id = self.store.new_session()
+            self.new_session = True
+
+        path = unquote(url.path)
+        for route_method, pattern, handler in self.ROUTES:
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                return handler(self, *match.groups())
+        self._html(views.not_found_page(self.user), status=404)
+
+    @property
+    def store(self) -> Store:
+        return self.server.store
+
+    @property
+    def user(self) -> Optional[dict]:
+        return self.store.user(self.session_id)
+
+    # ---------- Pages ----------
+
+    def home(self) -> None:
+        self._page(views.home_page(self.user))
+
+    def products(self) -> None:
+        self._page(views.products_page(self.user, self.query.get("search")))
+
+    def category_products(self, category_id: str) -> None:
+        if int(category_id) not in catalog.CATEGORIES:
+            return self._html(views.not_found_page(self.user), status=404)
+        self._page(views.category_page(self.user, int(category_id)))
+
+    def brand_products(self, brand: str) -> None:
+        if brand not in catalog.BRANDS:
+            return self._html(views.not_found_page(self.user), status=404)
+        self._page(views.brand_page(self.user, brand))
+
+    def product_details(self, product_id: str) -> None:
+        product = catalog.PRODUCTS.get(int(product_id))
+        if not product:
+            return self._html(views.not_found_page(self.user), status=404)
+        self._page(views.product_details_page(self.user, product))
+
+    def test_cases(self) -> None:
+        self._page(views.test_cases_page(self.user))
+
+    def contact_us(self) -> None:
+        self._page(views.contact_page(self.user))
+
+    def contact_us_submit(self) -> None:
+        fields = self._multipart()
+        self.store.messages.append(fields)
+        logger.debug("Contact form submitted by %s (%s bytes attached)", fields.get("email"),
+                     len(fields.get("upload_file", b"")))
+        self._page(views.contact_page(self.user, submitted=True))
+
+    def subscribe(self) -> None:
+        self.store.subscriptions.append(self._form().get("email", ""))
+        self._json({"responseCode": 200, "message": "You have been successfully subscribed!"})
+
+    def favicon(self) -> None:
+        self._send(200, b"", "image/x-icon")
+
+    # ---------- Cart ----------
+
+    def view_cart(self) -> None:
+        self._page(views.cart_page(self.user, dict(self.store.cart(self.session_id))))
+
+    def add_to_cart(self, product_id: str) -> None:
+        if int(product_id) not in catalog.PRODUCTS:
+            return self._json({"responseCode": 404, "message": "Product not found!"})
+        self.store.add_to_cart(self.session_id, int(product_id), int(self.query.get("quantity") or 1))
+        self._json({"responseCode": 200, "message": "Added!"})
+
+    def delete_cart(self, product_id: str) -> None:
+        self.store.remove_from_cart(self.session_id, int(product_id))
+        self._json({"responseCode": 200, "message": "Deleted!"})
+
+    def checkout(self) -> None:
+        if not self.user:
+            return self._redirect("/login")
+        self._page(views.checkout_page(self.user, dict(self.store.cart(self.session_id))))
+
+    def payment(self) -> None:
+        if not self.user:
+            return self._redirect("/login")
+        self._page(views.payment_page(self.user))
+
+    def payment_submit(self) -> None:
+        if not self.user:
+            return self._redirect("/login")
+        order = self.store.place_order(self.session_id, views.cart_total(self.store.cart(self.session_id)))
+        self._redirect(f"/payment_done/{order['total']}")
+
+    def payment_done(self, amount: str) -> None:
+        self._page(views.order_placed_page(self.user, int(amount)))
+
+    def download_invoice(self, amount: str) -> None:
+        user = self.user or {"firstname": "Guest", "lastname": ""}
+        text = (f"Hi {user['firstname']} {user['lastname']}, "
+                f"Your total purchase amount is {amount}. Thank you")
+        self._send(200, text.encode(), "text/plain; charset=utf-8",
+                   {"Content-Disposition": 'attachment; filename="invoice.txt"'})
+
+    # ---------- Accounts ----------
+
+    def login(self) -> None:
+        self._page(views.login_page(self.user, self._csrf()))
+
+    def login_submit(self) -> None:
+        form = self._form()
+        if not self.store.check_password(form.get("email", ""), form.get("password", "")):
+            return self._page(views.login_page(self.user, self._csrf(), login_error=True))
+        self.session_id = self.store.login(self.session_id, form["email"])
+        self.new_session = True
+        self._redirect("/")
+
+    def signup_submit(self) -> None:
+        form = self._form()
+        if form.get("form_type") == "create_account":
+            return self._create_account_from_form(form)
+
+        if form.get("email", "") in self.store.accounts:
+            return self._page(views.login_page(self.user, self._csrf(), signup_error=True))
+        self._page(views.signup_page(self.user, self._csrf(), form.get("name", ""), form.get("email", "")))
+
+    def _create_account_from_form(self, form: Dict[str, str]) -> None:
+        account = {
+            "name": form.get("name", ""),
+            "email": form.get("email_address", ""),
+            "password": form.get("password", ""),
+            "title": form.get("title", "Mr"),
+            "birth_date": form.get("days", ""),
+            "birth_month": form.get("months", ""),
+            "birth_year": form.get("years", ""),
+            "firstname": form.get("first_name", ""),
+            "lastname": form.get("last_name", ""),
+            "company": form.get("company", ""),
+            "address1": form.get("address1", ""),
+            "address2": form.get("address2", ""),
+            "country": form.get("country", ""),
+            "zipcode": form.get("zipcode", ""),
+            "state": form.get("state", ""),
+            "city": form.get("city", ""),
+            "mobile_number": form.get("mobile_number", ""),
+        }
+        if not self.store.create_account(account):
+            return self._page(views.login_page(self.user, self._csrf(), signup_error=True))
+        # Like the real site, a new account is logged in straight away
+        self.session_id = self.store.login(self.session_id, account["email"])
+        self.new_session = True
+        self._redirect("/account_created")
+
+    def account_created(self) -> None:
+        self._page(views.account_created_page(self.user))
+
+    def logout(self) -> None:
+        self.store.logout(self.session_id)
+        self._redirect("/login")
+
+    def delete_account(self) -> None:
+        user = self.user
+        if not user:
+            return self._redirect("/login")
+        self.store.delete_account(user["email"])
+        self._page(views.account_deleted_page(None))
+
+    # ---------- Account API ----------
+
+    def api_create_account(self) -> None:
+        form = self._form()
+        if not form.get("email"):
+            return self._json({"responseCode": 400, "message": "Bad request, email parameter is missing in POST request."})
+        if not self.store.create_account(form):
+            return self._json({"responseCode": 400, "message": "Email already exists!"})
+        self._json({"responseCode": 201, "message": "User created!"})
+
+    def api_verify_login(self) -> None:
+        form = self._form()
+        if self.store.check_password(form.get("email", ""), form.get("password", "")):
+            return self._json({"responseCode": 200, "message": "User exists!"})
+        self._json({"responseCode": 404, "message": "User not found!"})
+
+    def api_delete_account(self) -> None:
+        form = self._form()
+        email = form.get("email", "")
+        if self.store.check_password(email, form.get("password", "")) and self.store.delete_account(email):
+            return self._json({"responseCode": 200, "message": "Account deleted!"})
+        self._json({"responseCode": 404, "message": "Account not found!"})
+
+    def api_products_list(self) -> None:
+        products = [
+            {"id": product["id"], "name": product["name"], "price": f"Rs. {product['price']}",
+             "brand": product["brand"], "category": catalog.category_label(product)}
+            for product in catalog.PRODUCTS.values()
+        ]
+        self._json({"responseCode": 200, "products": products})
+
+    # ---------- Request Helpers ----------
+
+    def _session_cookie(self) -> Optional[str]:
+        jar = cookies.SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = jar.get(self.SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def _csrf(self) -> str:
+        return self.store.session(self.session_id)["csrf"]
+
+    def _form(self) -> Dict[str, str]:
+        return {key: values[0] for key, values in parse_qs(self.body.decode()).items()}
+
+    def _multipart(self) -> Dict[str, object]:
+        content_type = self.headers.get("Content-Type", "")
+        if not content_type.startswith("multipart/form-data"):
+            return self._form()
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + self.body
+        )
+        fields: Dict[str, object] = {}
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            payload = part.get_payload(decode=True) or b""
+            fields[name] = payload if part.get_filename() is not None else payload.decode(errors="replace")
+        return fields
+
+    # ---------- Response Helpers ----------
+
+    def _page(self, html: str) -> None:
+        self.store.count_page_load(unquote(urlsplit(self.path).path))
+        self._html(html)
+
+    def _html(self, html: str, status: int = 200) -> None:
+        self._send(status, html.encode(), "text/html; charset=utf-8")
+
+    def _json(self, body: dict) -> None:
+        # Served as text/html like the real API
+        self._send(200, json.dumps(body).encode(), "text/html; charset=utf-8")
+
+    def _redirect(self, location: str) -> None:
+        self._send(302, b"", "text/html; charset=utf-8", {"Location": location})
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        if self.new_session:
+            self.send_header("Set-Cookie", f"{self.SESSION_COOKIE}={self.session_id}; Path=/; HttpOnly; SameSite=Lax")
+            self.send_header("Set-Cookie", f"csrftoken={self._csrf()}; Path=/; SameSite=Lax")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("stand-in: " + format, *args)
+
+
+def _route(method: str, pattern: str, handler: Callable) -> Route:
+    return method, re.compile(pattern), handler
+
+
+_Handler.ROUTES = [
+    _route("GET", r"/", _Handler.home),
+    _route("GET", r"/favicon\.ico", _Handler.favicon),
+    _route("GET", r"/products", _Handler.products),
+    _route("GET", r"/category_products/(\d+)", _Handler.category_products),
+    _route("GET", r"/brand_products/(.+)", _Handler.brand_products),
+    _route("GET", r"/product_details/(\d+)", _Handler.product_details),
+    _route("GET", r"/test_cases", _Handler.test_cases),
+    _route("GET", r"/contact_us", _Handler.contact_us),
+    _route("POST", r"/contact_us", _Handler.contact_us_submit),
+    _route("POST", r"/subscribe", _Handler.subscribe),
+    _route("GET", r"/view_cart", _Handler.view_cart),
+    _route("GET", r"/add_to_cart/(\d+)", _Handler.add_to_cart),
+    _route("GET", r"/delete_cart/(\d+)", _Handler.delete_cart),
+    _route("GET", r"/checkout", _Handler.checkout),
+    _route("GET", r"/payment", _Handler.payment),
+    _route("POST", r"/payment", _Handler.payment_submit),
+    _route("GET", r"/payment_done/(\d+)", _Handler.payment_done),
+    _route("GET", r"/download_invoice/(\d+)", _Handler.download_invoice),
+    _route("GET", r"/login", _Handler.login),
+    _route("POST", r"/login", _Handler.login_submit),
+    _route("POST", r"/signup", _Handler.signup_submit),
+    _route("GET", r"/account_created", _Handler.account_created),
+    _route("GET", r"/logout", _Handler.logout),
+    _route("GET", r"/delete_account", _Handler.delete_account),
+    _route("POST", r"/api/createAccount", _Handler.api_create_account),
+    _route("POST", r"/api/verifyLogin", _Handler.api_verify_login),
+    _route("DELETE", r"/api/deleteAccount", _Handler.api_delete_account),
+    _route("GET", r"/api/productsList", _Handler.api_products_list),
+]
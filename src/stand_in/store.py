@@ -0,0 +1,119 @@
+import secrets
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+
+class Store:
+    """
+    In-memory state of the stand-in site: accounts, browser sessions, carts and orders.
+
+    Guests keep their cart on the session; logging in moves it onto the account cart,
+    like the real site, so a cart built as a guest survives signup/login.
+    All methods are thread-safe (the server handles requests concurrently).
+    """
+
+    def __init__(self) -> None:
+        self.accounts: Dict[str, dict] = {}
+        self.sessions: Dict[str, dict] = {}
+        self.carts: Dict[str, Counter] = {}  # email -> product id -> quantity
+        self.orders: list[dict] = []
+        self.messages: list[dict] = []
+        self.subscriptions: list[str] = []
+        self.page_loads: Counter = Counter()
+        self._lock = threading.RLock()
+
+    # ---------- Sessions ----------
+
+    def new_session(self) -> str:
+        session_id = secrets.token_hex(16)
+        with self._lock:
+            self.sessions[session_id] = {"user": None, "cart": Counter(), "csrf": secrets.token_hex(16)}
+        return session_id
+
+    def session(self, session_id: Optional[str]) -> Optional[dict]:
+        with self._lock:
+            return self.sessions.get(session_id or "")
+
+    def login(self, session_id: str, email: str) -> str:
+        """
+        Authenticates the session and returns a fresh session id (the old one is retired).
+        The guest cart is merged into the account cart.
+        """
+        with self._lock:
+            old = self.sessions.pop(session_id, None) or {"cart": Counter()}
+            new_id = secrets.token_hex(16)
+            self.sessions[new_id] = {"user": email, "cart": Counter(), "csrf": secrets.token_hex(16)}
+            self.carts.setdefault(email, Counter()).update(old["cart"])
+            return new_id
+
+    def logout(self, session_id: str) -> None:
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session:
+                session["user"] = None
+
+    def user(self, session_id: Optional[str]) -> Optional[dict]:
+        with self._lock:
+            session = self.sessions.get(session_id or "")
+            return self.accounts.get(session["user"]) if session and session["user"] else None
+
+    # ---------- Accounts ----------
+
+    def create_account(self, account: dict) -> bool:
+        """Returns False when the email is already registered."""
+        with self._lock:
+            if account["email"] in self.accounts:
+                return False
+            self.accounts[account["email"]] = account
+            return True
+
+    def check_password(self, email: str, password: str) -> bool:
+        with self._lock:
+            account = self.accounts.get(email)
+            return bool(account) and account["password"] == password
+
+    def delete_account(self, email: str) -> bool:
+        with self._lock:
+            if self.accounts.pop(email, None) is None:
+                return False
+            self.carts.pop(email, None)
+            for session in self.sessions.values():
+                if session["user"] == email:
+                    session["user"] = None
+            return True
+
+    # ---------- Carts ----------
+
+    def cart(self, session_id: Optional[str]) -> Counter:
+        """Returns the live cart of the session: the account cart when logged in."""
+        with self._lock:
+            session = self.sessions.get(session_id or "")
+            if not session:
+                return Counter()
+            if session["user"]:
+                return self.carts.setdefault(session["user"], Counter())
+            return session["cart"]
+
+    def add_to_cart(self, session_id: str, product_id: int, quantity: int = 1) -> None:
+        with self._lock:
+            self.cart(session_id)[product_id] += quantity
+
+    def remove_from_cart(self, session_id: str, product_id: int) -> None:
+        with self._lock:
+            self.cart(session_id).pop(product_id, None)
+
+    def place_order(self, session_id: str, total: int) -> dict:
+        with self._lock:
+            user = self.user(session_id)
+            cart = self.cart(session_id)
+            order = {"email": user["email"] if user else None, "items": dict(cart), "total": total}
+            self.orders.append(order)
+            cart.clear()
+            return order
+
+    # ---------- Stats ----------
+
+    def count_page_load(self, path: str) -> None:
+        with self._lock:
+            self.page_loads[path] += 1
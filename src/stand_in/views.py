@@ -0,0 +1,568 @@
+"""
+HTML of the stand-in site.
+
+Markup mirrors automationexercise.com wherever a page object or the product catalog scraper
+reads it (ids, classes, data-qa attributes, element nesting and visible texts), and nowhere else.
+Behaviour the real site implements with jQuery/Bootstrap (hover overlays, modals, collapsible
+sidebar, AJAX cart updates, subscription and review alerts) is reproduced with a little
+plain CSS/JS so the browser-level flows stay the same.
+"""
+
+import json
+from html import escape
+from pathlib import Path
+from typing import Optional
+
+from stand_in import catalog
+
+TEST_CASES_FILE = Path(__file__).parent.parent / "test_cases" / "automationexercise_testcases.json"
+
+MONTHS = ("January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December")
+COUNTRIES = ("India", "United States", "Canada", "Australia", "Israel", "New Zealand", "Singapore")
+
+STYLE = """
+body { font-family: sans-serif; margin: 0; }
+.container { width: 1140px; margin: 0 auto; }
+.header-middle { padding: 20px 0; border-bottom: 1px solid #eee; }
+.header-middle ul { list-style: none; display: flex; gap: 18px; margin: 0; padding: 0; }
+.title { text-transform: uppercase; color: #FE980F; }
+.row { display: flex; gap: 30px; }
+.left-sidebar { width: 260px; flex: none; }
+.features_items { flex: 1; }
+.product-image-wrapper { display: inline-block; width: 260px; margin: 0 10px 20px 0; vertical-align: top;
+  border: 1px solid #F7F7F5; }
+.single-products { position: relative; }
+.productinfo { padding: 20px; height: 160px; text-align: center; }
+.product-overlay { display: none; position: absolute; top: 0; left: 0; width: 100%; height: 100%;
+  background: #FE980F; text-align: center; }
+.single-products:hover .product-overlay { display: block; }
+.overlay-content { padding: 20px; }
+.panel-collapse { display: none; }
+.panel-collapse.in { display: block; }
+.modal { display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100%;
+  background: rgba(0, 0, 0, 0.4); z-index: 100; }
+.modal.show { display: block; }
+.modal-content { width: 400px; margin: 120px auto; padding: 20px; background: #fff; }
+.hide { display: none; }
+#scrollUp { position: fixed; right: 20px; bottom: 20px; padding: 10px 14px; background: #FE980F;
+  color: #fff; z-index: 50; }
+#footer { margin-top: 40px; padding: 40px 0 400px; background: #F0F0E9; }
+#slider { min-height: 300px; }
+"""
+
+SCRIPT = """
+function openModal(id) { document.getElementById(id).classList.add('show'); }
+document.addEventListener('click', function (event) {
+  var target = event.target;
+  var link = target.closest('a[data-toggle="collapse"]');
+  if (link) {
+    event.preventDefault();
+    document.querySelector(link.getAttribute('href')).classList.toggle('in');
+    return;
+  }
+  var add = target.closest('a.add-to-cart');
+  if (add) {
+    event.preventDefault();
+    fetch('/add_to_cart/' + add.getAttribute('data-product-id'))
+      .then(function () { openModal('cartModal'); });
+    return;
+  }
+  var cartButton = target.closest('button.cart');
+  if (cartButton) {
+    var quantity = document.getElementById('quantity').value;
+    fetch('/add_to_cart/' + cartButton.getAttribute('data-product-id') + '?quantity=' + quantity)
+      .then(function () { openModal('cartModal'); });
+    return;
+  }
+  var remove = target.closest('a.cart_quantity_delete');
+  if (remove) {
+    var productId = remove.getAttribute('data-product-id');
+    fetch('/delete_cart/' + productId).then(function () {
+      document.getElementById('product-' + productId).remove();
+    });
+    return;
+  }
+  var modalLink = target.closest('[data-target]');
+  if (modalLink) {
+    event.preventDefault();
+    openModal(modalLink.getAttribute('data-target').slice(1));
+    return;
+  }
+  if (target.closest('.close-modal')) {
+    target.closest('.modal').classList.remove('show');
+    return;
+  }
+  if (target.closest('#scrollUp')) {
+    event.preventDefault();
+    window.scrollTo(0, 0);
+  }
+});
+document.addEventListener('submit', function (event) {
+  var form = event.target;
+  if (form.id === 'subscribe-form') {
+    event.preventDefault();
+    fetch('/subscribe', {method: 'POST', body: new URLSearchParams(new FormData(form))})
+      .then(function () { document.getElementById('success-subscribe').classList.remove('hide'); });
+  } else if (form.id === 'review-form') {
+    event.preventDefault();
+    document.getElementById('review-section').classList.remove('hide');
+  } else if (form.id === 'contact-us-form' && !confirm('Press OK to proceed!')) {
+    event.preventDefault();
+  }
+});
+"""
+
+
+# ---------- Layout ----------
+
+def layout(title: str, body: str, user: Optional[dict] = None) -> str:
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Automation Exercise - {escape(title)}</title>
+<link rel="icon" href="/favicon.ico">
+<style>{STYLE}</style>
+</head>
+<body>
+{header(user)}
+<section><div class="container">{body}</div></section>
+{footer()}
+<a id="scrollUp" href="#top">&uarr;</a>
+{cart_modal()}
+<script>{SCRIPT}</script>
+</body>
+</html>"""
+
+
+def header(user: Optional[dict]) -> str:
+    if user:
+        account_links = (
+            '<li><a href="/logout">Logout</a></li>'
+            '<li><a href="/delete_account">Delete Account</a></li>'
+        )
+    else:
+        account_links = '<li><a href="/login">Signup / Login</a></li>'
+    logged_in = f'<li><a>Logged in as <b>{escape(user["name"])}</b></a></li>' if user else ""
+    return f"""<header id="header"><div class="header-middle"><div class="container">
+<div class="logo"><a href="/">AutomationExercise</a></div>
+<div class="shop-menu"><ul class="nav navbar-nav">
+<li><a href="/">Home</a></li>
+<li><a href="/products">Products</a></li>
+<li><a href="/view_cart">Cart</a></li>
+{account_links}
+<li><a href="/test_cases">Test Cases</a></li>
+<li><a href="/api_list">API Testing</a></li>
+<li><a href="/contact_us">Contact us</a></li>
+{logged_in}
+</ul></div>
+</div></div></header>"""
+
+
+def footer() -> str:
+    return """<footer id="footer"><div class="container"><div class="single-widget">
+<h2>Subscription</h2>
+<form id="subscribe-form" action="/subscribe" method="post">
+<input type="email" id="susbscribe_email" name="email" required placeholder="Your email address">
+<button type="submit" id="subscribe">&rarr;</button>
+</form>
+<div id="success-subscribe" class="hide"><div class="alert-success alert">You have been successfully subscribed!</div></div>
+<p>Get the most recent updates from our site and be updated your self...</p>
+</div></div></footer>"""
+
+
+def cart_modal() -> str:
+    return """<div class="modal" id="cartModal"><div class="modal-dialog"><div class="modal-content">
+<div class="modal-header"><h4 class="modal-title">Added!</h4></div>
+<div class="modal-body"><p>Your product has been added to cart.</p>
+<p><a href="/view_cart"><u>View Cart</u></a></p></div>
+<div class="modal-footer"><button class="btn btn-success close-modal btn-block">Continue Shopping</button></div>
+</div></div></div>"""
+
+
+# ---------- Products ----------
+
+def product_card(product: dict) -> str:
+    name, price, product_id = escape(product["name"]), product["price"], product["id"]
+    return f"""<div class="col-sm-4"><div class="product-image-wrapper">
+<div class="single-products">
+<div class="productinfo text-center">
+<h2>Rs. {price}</h2>
+<p>{name}</p>
+<a href="#" data-product-id="{product_id}" class="btn btn-default add-to-cart">Add to cart</a>
+</div>
+<div class="product-overlay"><div class="overlay-content">
+<h2>Rs. {price}</h2>
+<p>{name}</p>
+<a href="#" data-product-id="{product_id}" class="btn btn-default add-to-cart">Add to cart</a>
+</div></div>
+</div>
+<div class="choose"><ul class="nav nav-pills nav-justified">
+<li><a href="/product_details/{product_id}">View Product</a></li>
+</ul></div>
+</div></div>"""
+
+
+def left_sidebar() -> str:
+    panels = []
+    for panel in catalog.PANELS:
+        links = "".join(
+            f'<li><a href="/category_products/{category_id}">{escape(name)}</a></li>'
+            for category_id, (owner, name) in catalog.CATEGORIES.items() if owner == panel
+        )
+        panels.append(f"""<div class="panel panel-default">
+<div class="panel-heading"><h4 class="panel-title">
+<a data-toggle="collapse" data-parent="#accordian" href="#{panel}">{panel}</a>
+</h4></div>
+<div id="{panel}" class="panel-collapse collapse"><div class="panel-body"><ul>{links}</ul></div></div>
+</div>""")
+
+    brands = "".join(
+        f'<li><a href="/brand_products/{escape(brand)}"><span class="pull-right">'
+        f'({sum(product["brand"] == brand for product in catalog.PRODUCTS.values())})</span>{escape(brand)}</a></li>'
+        for brand in catalog.BRANDS
+    )
+    return f"""<div class="left-sidebar">
+<h2>Category</h2>
+<div class="panel-group category-products" id="accordian">{"".join(panels)}</div>
+<div class="brands_products"><h2>Brands</h2>
+<div class="brands-name"><ul class="nav nav-pills nav-stacked">{brands}</ul></div>
+</div>
+</div>"""
+
+
+def listing(title: str, products: list[dict], before: str = "") -> str:
+    cards = "".join(product_card(product) for product in products)
+    return f"""{before}<div class="row">
+<div class="col-sm-3">{left_sidebar()}</div>
+<div class="col-sm-9 padding-right">
+<div class="features_items"><h2 class="title text-center">{escape(title)}</h2>{cards}</div>
+</div>
+</div>"""
+
+
+def home_page(user: Optional[dict]) -> str:
+    slider = """<section id="slider"><div id="slider-carousel" class="carousel slide">
+<div class="carousel-inner"><div class="item active"><div class="col-sm-6">
+<h1><span>Automation</span>Exercise</h1>
+<h2>Full-Fledged practice website for Automation Engineers</h2>
+<p>All QA engineers can use this website for automation practice and API testing either they are at beginner or advance level.</p>
+<a href="/test_cases"><button type="button" class="btn btn-success">Test Cases</button></a>
+<a href="/api_list"><button type="button" class="btn btn-success">APIs list for practice</button></a>
+</div></div></div>
+</div></section>"""
+    recommended = "".join(
+        f"""<div class="col-sm-4"><div class="product-image-wrapper"><div class="single-products">
+<div class="productinfo text-center">
+<h2>Rs. {catalog.PRODUCTS[product_id]["price"]}</h2>
+<p>{escape(catalog.PRODUCTS[product_id]["name"])}</p>
+<a href="#" data-product-id="{product_id}" class="btn btn-default add-to-cart">Add to cart</a>
+</div></div></div></div>"""
+        for product_id in catalog.RECOMMENDED_IDS
+    )
+    body = listing("Features Items", list(catalog.PRODUCTS.values()), before=slider) + f"""
+<div class="recommended_items"><h2 class="title text-center">recommended items</h2>
+<div id="recommended-item-carousel" class="carousel slide"><div class="carousel-inner">
+<div class="item active">{recommended}</div>
+</div></div></div>"""
+    return layout("Home", body, user)
+
+
+def products_page(user: Optional[dict], search: Optional[str] = None) -> str:
+    banner = """<section id="advertisement"><div class="container">
+<form action="/products" method="get">
+<input type="text" id="search_product" name="search" placeholder="Search Product">
+<button type="submit" id="submit_search" class="btn btn-default btn-lg">Search</button>
+</form>
+</div></section>"""
+    if search is None:
+        body = listing("All Products", list(catalog.PRODUCTS.values()), before=banner)
+    else:
+        body = listing("Searched Products", catalog.search(search), before=banner)
+    return layout("All Products", body, user)
+
+
+def category_page(user: Optional[dict], category_id: int) -> str:
+    panel, name = catalog.CATEGORIES[category_id]
+    products = [product for product in catalog.PRODUCTS.values() if product["category_id"] == category_id]
+    return layout(f"{panel} {name}", listing(f"{panel} - {name} Products", products), user)
+
+
+def brand_page(user: Optional[dict], brand: str) -> str:
+    products = [product for product in catalog.PRODUCTS.values() if product["brand"] == brand]
+    return layout(brand, listing(f"Brand - {brand} Products", products), user)
+
+
+def product_details_page(user: Optional[dict], product: dict) -> str:
+    body = f"""<div class="product-details">
+<div class="col-sm-7"><div class="product-information">
+<h2>{escape(product["name"])}</h2>
+<p>Category: {escape(catalog.category_label(product))}</p>
+<span><span>Rs. {product["price"]}</span>
+<label>Quantity:</label>
+<input type="number" name="quantity" id="quantity" min="1" value="1">
+<button type="button" class="btn btn-default cart" data-product-id="{product["id"]}">Add to cart</button>
+</span>
+<p><b>Availability:</b> In Stock</p>
+<p><b>Condition:</b> New</p>
+<p><b>Brand:</b> {escape(product["brand"])}</p>
+</div></div>
+</div>
+<div class="category-tab shop-details-tab">
+<ul class="nav nav-tabs"><li class="active"><a href="#reviews">Write Your Review</a></li></ul>
+<div class="tab-content"><div class="tab-pane active" id="reviews">
+<form id="review-form" action="#" method="post">
+<span><input type="text" id="name" placeholder="Your Name" required>
+<input type="email" id="email" placeholder="Email Address" required></span>
+<textarea name="review" id="review" placeholder="Add Review Here!" required></textarea>
+<button type="submit" id="button-review" class="btn btn-default pull-right">Submit</button>
+</form>
+<div id="review-section" class="hide"><div class="alert-success alert"><span>Thank you for your review.</span></div></div>
+</div></div>
+</div>"""
+    return layout("Product Details", body, user)
+
+
+# ---------- Cart & Checkout ----------
+
+def cart_rows(cart: dict, with_delete: bool = True) -> str:
+    rows = []
+    for product_id, quantity in cart.items():
+        product = catalog.PRODUCTS[product_id]
+        delete = (
+            f'<td class="cart_delete"><a class="cart_quantity_delete" data-product-id="{product_id}">&times;</a></td>'
+            if with_delete else ""
+        )
+        rows.append(f"""<tr id="product-{product_id}">
+<td class="cart_product"><a href="/product_details/{product_id}">{product_id}</a></td>
+<td class="cart_description"><h4><a href="/product_details/{product_id}">{escape(product["name"])}</a></h4>
+<p>{escape(catalog.category_label(product))}</p></td>
+<td class="cart_price"><p>Rs. {product["price"]}</p></td>
+<td class="cart_quantity"><button class="disabled">{quantity}</button></td>
+<td class="cart_total"><p class="cart_total_price">Rs. {product["price"] * quantity}</p></td>
+{delete}
+</tr>""")
+    return "".join(rows)
+
+
+def cart_total(cart: dict) -> int:
+    return sum(catalog.PRODUCTS[product_id]["price"] * quantity for product_id, quantity in cart.items())
+
+
+def cart_page(user: Optional[dict], cart: dict) -> str:
+    if user:
+        checkout = '<a href="/checkout" class="btn btn-default check_out">Proceed To Checkout</a>'
+    else:
+        checkout = '<a class="btn btn-default check_out" data-target="#checkoutModal">Proceed To Checkout</a>'
+    empty = "" if cart else (
+        '<span id="empty_cart"><p><b>Cart is empty!</b> Click <a href="/products"><u>here</u></a> '
+        'to buy products.</p></span>'
+    )
+    body = f"""<div class="breadcrumbs"><ol class="breadcrumb">
+<li><a href="/">Home</a></li><li class="active">Shopping Cart</li>
+</ol></div>
+<div class="table-responsive cart_info" id="cart_items">
+<table class="table table-condensed" id="cart_info_table">
+<thead><tr class="cart_menu"><td>Item</td><td>Description</td><td>Price</td><td>Quantity</td><td>Total</td><td></td></tr></thead>
+<tbody>{cart_rows(cart)}</tbody>
+</table>
+{empty}
+</div>
+<section id="do_action"><div class="col-sm-6">{checkout}</div></section>
+<div class="modal" id="checkoutModal"><div class="modal-dialog"><div class="modal-content">
+<div class="modal-header"><h4 class="modal-title">Checkout</h4></div>
+<div class="modal-body"><p>Register / Login account to proceed on checkout.</p>
+<p><a href="/login"><u>Register / Login</u></a></p></div>
+<div class="modal-footer"><button class="btn btn-success close-checkout-modal btn-block close-modal">Continue On Cart</button></div>
+</div></div></div>"""
+    return layout("Checkout", body, user)
+
+
+def address_list(list_id: str, heading: str, account: dict) -> str:
+    lines = (
+        f'{account["title"]}. {account["firstname"]} {account["lastname"]}',
+        account["company"],
+        account["address1"],
+        account["address2"],
+        f'{account["city"]} {account["state"]} {account["zipcode"]}',
+        account["country"],
+        account["mobile_number"],
+    )
+    items = "".join(f"<li>{escape(str(line))}</li>" for line in lines)
+    return f"""<ul class="address item box" id="{list_id}">
+<li class="address_title"><h3 class="page-subheading">{heading}</h3></li>{items}</ul>"""
+
+
+def checkout_page(user: dict, cart: dict) -> str:
+    body = f"""<div class="step-one"><h2 class="heading">Address Details</h2></div>
+<div class="checkout-information"><div class="row">
+<div class="col-xs-12 col-sm-6">{address_list("address_delivery", "Your delivery address", user)}</div>
+<div class="col-xs-12 col-sm-6">{address_list("address_invoice", "Your billing address", user)}</div>
+</div></div>
+<div class="step-one"><h2 class="heading">Review Your Order</h2></div>
+<div class="table-responsive cart_info" id="cart_info"><table class="table table-condensed">
+<thead><tr class="cart_menu"><td>Item</td><td>Description</td><td>Price</td><td>Quantity</td><td>Total</td></tr></thead>
+<tbody>{cart_rows(cart, with_delete=False)}
+<tr><td colspan="4"><h4><b>Total Amount</b></h4></td><td><p class="cart_total_price">Rs. {cart_total(cart)}</p></td></tr>
+</tbody></table></div>
+<div id="ordermsg"><label>If you would like to add a comment about your order, please write it in the field below.</label>
+<textarea class="form-control" name="message" rows="6"></textarea></div>
+<a href="/payment" class="btn btn-default check_out">Place Order</a>"""
+    return layout("Checkout", body, user)
+
+
+def payment_page(user: dict) -> str:
+    body = """<div class="step-one"><h2 class="heading">Payment</h2></div>
+<div class="payment-information">
+<form id="payment-form" action="/payment" method="post">
+<label>Name on Card</label><input class="form-control" name="name_on_card" data-qa="name-on-card" required>
+<label>Card Number</label><input class="form-control card-number" name="card_number" data-qa="card-number" required>
+<label>CVC</label><input class="form-control card-cvc" name="cvc" data-qa="cvc" required>
+<label>Expiration</label><input class="form-control card-expiry-month" name="expiry_month" data-qa="expiry-month" required>
+<input class="form-control card-expiry-year" name="expiry_year" data-qa="expiry-year" required>
+<div id="success_message" class="hide"><div class="alert-success alert">Your order has been placed successfully!</div></div>
+<button id="submit" data-qa="pay-button" type="submit" class="form-control btn btn-primary submit-button">Pay and Confirm Order</button>
+</form>
+</div>"""
+    return layout("Payment", body, user)
+
+
+def order_placed_page(user: Optional[dict], amount: int) -> str:
+    body = f"""<div class="col-sm-9 col-sm-offset-1">
+<h2 data-qa="order-placed" class="title text-center"><b>Order Placed!</b></h2>
+<p>Congratulations! Your order has been confirmed!</p>
+<a href="/download_invoice/{amount}" class="btn btn-default check_out">Download Invoice</a>
+<div class="pull-right"><a href="/" class="btn btn-primary" data-qa="continue-button">Continue</a></div>
+</div>"""
+    return layout("Order Placed", body, user)
+
+
+# ---------- Accounts ----------
+
+def login_page(user: Optional[dict], csrf: str, login_error: bool = False, signup_error: bool = False) -> str:
+    login_message = '<p style="color: red;">Your email or password is incorrect!</p>' if login_error else ""
+    signup_message = '<p style="color: red;">Email Address already exist!</p>' if signup_error else ""
+    body = f"""<section id="form"><div class="row">
+<div class="col-sm-4 col-sm-offset-1"><div class="login-form">
+<h2>Login to your account</h2>
+<form action="/login" method="POST">
+<input type="hidden" name="csrfmiddlewaretoken" value="{csrf}">
+<input type="email" data-qa="login-email" placeholder="Email Address" name="email" required>
+<input type="password" data-qa="login-password" placeholder="Password" name="password" required>
+{login_message}
+<button type="submit" data-qa="login-button" class="btn btn-default">Login</button>
+</form>
+</div></div>
+<div class="col-sm-1"><h2 class="or">OR</h2></div>
+<div class="col-sm-4"><div class="signup-form">
+<h2>New User Signup!</h2>
+<form action="/signup" method="POST">
+<input type="hidden" name="csrfmiddlewaretoken" value="{csrf}">
+<input type="text" data-qa="signup-name" placeholder="Name" name="name" required>
+<input type="email" data-qa="signup-email" placeholder="Email Address" name="email" required>
+<input type="hidden" name="form_type" value="signup">
+{signup_message}
+<button type="submit" data-qa="signup-button" class="btn btn-default">Signup</button>
+</form>
+</div></div>
+</div></section>"""
+    return layout("Signup / Login", body, user)
+
+
+def _select(select_id: str, options: list[tuple[str, str]]) -> str:
+    rendered = "".join(f'<option value="{escape(value)}">{escape(label)}</option>' for value, label in options)
+    return f'<select data-qa="{select_id}" id="{select_id}" name="{select_id}">{rendered}</select>'
+
+
+def _field(field_id: str, label: str) -> str:
+    return (f'<p><label for="{field_id}">{label}</label>'
+            f'<input type="text" data-qa="{field_id.replace("_", "-")}" id="{field_id}" name="{field_id}"></p>')
+
+
+def signup_page(user: Optional[dict], csrf: str, name: str, email: str) -> str:
+    days = _select("days", [("", "Day")] + [(str(day), str(day)) for day in range(1, 32)])
+    months = _select("months", [("", "Month")] + [(str(index), month) for index, month in enumerate(MONTHS, 1)])
+    years = _select("years", [("", "Year")] + [(str(year), str(year)) for year in range(2021, 1899, -1)])
+    countries = _select("country", [(country, country) for country in COUNTRIES])
+    address = "".join(_field(field_id, label) for field_id, label in (
+        ("first_name", "First name *"), ("last_name", "Last name *"), ("company", "Company"),
+        ("address1", "Address *"), ("address2", "Address 2"),
+    ))
+    location = "".join(_field(field_id, label) for field_id, label in (
+        ("state", "State *"), ("city", "City *"), ("zipcode", "Zipcode *"), ("mobile_number", "Mobile Number *"),
+    ))
+    body = f"""<section id="form"><div class="col-sm-4 col-sm-offset-1"><div class="login-form">
+<h2 class="title text-center"><b>Enter Account Information</b></h2>
+<form action="/signup" method="POST">
+<input type="hidden" name="csrfmiddlewaretoken" value="{csrf}">
+<input type="hidden" name="form_type" value="create_account">
+<input type="hidden" name="email_address" value="{escape(email)}">
+<div class="clearfix">
+<label><input type="radio" name="title" value="Mr" id="id_gender1"> Mr.</label>
+<label><input type="radio" name="title" value="Mrs" id="id_gender2"> Mrs.</label>
+</div>
+<p><label for="name">Name *</label><input type="text" data-qa="name" id="name" name="name" value="{escape(name)}"></p>
+<p><label for="email">Email *</label><input type="email" data-qa="email" id="email" value="{escape(email)}" disabled></p>
+<p><label for="password">Password *</label><input type="password" data-qa="password" id="password" name="password"></p>
+<p><label>Date of Birth</label>{days}{months}{years}</p>
+<p><input type="checkbox" name="newsletter" id="newsletter" value="1"> <label for="newsletter">Sign up for our newsletter!</label></p>
+<p><input type="checkbox" name="optin" id="optin" value="1"> <label for="optin">Receive special offers from our partners!</label></p>
+<h2 class="title text-center"><b>Address Information</b></h2>
+{address}
+<p><label for="country">Country *</label>{countries}</p>
+{location}
+<button type="submit" data-qa="create-account" class="btn btn-default">Create Account</button>
+</form>
+</div></div></section>"""
+    return layout("Signup", body, user)
+
+
+def account_created_page(user: Optional[dict]) -> str:
+    body = """<h2 data-qa="account-created" class="title text-center"><b>Account Created!</b></h2>
+<p>Congratulations! Your new account has been successfully created!</p>
+<div class="pull-right"><a href="/" data-qa="continue-button" class="btn btn-primary">Continue</a></div>"""
+    return layout("Account Created", body, user)
+
+
+def account_deleted_page(user: Optional[dict]) -> str:
+    body = """<h2 data-qa="account-deleted" class="title text-center"><b>Account Deleted!</b></h2>
+<p>Your account has been permanently deleted!</p>
+<div class="pull-right"><a href="/" data-qa="continue-button" class="btn btn-primary">Continue</a></div>"""
+    return layout("Account Deleted", body, user)
+
+
+# ---------- Misc Pages ----------
+
+def contact_page(user: Optional[dict], submitted: bool = False) -> str:
+    if submitted:
+        form = """<div class="status alert alert-success">Success! Your details have been submitted successfully.</div>
+<a href="/" class="btn btn-success"><span>&laquo; Home</span></a>"""
+    else:
+        form = """<form action="/contact_us" id="contact-us-form" method="post" enctype="multipart/form-data">
+<input type="text" data-qa="name" class="form-control" required name="name" placeholder="Name">
+<input type="email" data-qa="email" class="form-control" required name="email" placeholder="Email">
+<input type="text" data-qa="subject" class="form-control" required name="subject" placeholder="Subject">
+<textarea data-qa="message" name="message" id="message" required class="form-control" rows="8" placeholder="Your Message Here"></textarea>
+<input type="file" name="upload_file" class="form-control">
+<input type="submit" data-qa="submit-button" name="submit" class="btn btn-primary pull-left submit_form" value="Submit">
+</form>"""
+    body = f"""<div class="row"><div class="col-sm-8"><div class="contact-form">
+<h2 class="title text-center">Get In Touch</h2>
+{form}
+</div></div></div>"""
+    return layout("Contact Us", body, user)
+
+
+def test_cases_page(user: Optional[dict]) -> str:
+    cases = json.loads(TEST_CASES_FILE.read_text(encoding="utf-8")) if TEST_CASES_FILE.exists() else []
+    items = "".join(
+        f'<div class="panel-group"><h4 class="panel-title"><a href="/test_cases"><u>{escape(case["name"])}</u></a></h4></div>'
+        for case in cases
+    )
+    body = f'<h2 class="title text-center"><b>Test Cases</b></h2>{items}'
+    return layout("Test Cases", body, user)
+
+
+def not_found_page(user: Optional[dict]) -> str:
+    return layout("Not Found", '<h2 class="title text-center">Page not found</h2>', user)
@@ -0,0 +1,187 @@
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import requests
+
+from utilities.api_client import AccountApiClient
+from utilities.cookie_login import CookieLogin, LoginFailed
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AccountPool:
+    """
+    SQLite-backed pool of registered accounts shared by all pytest-xdist workers of a run.
+
+    Tests lease an account instead of creating one. On release the account is reset over
+    HTTP (cart emptied; the browser session is discarded with the driver) and returned to
+    the pool, or dropped when the test deleted it. The controller reaps every pooled account
+    at session finish.
+
+    Leases are atomic across processes: each one runs in a BEGIN IMMEDIATE transaction.
+    """
+
+    ROOT_DIR = Path(__file__).parent.parent.parent
+    DEFAULT_DB = ROOT_DIR / ".cache" / "account_pool.sqlite"
+    CART_ROW_PATTERN = re.compile(r'<tr id="product-(\d+)"')
+    LOGGED_IN_MARKER = "Logged in as"
+    REAP_WORKERS = 8
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS accounts (
+        email      TEXT PRIMARY KEY,
+        password   TEXT NOT NULL,
+        username   TEXT NOT NULL,
+        state      TEXT NOT NULL DEFAULT 'free',  -- free | leased
+        leased_by  TEXT,
+        leased_at  REAL,
+        created_at REAL NOT NULL
+    )
+    """
+
+    def __init__(self, api_client: AccountApiClient, cookie_login: Optional[CookieLogin] = None,
+                 db_path: Optional[str] = None) -> None:
+        self.api_client = api_client
+        self.cookie_login = cookie_login or CookieLogin(api_client.base_url)
+        self.db_path = Path(db_path or self.DEFAULT_DB)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as db:
+            db.execute(self.SCHEMA)
+
+    # ---------- Lease / Release ----------
+
+    def lease(self, worker: str, create: Callable[[], Dict[str, str]]) -> Dict[str, str]:
+        """
+        Returns a free account, or registers a new one with create() when the pool is empty.
+        """
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT email, password, username FROM accounts WHERE state = 'free' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row:
+                db.execute(
+                    "UPDATE accounts SET state = 'leased', leased_by = ?, leased_at = ? WHERE email = ?",
+                    (worker, time.time(), row["email"]),
+                )
+                logger.info("Leased pooled account %s to %s", row["email"], worker)
+                return dict(row)
+
+        account = create()
+        with self._transaction() as db:
+            db.execute(
+                "INSERT INTO accounts (email, password, username, state, leased_by, leased_at, created_at) "
+                "VALUES (?, ?, ?, 'leased', ?, ?, ?)",
+                (account["email"], account["password"], account["username"], worker, time.time(), time.time()),
+            )
+        logger.info("Pool empty, registered new account %s for %s", account["email"], worker)
+        return account
+
+    def release(self, account: Dict[str, str]) -> None:
+        """
+        Resets the account and returns it to the pool.
+        Accounts deleted by the test, or that cannot be reset, leave the pool.
+        """
+        email, password = account["email"], account["password"]
+        if not self.api_client.verify_login(email, password):
+            logger.info("Pooled account %s no longer exists, dropping it", email)
+            self._remove(email)
+            return
+
+        try:
+            self.reset(email, password)
+        except (LoginFailed, requests.RequestException) as e:
+            logger.warning("Could not reset pooled account %s (%s), deleting it", email, e)
+            self.api_client.delete_account(email, password)
+            self._remove(email)
+            return
+
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE accounts SET state = 'free', leased_by = NULL, leased_at = NULL WHERE email = ?",
+                (email,),
+            )
+
+    def reset(self, email: str, password: str) -> None:
+        """
+        Empties the server-side cart of the account. The test's browser session (login state)
+        ends with its driver, so logging out is not needed.
+
+        The cached login cookies turn into a guest session when the test logged out through
+        the UI; the cart would then look empty. They are dropped and the account logs in again
+        once; LoginFailed is raised when the cart still is not the account's.
+        """
+        base_url, timeout = self.cookie_login.base_url, self.cookie_login.timeout
+        for _ in range(2):
+            with self.cookie_login.http_session(email, password) as session:
+                cart = session.get(f"{base_url}/view_cart", timeout=timeout)
+                cart.raise_for_status()
+                if self.LOGGED_IN_MARKER in cart.text:
+                    for product_id in set(self.CART_ROW_PATTERN.findall(cart.text)):
+                        session.get(f"{base_url}/delete_cart/{product_id}", timeout=timeout).raise_for_status()
+                    return
+            logger.info("Cached session of %s is no longer logged in, logging in again", email)
+            self.cookie_login.forget(email)
+        raise LoginFailed(f"cart of {email} is not reachable with a logged-in session")
+
+    # ---------- Reaper ----------
+
+    def reap(self) -> int:
+        """
+        Deletes every pooled account concurrently and removes the pool database.
+        Runs once, in the controller, at session finish.
+        """
+        with self._transaction() as db:
+            accounts = [dict(row) for row in db.execute("SELECT email, password FROM accounts")]
+
+        def delete(account: Dict[str, Any]) -> bool:
+            try:
+                return self.api_client.delete_account(account["email"], account["password"])
+            except requests.RequestException as e:
+                logger.warning("Reaper could not delete %s: %s", account["email"], e)
+                return False
+
+        with ThreadPoolExecutor(max_workers=self.REAP_WORKERS) as executor:
+            deleted = sum(executor.map(delete, accounts))
+
+        self.db_path.unlink(missing_ok=True)
+        logger.info("Account pool reaped: %s/%s accounts deleted", deleted, len(accounts))
+        return deleted
+
+    # ---------- Internal Helpers ----------
+
+    def _remove(self, email: str) -> None:
+        with self._transaction() as db:
+            db.execute("DELETE FROM accounts WHERE email = ?", (email,))
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE takes the write lock up front, so two workers never lease the same row
+        db = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            yield db
+            db.execute("COMMIT")
+        except BaseException:
+            if db.in_transaction:
+                db.execute("ROLLBACK")
+            raise
+        finally:
+            db.close()
+
+
+def load_account_pool(config: Dict[str, Any], api_client: AccountApiClient,
+                      cookie_login: Optional[CookieLogin] = None) -> Optional[AccountPool]:
+    """
+    Returns the AccountPool described by 'account_pool' in config, or None when disabled.
+    """
+    pool_config = config.get("account_pool") or {}
+    if not pool_config.get("enabled"):
+        return None
+    return AccountPool(api_client, cookie_login, db_path=pool_config.get("db_file"))
@@ -0,0 +1,127 @@
+import json
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ApiError(Exception):
+    """
+    Raised when an AutomationExercise API call returns an unexpected responseCode.
+    """
+
+    def __init__(self, path: str, response_code: Optional[int], message: str) -> None:
+        super().__init__(f"{path} returned responseCode={response_code}: {message}")
+        self.path = path
+        self.response_code = response_code
+        self.message = message
+
+
+class AccountApiClient:
+    """
+    HTTP client for the account endpoints of automationexercise.com:
+    /api/createAccount, /api/verifyLogin and /api/deleteAccount.
+
+    Requests are form-encoded. The site always answers HTTP 200 and reports the outcome
+    in the JSON body ('responseCode', 'message'). One pooled session is shared by all calls.
+    """
+
+    REQUEST_TIMEOUT = 15
+    POOL_SIZE = 8
+
+    def __init__(self, base_url: str, timeout: float = REQUEST_TIMEOUT, pool_size: int = POOL_SIZE) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.5, allowed_methods=None),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self) -> "AccountApiClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    # ---------- Accounts ----------
+
+    def create_account(self, name: str, email: str, user_profile: dict) -> None:
+        """
+        Creates an account from a registration profile (test_data/user_data.yaml layout).
+        Raises ApiError unless the API answers 201.
+        """
+        logger.info("Creating account via API: %s", email)
+        self._call("POST", "/api/createAccount", self.to_form(name, email, user_profile), expected=201)
+
+    def verify_login(self, email: str, password: str) -> bool:
+        """
+        Returns True when the credentials belong to an existing account.
+        """
+        body = self._call("POST", "/api/verifyLogin", {"email": email, "password": password})
+        return body.get("responseCode") == 200
+
+    def delete_account(self, email: str, password: str) -> bool:
+        """
+        Deletes the account. Returns False when it no longer exists (e.g. the test deleted it via UI).
+        """
+        logger.info("Deleting account via API: %s", email)
+        body = self._call("DELETE", "/api/deleteAccount", {"email": email, "password": password})
+        if body.get("responseCode") != 200:
+            logger.debug("Account %s not deleted: %s", email, body.get("message"))
+            return False
+        return True
+
+    @staticmethod
+    def to_form(name: str, email: str, user_profile: dict) -> Dict[str, str]:
+        """
+        Maps a registration profile to the createAccount form fields.
+        """
+        dob = user_profile["date_of_birth"]
+        personal = user_profile["personal_info"]
+        address = user_profile["address"]
+        return {
+            "name": name,
+            "email": email,
+            "password": user_profile["password"],
+            "title": user_profile.get("title", "mr").capitalize(),
+            "birth_date": str(dob["day"]),
+            "birth_month": str(dob["month"]),
+            "birth_year": str(dob["year"]),
+            "firstname": personal["first_name"],
+            "lastname": personal["last_name"],
+            "company": personal.get("company", ""),
+            "address1": address["address1"],
+            "address2": address.get("address2", ""),
+            "country": address["country"],
+            "zipcode": str(address["zipcode"]),
+            "state": address["state"],
+            "city": address["city"],
+            "mobile_number": user_profile["contact"]["mobile_number"],
+        }
+
+    # ---------- Internal Helpers ----------
+
+    def _call(self, method: str, path: str, data: Dict[str, str], expected: Optional[int] = None) -> dict:
+        response = self.session.request(method, f"{self.base_url}{path}", data=data, timeout=self.timeout)
+        response.raise_for_status()
+        try:
+            # Served as text/html, so response.json() cannot be relied on for the content type
+            body = json.loads(response.text)
+        except ValueError:
+            raise ApiError(path, None, f"non-JSON response: {response.text[:200]!r}")
+
+        if expected is not None and body.get("responseCode") != expected:
+            raise ApiError(path, body.get("responseCode"), body.get("message", ""))
+        return body
@@ -0,0 +1,248 @@
+import os
+import shutil
+from itertools import count
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from selenium.webdriver.chromium.options import ChromiumOptions
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities import performance_log
+from utilities.driver_context import get_context
+from utilities.file_utils import file_lock
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# user_properties written per test and summed up in the run summary
+METRICS = ("cache_warm", "cache_cold", "cache_bytes_saved", "cache_latency_saved_ms")
+
+
+class BrowserCache:
+    """
+    Shared, size-bounded HTTP disk cache for local browsers.
+
+    Every fresh driver would otherwise start with an empty cache and download the site's
+    CSS, JS, fonts and product images again. The cache lives in slot directories under
+    one root, per xdist worker or per machine. A browser holds its slot exclusively
+    (two running browsers cannot share a cache directory) and frees it on quit, so the
+    next driver starts warm. Each browser bounds its slot to max_mb; free slots are
+    deleted least recently used first while the root exceeds max_total_mb.
+
+    Per-test warm/cold counts come from the Chromium performance log.
+    """
+
+    ROOT_DIR = Path(__file__).parent.parent.parent
+    DEFAULT_DIR = ROOT_DIR / ".cache" / "browser"
+    SLOT_PREFIX = "slot-"
+    OWNER_SUFFIX = ".owner"
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        cache = config.get("browser_cache") or {}
+        self.enabled = bool(cache.get("enabled", False))
+        self.max_bytes = int(cache.get("max_mb", 256)) * 1024 * 1024
+        self.max_total_bytes = int(cache.get("max_total_mb", 1024)) * 1024 * 1024
+        self.remote = bool(config.get("remote_url"))
+
+        root = Path(cache.get("dir") or self.DEFAULT_DIR)
+        if cache.get("scope", "worker") == "worker":
+            root = root / os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.root = root
+
+    @property
+    def active(self) -> bool:
+        # A remote browser cannot use a directory on this machine
+        return self.enabled and not self.remote
+
+    # ---------- Browser Setup ----------
+
+    def configure_chromium(self, options: ChromiumOptions) -> None:
+        """Points the browser at a leased slot and enables the network performance log."""
+        if not self.active:
+            return
+        slot = self.lease()
+        options.add_argument(f"--disk-cache-dir={slot}")
+        options.add_argument(f"--disk-cache-size={self.max_bytes}")
+        vendor = options.KEY.split(":")[0]  # goog (Chrome) or ms (Edge)
+        options.set_capability(f"{vendor}:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+    def configure_firefox(self, options: FirefoxOptions) -> None:
+        if not self.active:
+            return
+        slot = self.lease()
+        options.set_preference("browser.cache.disk.enable", True)
+        options.set_preference("browser.cache.disk.parent_directory", str(slot))
+        options.set_preference("browser.cache.disk.smart_size.enabled", False)
+        options.set_preference("browser.cache.disk.capacity", self.max_bytes // 1024)  # KB
+
+    @staticmethod
+    def slot_of(options: ArgOptions) -> Optional[Path]:
+        """Returns the slot configured on the options, if any."""
+        if isinstance(options, FirefoxOptions):
+            slot = options.preferences.get("browser.cache.disk.parent_directory")
+            return Path(slot) if slot else None
+        for argument in options.arguments:
+            if argument.startswith("--disk-cache-dir="):
+                return Path(argument.split("=", 1)[1])
+        return None
+
+    def attach(self, driver: WebDriver, options: ArgOptions) -> None:
+        """
+        Ties the slot to the driver: it is released whenever the driver quits,
+        whichever fixture or pool quits it.
+        """
+        slot = self.slot_of(options)
+        if slot is None:
+            return
+        get_context(driver)["browser_cache_slot"] = slot
+        quit_driver = driver.quit
+
+        def quit_and_release() -> None:
+            try:
+                quit_driver()
+            finally:
+                self.release(slot)
+
+        driver.quit = quit_and_release
+
+    # ---------- Slots ----------
+
+    def lease(self) -> Path:
+        """Takes the first free slot, creating one when all are in use."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.root / "slots.lock"):
+            self._evict()
+            for number in count():
+                slot = self.root / f"{self.SLOT_PREFIX}{number}"
+                if self._owner(slot) is None:
+                    slot.mkdir(exist_ok=True)
+                    self._owner_file(slot).write_text(str(os.getpid()))
+                    os.utime(slot)  # recency for eviction
+                    state = "warm" if any(slot.iterdir()) else "cold"
+                    logger.info("Leased browser cache %s (%s)", slot, state)
+                    return slot
+
+    def release(self, slot: Path) -> None:
+        self._owner_file(slot).unlink(missing_ok=True)
+        logger.debug("Released browser cache %s", slot)
+
+    def _evict(self) -> None:
+        """Deletes free slots, least recently used first, until the root fits max_total_mb."""
+        slots = [path for path in self.root.glob(f"{self.SLOT_PREFIX}*") if path.is_dir()]
+        sizes = {slot: _dir_size(slot) for slot in slots}
+        total = sum(sizes.values())
+        for slot in sorted(slots, key=lambda path: path.stat().st_mtime):
+            if total <= self.max_total_bytes:
+                break
+            if self._owner(slot) is None:
+                shutil.rmtree(slot, ignore_errors=True)
+                total -= sizes[slot]
+                logger.info("Evicted browser cache %s (%.1f MB)", slot, sizes[slot] / 1024 / 1024)
+
+    def _owner(self, slot: Path) -> Optional[int]:
+        """PID of the process holding the slot; None when free or the holder is gone."""
+        try:
+            pid = int(self._owner_file(slot).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        return pid if _pid_alive(pid) else None
+
+    def _owner_file(self, slot: Path) -> Path:
+        return slot.with_name(slot.name + self.OWNER_SUFFIX)
+
+    # ---------- Per-test Metrics ----------
+
+    def begin(self, driver: WebDriver) -> None:
+        """Skips network activity from before the test (pool reuse, pre-warming)."""
+        if self.active and hasattr(driver, "execute_cdp_cmd"):
+            performance_log.read(driver, "browser_cache")
+
+    def collect(self, driver: WebDriver) -> Optional[Dict[str, int]]:
+        """
+        Splits the test's finished requests into warm (served from the disk or memory cache)
+        and cold (fetched from the network). Bytes saved are the decoded bodies of warm
+        responses; latency saved is their count times the mean cold-minus-warm load time.
+        """
+        if not (self.active and hasattr(driver, "execute_cdp_cmd")):
+            return None
+        return cache_metrics(performance_log.read(driver, "browser_cache"))
+
+
+def cache_metrics(messages: Iterable[dict]) -> Dict[str, int]:
+    """Computes the METRICS from Chromium performance log messages."""
+    requests: Dict[str, dict] = {}
+    for message in messages:
+        params = message.get("params", {})
+        request = requests.setdefault(params.get("requestId"), {"cached": False, "bytes": 0})
+        match message.get("method"):
+            case "Network.requestWillBeSent":
+                request["start"] = params.get("timestamp")
+            case "Network.requestServedFromCache":
+                request["cached"] = True
+            case "Network.responseReceived":
+                response = params.get("response", {})
+                request["cached"] |= bool(response.get("fromDiskCache") or response.get("fromPrefetchCache"))
+            case "Network.dataReceived":
+                request["bytes"] += params.get("dataLength", 0)
+            case "Network.loadingFinished":
+                request["end"] = params.get("timestamp")
+
+    finished = [request for request in requests.values() if "start" in request and "end" in request]
+    warm = [request for request in finished if request["cached"]]
+    cold = [request for request in finished if not request["cached"]]
+
+    latency_saved = 0.0
+    if warm and cold:
+        def mean_duration(group: list[dict]) -> float:
+            return sum(request["end"] - request["start"] for request in group) / len(group)
+        latency_saved = max(0.0, mean_duration(cold) - mean_duration(warm)) * len(warm)
+
+    return {
+        "cache_warm": len(warm),
+        "cache_cold": len(cold),
+        "cache_bytes_saved": sum(request["bytes"] for request in warm),
+        "cache_latency_saved_ms": round(latency_saved * 1000),
+    }
+
+
+def summarize_metrics(user_properties: Iterable[tuple[str, Any]]) -> Optional[str]:
+    """One-line run summary of the per-test cache METRICS, or None when nothing was measured."""
+    totals = dict.fromkeys(METRICS, 0)
+    for name, value in user_properties:
+        if name in totals:
+            totals[name] += value
+    requests = totals["cache_warm"] + totals["cache_cold"]
+    if not requests:
+        return None
+    return (
+        f"Browser cache: {totals['cache_warm']}/{requests} responses warm "
+        f"({totals['cache_warm'] / requests:.0%}), {totals['cache_cold']} cold; "
+        f"~{totals['cache_bytes_saved'] / 1024 / 1024:.1f} MB not downloaded, "
+        f"~{totals['cache_latency_saved_ms'] / 1000:.1f} s load time saved"
+    )
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for folder, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(folder, name))
+            except OSError:
+                pass
+    return total
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True  # signal 0 would be CTRL_C_EVENT on Windows; slots of crashed runs stay taken
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
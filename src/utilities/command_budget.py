@@ -0,0 +1,131 @@
+import sys
+import threading
+from collections import ChainMap, Counter
+from contextlib import ContextDecorator
+from typing import Any, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities.command_profiler import FIND_COMMANDS, calling_methods, describe_command, remember_elements
+from utilities.driver_context import get_context
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_installs = 0
+_original_execute = WebDriver.execute
+
+
+class CommandBudgetExceeded(AssertionError):
+    """
+    Raised when a block issues more WebDriver commands than its budget allows.
+    """
+
+    def __init__(self, budget: "command_budget") -> None:
+        super().__init__(budget.report())
+        self.budget = budget
+
+
+class command_budget(ContextDecorator):
+    """
+    Fails when the wrapped block or method issues more than `max_commands` WebDriver commands:
+
+        with command_budget(max_commands=5):
+            cart_page.snapshot()
+
+        @command_budget(max_commands=1)
+        def get_cart_product_names(self) -> list[str]: ...
+
+    Counts every command sent from the current thread by any driver (WebDriver.execute is
+    patched while a budget is active), so it works without the profiler and inside page
+    objects, components and unit checks alike. Budgets nest; each counts its own block.
+    The failure lists the commands issued, marks those beyond the budget with '+' and
+    names repeated ones, which is what per-element round trips look like.
+    """
+
+    def __init__(self, max_commands: int, label: Optional[str] = None) -> None:
+        self.max_commands = max_commands
+        self.label = label
+        self.commands: list[dict] = []
+        self._elements: dict[str, str] = {}
+
+    def __call__(self, func):
+        self.label = self.label or func.__qualname__
+        return super().__call__(func)
+
+    def __enter__(self) -> "command_budget":
+        self.commands = []
+        self._elements = {}
+        _active_budgets().append(self)
+        _install()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        _active_budgets().remove(self)
+        _uninstall()
+        if exc_type is None and len(self.commands) > self.max_commands:
+            raise CommandBudgetExceeded(self)
+        logger.debug("%s: %s of %s commands", self.label or "Block", len(self.commands), self.max_commands)
+        return False
+
+    def _recreate_cm(self):
+        # A fresh instance per decorated call, so recursion and threads keep separate counts
+        return type(self)(self.max_commands, self.label)
+
+    def report(self) -> str:
+        over = len(self.commands) - self.max_commands
+        lines = [f"{self.label or 'Block'} issued {len(self.commands)} WebDriver commands, "
+                 f"budget is {self.max_commands} ({over:+d})"]
+        for number, record in enumerate(self.commands, start=1):
+            marker = "+" if number > self.max_commands else " "
+            lines.append(f"{marker} {number:>3}  {record['command']:<22} {record['locator'] or '-':<50} "
+                         f"{record['method'] or '-'}")
+        repeated = Counter((record["command"], record["locator"]) for record in self.commands
+                           if record["locator"])
+        for (command, locator), times in repeated.most_common():
+            if times > 1:
+                lines.append(f"  repeated {times}x: {command} {locator}")
+        return "\n".join(lines)
+
+
+def _active_budgets() -> list[command_budget]:
+    if not hasattr(_local, "budgets"):
+        _local.budgets = []
+    return _local.budgets
+
+
+def _budgeted_execute(driver: WebDriver, driver_command: str, params: Optional[dict] = None) -> Any:
+    budgets = getattr(_local, "budgets", None)
+    if not budgets:
+        return _original_execute(driver, driver_command, params)
+
+    known = get_context(driver).get("profiler_elements", {})
+    method, primitive = calling_methods(sys._getframe(1))
+    for budget in budgets:
+        record = describe_command(driver_command, params, ChainMap(budget._elements, known))
+        record["method"], record["primitive"] = method, primitive
+        budget.commands.append(record)
+
+    response = _original_execute(driver, driver_command, params)
+    if driver_command in FIND_COMMANDS:
+        for budget in budgets:
+            remember_elements(budget.commands[-1]["locator"], response, budget._elements)
+    return response
+
+
+def _install() -> None:
+    global _installs
+    with _install_lock:
+        if _installs == 0:
+            WebDriver.execute = _budgeted_execute
+        _installs += 1
+
+
+def _uninstall() -> None:
+    global _installs
+    with _install_lock:
+        _installs -= 1
+        if _installs == 0:
+            WebDriver.execute = _original_execute
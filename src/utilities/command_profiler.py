@@ -0,0 +1,188 @@
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import selenium
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from utilities.driver_context import get_context
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+SRC_DIR = Path(__file__).parent.parent
+PAGE_OBJECT_DIRS = (str(SRC_DIR / "pages"), str(SRC_DIR / "components"))
+SELENIUM_DIR = str(Path(selenium.__file__).parent)
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"  # W3C web element reference
+
+FIND_COMMANDS = frozenset({
+    Command.FIND_ELEMENT, Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS,
+})
+CATEGORIES = {
+    "navigation": {Command.GET, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH},
+    "find": FIND_COMMANDS,
+    "script": {Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC},
+    "interaction": {Command.CLICK_ELEMENT, Command.SEND_KEYS_TO_ELEMENT, Command.CLEAR_ELEMENT,
+                    Command.W3C_ACTIONS, Command.W3C_CLEAR_ACTIONS},
+}
+
+
+def describe_command(command: str, params: Optional[dict], element_locators: Dict[str, str]) -> dict:
+    """Name, locator and category of a command. Element commands resolve the locator that found the element."""
+    params = params or {}
+    if command in FIND_COMMANDS:
+        locator = f"{params.get('using')}={params.get('value')}"
+    else:
+        element_id = params.get("id") or next(
+            (arg[ELEMENT_KEY] for arg in params.get("args") or () if isinstance(arg, dict) and ELEMENT_KEY in arg), None)
+        locator = element_locators.get(element_id)
+    category = next((name for name, commands in CATEGORIES.items() if command in commands), "other")
+    return {"command": command, "locator": locator, "category": category}
+
+
+def remember_elements(locator: Optional[str], response: Any, element_locators: Dict[str, str]) -> None:
+    """
+    Maps the element ids returned by a find command to its locator. Accepts raw W3C responses
+    and responses already unwrapped into WebElements by WebDriver.execute.
+    """
+    value = response.get("value") if isinstance(response, dict) else None
+    for element in value if isinstance(value, list) else [value]:
+        if isinstance(element, WebElement):
+            element_locators[element.id] = locator
+        elif isinstance(element, dict) and ELEMENT_KEY in element:
+            element_locators[element[ELEMENT_KEY]] = locator
+
+
+def calling_methods(frame) -> tuple[Optional[str], Optional[str]]:
+    """
+    Returns (method, primitive) for a command issued at `frame`: the outermost page-object or
+    component method on the stack (what the test called, e.g. CartPage.snapshot) and the
+    innermost public one (e.g. BasePage.find_visible). Commands issued outside page objects are
+    attributed to the first caller outside Selenium (e.g. a fixture).
+    """
+    method = primitive = fallback = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(PAGE_OBJECT_DIRS):
+            method = _frame_name(frame)
+            if primitive is None and not frame.f_code.co_name.startswith(("_", "<")):
+                primitive = method
+        elif method is not None:
+            break  # left the page objects: method is the outermost one
+        elif fallback is None and not filename.startswith(SELENIUM_DIR):
+            fallback = _frame_name(frame)
+        frame = frame.f_back
+    if method is None:
+        return fallback, fallback
+    return method, primitive or method
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)  # co_qualname needs Python 3.11
+    if "." not in name and "self" in frame.f_locals:
+        name = f"{type(frame.f_locals['self']).__name__}.{name}"
+    return name
+
+
+class CommandProfiler:
+    """
+    Opt-in WebDriver command profiler ('profiler' in config).
+
+    Wraps the command executor of every driver built by WebDriverFactory and records each
+    command: name, locator, wire latency (the HTTP round trip to the driver) and the
+    page-object method that issued it. Per test, the driver fixture gets a summary: command
+    count, wire time against wall time (the rest is Python and wait sleeps), time per
+    command category, the slowest commands and the page-object methods with the most
+    wire time. It is attached to Allure and written to <dir>/<test id>.json.
+    """
+
+    ROOT_DIR = Path(__file__).parent.parent.parent
+    DEFAULT_DIR = ROOT_DIR / "reports" / "profiles"
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        profiler = config.get("profiler") or {}
+        self.enabled = bool(profiler.get("enabled", False))
+        self.slowest = int(profiler.get("slowest", 10))
+        self.top_methods = int(profiler.get("top_methods", 10))
+        self.directory = Path(profiler.get("dir") or self.DEFAULT_DIR)
+
+    def attach(self, driver: WebDriver) -> None:
+        """Wraps the driver's command executor; commands are recorded from now on."""
+        if not self.enabled:
+            return
+        context = get_context(driver)
+        executor = driver.command_executor
+        execute = executor.execute
+
+        def profiled_execute(command: str, params: Optional[dict] = None) -> Any:
+            element_locators = context.setdefault("profiler_elements", {})
+            record = describe_command(command, params, element_locators)
+            record["method"], record["primitive"] = calling_methods(sys._getframe(1))
+            started = time.perf_counter()
+            try:
+                response = execute(command, params)
+            finally:
+                record["seconds"] = round(time.perf_counter() - started, 4)
+                context.setdefault("profiler_commands", []).append(record)
+            if command in FIND_COMMANDS:
+                remember_elements(record["locator"], response, element_locators)
+            return response
+
+        executor.execute = profiled_execute
+
+    def begin(self, driver: WebDriver) -> None:
+        """Drops commands issued before the test (driver start, pool reset)."""
+        context = get_context(driver)
+        context["profiler_commands"] = []
+        context["profiler_elements"] = {}
+        context["profiler_started"] = time.perf_counter()
+
+    def collect(self, driver: WebDriver, test_id: str) -> Optional[dict]:
+        """Summarizes the test's commands and writes the JSON profile."""
+        context = get_context(driver)
+        if not self.enabled or "profiler_started" not in context:
+            return None
+        records = context.get("profiler_commands", [])
+        wall = time.perf_counter() - context["profiler_started"]
+        wire = sum(record["seconds"] for record in records)
+
+        categories: Dict[str, dict] = defaultdict(lambda: {"commands": 0, "seconds": 0.0})
+        methods: Dict[str, dict] = defaultdict(lambda: {"commands": 0, "seconds": 0.0})
+        for record in records:
+            for group in (categories[record["category"]], methods[record["method"] or "(unknown)"]):
+                group["commands"] += 1
+                group["seconds"] += record["seconds"]
+
+        def rounded(groups: Dict[str, dict]) -> Dict[str, dict]:
+            return {name: {**group, "seconds": round(group["seconds"], 3)} for name, group in groups.items()}
+
+        profile = {
+            "test": test_id,
+            "commands": len(records),
+            "wall_seconds": round(wall, 3),
+            "wire_seconds": round(wire, 3),
+            "other_seconds": round(max(0.0, wall - wire), 3),
+            "categories": rounded(categories),
+            "slowest": sorted(records, key=lambda record: record["seconds"], reverse=True)[:self.slowest],
+            "top_methods": [
+                {"method": name, **group} for name, group in sorted(
+                    rounded(methods).items(), key=lambda item: item[1]["seconds"], reverse=True)[:self.top_methods]
+            ],
+            "log": records,
+        }
+        self._write(profile)
+        return profile
+
+    def _write(self, profile: dict) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / (re.sub(r"[^\w.-]+", "_", profile["test"]).strip("_") + ".json")
+        path.write_text(json.dumps(profile, indent=2), encoding="utf-8")
+        logger.debug("Command profile written to %s", path)
+        return path
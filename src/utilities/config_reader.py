@@ -26,7 +26,8 @@ class ConfigReader:
     @lru_cache(maxsize=1)
     def get_config(self) -> dict:
         """
-        Loads base config and merges it with environment-specific overrides.
+        Loads base config and merges it with environment-specific overrides, then with the
+        file named by TEST_CONFIG_OVERRIDES when set.
         """
         logger.info("Loading base configuration from: %s", self.BASE_CONFIG_PATH)
         config = self._load_yaml(self.BASE_CONFIG_PATH)
@@ -40,6 +41,12 @@ class ConfigReader:
         else:
             logger.warning("Environment file %s not found. Using base config.", env_file_path)
 
+        # Merged last: a YAML file for one run (e.g. each mode of the scenario benchmark)
+        override_path = os.environ.get("TEST_CONFIG_OVERRIDES")
+        if override_path:
+            logger.info("Merging run overrides from: %s", override_path)
+            config = self._merge_dicts(config, self._load_yaml(Path(override_path)))
+
         return config
 
     @staticmethod
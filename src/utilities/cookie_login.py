@@ -0,0 +1,141 @@
+import re
+import threading
+from typing import Dict, Optional
+
+import requests
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LoginFailed(Exception):
+    """
+    Raised when the HTTP login does not yield an authenticated session.
+    """
+
+
+class CookieLogin:
+    """
+    Logs a user in over HTTP (csrf token from GET /login, then POST /login) and injects
+    the resulting session cookies into a WebDriver, skipping the login form entirely.
+    Cookies are cached per user for the whole run.
+    """
+
+    REQUEST_TIMEOUT = 15
+    SESSION_COOKIE = "sessionid"
+    CSRF_PATTERN = re.compile(r'name=["\']csrfmiddlewaretoken["\']\s+value=["\']([^"\']+)["\']')
+    # Cheap same-origin document that lets WebDriver add cookies when CDP is unavailable
+    LANDING_PATH = "/favicon.ico"
+
+    def __init__(self, base_url: str, timeout: float = REQUEST_TIMEOUT) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._cookies: Dict[str, list[dict]] = {}
+        self._lock = threading.Lock()
+
+    # ---------- Session Cookies ----------
+
+    def cookies_for(self, email: str, password: str) -> list[dict]:
+        """
+        Returns the session cookies of the user, logging in over HTTP on first use.
+        """
+        with self._lock:
+            cached = self._cookies.get(email)
+        if cached is not None:
+            return cached
+
+        cookies = self._authenticate(email, password)
+        with self._lock:
+            self._cookies[email] = cookies
+        return cookies
+
+    def http_session(self, email: str, password: str) -> requests.Session:
+        """
+        Returns a requests session authenticated as the user (same cached cookies).
+        """
+        session = requests.Session()
+        for cookie in self.cookies_for(email, password):
+            session.cookies.set(cookie["name"], cookie["value"], path=cookie["path"])
+        return session
+
+    def forget(self, email: str) -> None:
+        """
+        Drops cached cookies, e.g. after the site rejected the injected session.
+        """
+        with self._lock:
+            self._cookies.pop(email, None)
+
+    def _authenticate(self, email: str, password: str) -> list[dict]:
+        login_url = f"{self.base_url}/login"
+        with requests.Session() as session:
+            page = session.get(login_url, timeout=self.timeout)
+            page.raise_for_status()
+            match = self.CSRF_PATTERN.search(page.text)
+            if not match:
+                raise LoginFailed("csrf token not found on /login")
+
+            response = session.post(
+                login_url,
+                data={"csrfmiddlewaretoken": match.group(1), "email": email, "password": password},
+                headers={"Referer": login_url},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            if self.SESSION_COOKIE not in session.cookies:
+                raise LoginFailed(f"no session cookie issued for {email}")
+
+            logger.info("Logged in over HTTP as %s", email)
+            return [
+                {
+                    "name": cookie.name,
+                    "value": cookie.value,
+                    "path": cookie.path or "/",
+                    "secure": bool(cookie.secure),
+                    "expiry": cookie.expires,
+                }
+                for cookie in session.cookies
+            ]
+
+    # ---------- Driver Injection ----------
+
+    def inject(self, driver: WebDriver, cookies: list[dict]) -> None:
+        """
+        Adds the cookies to the browser. Chromium uses CDP, which needs no page load;
+        other browsers must first be on the site's origin for add_cookie.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            for cookie in cookies:
+                params = {
+                    "name": cookie["name"],
+                    "value": cookie["value"],
+                    "url": f"{self.base_url}/",
+                    "path": cookie["path"],
+                    "secure": cookie["secure"],
+                }
+                if cookie["expiry"]:
+                    params["expires"] = cookie["expiry"]
+                driver.execute_cdp_cmd("Network.setCookie", params)
+            return
+
+        if not driver.current_url.startswith(self.base_url):
+            driver.get(f"{self.base_url}{self.LANDING_PATH}")
+        for cookie in cookies:
+            # Host-only cookies: no domain, so WebDriver scopes them to the current host
+            driver.add_cookie({key: value for key, value in cookie.items() if value is not None})
+
+    def clear(self, driver: WebDriver) -> None:
+        driver.delete_all_cookies()
+
+
+def load_cookie_login(config: dict) -> Optional[CookieLogin]:
+    """
+    Returns a CookieLogin when 'login.mode' is 'cookie' (default), otherwise None.
+    """
+    mode = ((config.get("login") or {}).get("mode") or "cookie").lower()
+    if mode == "ui":
+        return None
+    if mode != "cookie":
+        raise ValueError(f"Unsupported login mode: {mode}")
+    return CookieLogin(config["base_url"])
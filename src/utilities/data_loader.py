@@ -16,14 +16,14 @@ class DataLoader:
     def load_yaml(file_name: str) -> dict:
         file_path = DataLoader.DATA_DIR / file_name
 
-        logger.info(f"--- Loading data from: {file_path}")
+        logger.info("--- Loading data from: %s", file_path)
 
         if not file_path.exists():
             alternative_path = DataLoader.SRC_DIR.parent / "test_data" / file_name
             if alternative_path.exists():
                 file_path = alternative_path
             else:
-                logger.error(f"--- File NOT FOUND at: {file_path}")
+                logger.error("--- File NOT FOUND at: %s", file_path)
                 return {}
 
         try:
@@ -31,7 +31,7 @@ class DataLoader:
                 content = yaml.safe_load(f)
                 return content if content else {}
         except Exception as e:
-            logger.error(f"--- Failed to parse YAML: {e}")
+            logger.error("--- Failed to parse YAML: %s", e)
             return {}
 
     @classmethod
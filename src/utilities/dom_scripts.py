@@ -0,0 +1,152 @@
+from typing import Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+# Locator strategies the in-page scripts can evaluate themselves.
+# Link text strategies are left to the WebDriver-side polling backend.
+_DOM_STRATEGIES = {
+    By.CSS_SELECTOR: "css",
+    By.XPATH: "xpath",
+    By.ID: "id",
+    By.NAME: "name",
+    By.CLASS_NAME: "class",
+    By.TAG_NAME: "tag",
+}
+
+# Shared by every in-page script: resolves a (strategy, value) pair to DOM elements.
+QUERY_JS = """
+function __query(strategy, value) {
+  switch (strategy) {
+    case 'css': return Array.from(document.querySelectorAll(value));
+    case 'id': return Array.from(document.querySelectorAll('[id=' + JSON.stringify(value) + ']'));
+    case 'name': return Array.from(document.getElementsByName(value));
+    case 'class': return Array.from(document.getElementsByClassName(value));
+    case 'tag': return Array.from(document.getElementsByTagName(value));
+    case 'xpath':
+      var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      var nodes = [];
+      for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+      return nodes;
+  }
+  throw new Error('Unsupported locator strategy: ' + strategy);
+}
+"""
+
+# Resolves the callback as soon as the condition holds, re-checking on every DOM mutation,
+# CSS transition/animation end and a short in-page interval (no WebDriver round trips).
+# Arguments: strategy, value, condition, timeout_ms, callback.
+# Result: the element (present/visible/clickable), true (invisible), or null on timeout.
+OBSERVER_JS = QUERY_JS + """
+var strategy = arguments[0], value = arguments[1], condition = arguments[2],
+    timeoutMs = arguments[3], done = arguments[arguments.length - 1];
+
+function isVisible(el) {
+  if (!el || !el.isConnected) return false;
+  var rect = el.getBoundingClientRect();
+  if (rect.width <= 0 || rect.height <= 0) return false;
+  var style = window.getComputedStyle(el);
+  if (style.visibility === 'hidden' || style.visibility === 'collapse') return false;
+  for (var node = el; node && node !== document.documentElement; node = node.parentElement) {
+    var nodeStyle = window.getComputedStyle(node);
+    if (nodeStyle.opacity === '0') return false;
+    if (node !== el && nodeStyle.overflow !== 'visible') {
+      var clip = node.getBoundingClientRect();
+      if (rect.right <= clip.left || rect.left >= clip.right ||
+          rect.bottom <= clip.top || rect.top >= clip.bottom) return false;
+    }
+  }
+  return true;
+}
+
+function evaluate() {
+  var el = null;
+  if (strategy) {
+    var found = __query(strategy, value);
+    el = found.length ? found[0] : null;
+  }
+  switch (condition) {
+    case 'present': return el;
+    case 'visible': return isVisible(el) ? el : null;
+    case 'clickable': return (isVisible(el) && !el.disabled) ? el : null;
+    case 'invisible': return isVisible(el) ? null : true;
+  }
+  throw new Error('Unsupported wait condition: ' + condition);
+}
+
+var finished = false, observer = null, interval = null, timer = null;
+function finish(result) {
+  if (finished) return;
+  finished = true;
+  if (observer) observer.disconnect();
+  clearInterval(interval);
+  clearTimeout(timer);
+  document.removeEventListener('transitionend', check, true);
+  document.removeEventListener('animationend', check, true);
+  done(result);
+}
+function check() {
+  var result = evaluate();
+  if (result) finish(result);
+}
+
+check();
+if (!finished) {
+  observer = new MutationObserver(check);
+  observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+  document.addEventListener('transitionend', check, true);
+  document.addEventListener('animationend', check, true);
+  interval = setInterval(check, 50);
+  timer = setTimeout(function () { finish(null); }, timeoutMs);
+}
+"""
+
+# Bulk extraction: one script execution for all matching elements.
+# Text mirrors WebDriver's visible text: elements that are not rendered yield "".
+# Arguments: strategy, value. Result: list of strings.
+TEXTS_JS = QUERY_JS + """
+return __query(arguments[0], arguments[1]).map(function (el) {
+  return el.getClientRects().length ? (el.innerText || '').trim() : '';
+});
+"""
+
+# Arguments: strategy, value, attribute names. Result: list of {name: value} objects (raw attribute values).
+ATTRIBUTES_JS = QUERY_JS + """
+var names = arguments[2];
+return __query(arguments[0], arguments[1]).map(function (el) {
+  var values = {};
+  names.forEach(function (name) { values[name] = el.getAttribute(name); });
+  return values;
+});
+"""
+
+# Cart table (CartPage.snapshot) in one script execution. No arguments.
+# Result: one {product_id, name, price, quantity, total} object of strings per product row,
+# null while the table is not rendered.
+CART_SNAPSHOT_JS = """
+var table = document.getElementById('cart_info_table');
+if (!table) return null;
+return Array.from(table.querySelectorAll("tbody tr[id^='product-']")).map(function (row) {
+  function text(selector) {
+    var el = row.querySelector(selector);
+    return el ? el.textContent.trim() : '';
+  }
+  return {
+    product_id: row.id.replace('product-', ''),
+    name: text('td.cart_description h4 a'),
+    price: text('td.cart_price'),
+    quantity: text('td.cart_quantity button'),
+    total: text('td.cart_total')
+  };
+});
+"""
+
+
+def to_dom_locator(locator: Tuple[str, str]) -> Optional[Tuple[str, str]]:
+    """
+    Maps a Selenium locator to the (strategy, value) pair understood by the in-page scripts.
+    Returns None when the strategy can only be evaluated by WebDriver itself.
+    """
+    by, value = locator
+    strategy = _DOM_STRATEGIES.get(by)
+    return (strategy, value) if strategy else None
+
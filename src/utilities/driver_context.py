@@ -0,0 +1,42 @@
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+_CONTEXT_ATTR = "_framework_context"
+
+
+def get_context(driver: WebDriver) -> dict[str, Any]:
+    """
+    Returns the per-driver state shared by pages, components and fixtures
+    (wait statistics, caches, ...). The dict lives on the driver object itself,
+    so it is released together with the driver.
+    """
+    context = getattr(driver, _CONTEXT_ATTR, None)
+    if context is None:
+        context = {}
+        setattr(driver, _CONTEXT_ATTR, context)
+    return context
+
+
+def clear_context(driver: WebDriver) -> None:
+    """
+    Drops all per-driver state, e.g. when a pooled driver is handed to the next test.
+    """
+    get_context(driver).clear()
+
+
+def mark_navigation(driver: WebDriver) -> int:
+    """
+    Bumps the navigation counter of the driver. Called after every action that may
+    load a new document (clicks, driver.get, accepted alerts).
+    """
+    context = get_context(driver)
+    context["navigation_epoch"] = context.get("navigation_epoch", 0) + 1
+    return context["navigation_epoch"]
+
+
+def navigation_epoch(driver: WebDriver) -> int:
+    """
+    Returns the navigation counter; caches keyed to it are stale once it changes.
+    """
+    return get_context(driver).get("navigation_epoch", 0)
@@ -0,0 +1,316 @@
+import queue
+import threading
+from collections import Counter
+from typing import Any, Callable, Iterable, Optional
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities.driver_context import clear_context, get_context
+from utilities.logger import get_logger
+from utilities.webdriver_factory import WebDriverFactory
+
+logger = get_logger(__name__)
+
+# How PrewarmPool.checkout served a test, stored in the driver context and kept as per-test user_properties:
+# hit (spare ready), miss (waited for or launched a browser), fresh (launched with the test's download directory)
+CHECKOUTS = ("hit", "miss", "fresh")
+
+
+class DriverPool:
+    """
+    Keeps live WebDriver sessions for reuse across tests within one process.
+    Each pytest-xdist worker is its own process, so every worker owns its own pool.
+    New browsers come from the optional PrewarmPool spawner when one is configured.
+    """
+
+    BLANK_PAGE = "about:blank"
+
+    def __init__(self, factory: WebDriverFactory, size: int = 1, spawner: Optional["PrewarmPool"] = None) -> None:
+        self.factory = factory
+        self.size = max(1, size)
+        self.spawner = spawner
+        self._idle: list[WebDriver] = []
+        self._lock = threading.Lock()
+        logger.info("DriverPool initialized with size=%s", self.size)
+
+    # ---------- Checkout / Return ----------
+
+    def acquire(self, download_dir: Optional[str] = None) -> WebDriver:
+        """
+        Returns a live driver from the pool, or starts a new one when none is idle.
+        A browser that cannot redirect downloads at runtime stays idle when the test
+        needs `download_dir`; a new one is started with that directory instead.
+        """
+        driver = self._take_idle()
+        if driver is not None and download_dir and not WebDriverFactory.can_redirect_downloads(driver):
+            logger.info("Idle %s cannot redirect downloads, starting a new browser for %s", driver.name, download_dir)
+            self._keep_idle(driver)
+            driver = None
+        if driver is None:
+            if self.spawner:
+                return self.spawner.checkout(download_dir)
+            logger.info("No idle driver in pool, starting a new browser")
+            return self._create(download_dir)
+
+        if download_dir:
+            WebDriverFactory.set_download_dir(driver, download_dir)
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Resets the driver state and returns it to the pool.
+        Falls back to a full restart (quit now, launch on next acquire) when the reset fails.
+        """
+        clear_context(driver)
+        if not self.reset_state(driver):
+            logger.warning("Driver reset failed, discarding session for a full restart")
+            self._discard(driver)
+            return
+
+        self._keep_idle(driver)
+
+    def close(self) -> None:
+        """
+        Quits all idle drivers. Called once at the end of the session.
+        """
+        with self._lock:
+            drivers, self._idle = self._idle, []
+        for driver in drivers:
+            self._discard(driver)
+        logger.info("DriverPool closed (%s drivers quit)", len(drivers))
+
+    # ---------- State Reset ----------
+
+    @classmethod
+    def reset_state(cls, driver: WebDriver) -> bool:
+        """
+        Brings a used driver back to a clean state: no alert, a single window,
+        empty cookies and web storage, parked on about:blank.
+        """
+        try:
+            try:
+                driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                pass
+
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            cls._clear_cookies(driver)
+            driver.get(cls.BLANK_PAGE)
+            return True
+        except WebDriverException as e:
+            logger.warning("Driver state reset failed: %s", e)
+            return False
+
+    @staticmethod
+    def _clear_cookies(driver: WebDriver) -> None:
+        # WebDriver only deletes cookies of the current domain; CDP clears every domain on Chromium
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+
+    # ---------- Internal Helpers ----------
+
+    def _take_idle(self) -> Optional[WebDriver]:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                driver = self._idle.pop()
+            if _is_alive(driver):
+                return driver
+            logger.warning("Idle driver is no longer responsive, discarding it")
+            self._discard(driver)
+
+    def _keep_idle(self, driver: WebDriver) -> None:
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(driver)
+                return
+        self._discard(driver)
+
+    def _create(self, download_dir: Optional[str] = None) -> WebDriver:
+        factory = WebDriverFactory(self.factory.config, download_dir) if download_dir else self.factory
+        driver = factory.get_driver()
+        WebDriverFactory.maximize_window(driver)
+        return driver
+
+    @staticmethod
+    def _discard(driver: WebDriver) -> None:
+        _quit(driver)
+
+
+class PrewarmPool:
+    """
+    Keeps spare drivers launched on a background thread so a test can check out
+    a ready browser instead of paying the cold-start latency itself.
+    `create(download_dir=None)` launches one browser.
+    """
+
+    def __init__(self, create: Callable[..., WebDriver], size: int = 1) -> None:
+        self.size = max(1, size)
+        self.checkouts: Counter = Counter()  # per CHECKOUTS kind; guarded by _cond, tests check out concurrently
+        self._create = create
+        self._ready: "queue.Queue[WebDriver]" = queue.Queue()
+        self._in_flight = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._spawn_loop, name="driver-prewarm", daemon=True)
+        self._thread.start()
+        logger.info("PrewarmPool started with size=%s", self.size)
+
+    # ---------- Checkout ----------
+
+    def checkout(self, download_dir: Optional[str] = None) -> WebDriver:
+        """
+        Returns a prewarmed driver when one is ready (hit); otherwise waits for the
+        browser already being launched, or launches one in the caller thread (miss).
+        When the test needs `download_dir` and spares of this browser cannot redirect
+        downloads at runtime, the spare is kept and a browser is launched with that
+        directory (fresh).
+        """
+        driver = self._take_ready()
+        if driver is not None and download_dir and not WebDriverFactory.can_redirect_downloads(driver):
+            logger.info("Spare %s cannot redirect downloads, starting a new browser for %s", driver.name, download_dir)
+            self._ready.put(driver)
+            checkout = "fresh"
+            driver = self._create(download_dir)
+        elif driver is not None:
+            checkout = "hit"
+        else:
+            checkout = "miss"
+            driver = self._wait_or_create(download_dir)
+
+        with self._cond:
+            self.checkouts[checkout] += 1
+            self._cond.notify()
+        get_context(driver)["prewarm_checkout"] = checkout
+
+        if download_dir and WebDriverFactory.can_redirect_downloads(driver):
+            WebDriverFactory.set_download_dir(driver, download_dir)
+        return driver
+
+    def stats(self) -> dict:
+        """Checkout counters of this process, used to size the pool."""
+        with self._cond:
+            counts = {kind: self.checkouts[kind] for kind in CHECKOUTS}
+        total = sum(counts.values())
+        return {
+            "size": self.size,
+            **counts,
+            "hit_rate": round(counts["hit"] / total, 3) if total else None,
+        }
+
+    def close(self) -> None:
+        """
+        Stops the spawner thread and quits every spare driver.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout=60)
+
+        while True:
+            try:
+                _quit(self._ready.get_nowait())
+            except queue.Empty:
+                break
+        logger.info("PrewarmPool closed, stats: %s", self.stats())
+
+    # ---------- Internal Helpers ----------
+
+    def _take_ready(self) -> Optional[WebDriver]:
+        while True:
+            try:
+                driver = self._ready.get_nowait()
+            except queue.Empty:
+                return None
+            if _is_alive(driver):
+                return driver
+            logger.warning("Prewarmed driver is no longer responsive, discarding it")
+            _quit(driver)
+
+    def _wait_or_create(self, download_dir: Optional[str] = None) -> WebDriver:
+        with self._cond:
+            in_flight = self._in_flight > 0
+        if in_flight:
+            try:
+                # A launch already in progress finishes sooner than a new cold start
+                driver = self._ready.get(timeout=60)
+                if not _is_alive(driver):
+                    _quit(driver)
+                elif download_dir and not WebDriverFactory.can_redirect_downloads(driver):
+                    self._ready.put(driver)
+                else:
+                    return driver
+            except queue.Empty:
+                pass
+        return self._create(download_dir)
+
+    def _spawn_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and self._ready.qsize() + self._in_flight >= self.size:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                self._in_flight += 1
+
+            driver = None
+            try:
+                driver = self._create()
+            except Exception as e:
+                logger.error("Prewarm failed to start a browser: %s", e)
+
+            with self._cond:
+                self._in_flight -= 1
+                closed = self._closed
+            if driver is None:
+                if closed:
+                    return
+                # Back off so a broken browser setup does not spin
+                with self._cond:
+                    self._cond.wait(timeout=5)
+            elif closed:
+                _quit(driver)
+            else:
+                self._ready.put(driver)
+
+
+def summarize_checkouts(user_properties: Iterable[tuple[str, Any]]) -> Optional[str]:
+    """One-line run summary of the per-test prewarm checkouts, or None when no test used a spare pool."""
+    totals = {kind: 0 for kind in CHECKOUTS}
+    for name, value in user_properties:
+        if name.startswith("prewarm_") and name[len("prewarm_"):] in totals:
+            totals[name[len("prewarm_"):]] += value
+    checkouts = sum(totals.values())
+    if not checkouts:
+        return None
+    return (
+        f"Driver prewarm: {totals['hit']}/{checkouts} checkouts hit a ready spare ({totals['hit'] / checkouts:.0%}), "
+        f"{totals['miss']} missed, {totals['fresh']} launched with a download directory"
+    )
+
+
+def _is_alive(driver: WebDriver) -> bool:
+    try:
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+
+def _quit(driver: WebDriver) -> None:
+    try:
+        driver.quit()
+    except WebDriverException as e:
+        logger.debug("Ignoring error while quitting driver: %s", e)
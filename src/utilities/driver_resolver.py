@@ -0,0 +1,168 @@
+import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+from utilities.file_utils import atomic_write_json, file_lock, read_json
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+_offline_lock = threading.Lock()
+
+
+class DriverResolver:
+    """
+    Resolves the driver binary (chromedriver, geckodriver, msedgedriver) for a local browser.
+
+    Modes (config key 'driver_resolution.mode'):
+        cache   - reuse the path recorded in a local manifest for the installed browser version,
+                  calling webdriver-manager only the first time (default)
+        manager - always ask webdriver-manager (version lookup on every driver creation)
+        offline - never touch the network: pinned path from config, then the manifest,
+                  then Selenium Manager in offline mode
+    """
+
+    ROOT_DIR = Path(__file__).parent.parent.parent
+    DEFAULT_MANIFEST = ROOT_DIR / ".driver_cache" / "manifest.json"
+
+    MANAGERS = {
+        "chrome": ChromeDriverManager,
+        "firefox": GeckoDriverManager,
+        "edge": EdgeChromiumDriverManager,
+    }
+    BROWSER_TYPES = {
+        "chrome": ChromeType.GOOGLE,
+        "firefox": "firefox",
+        "edge": ChromeType.MSEDGE,
+    }
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        resolution = config.get("driver_resolution") or {}
+        self.mode = resolution.get("mode", "cache").lower()
+        self.pinned_paths = resolution.get("paths") or {}
+        self.manifest_path = Path(resolution.get("manifest") or self.DEFAULT_MANIFEST)
+        self.lock_path = self.manifest_path.with_suffix(".lock")
+
+    def resolve(self, browser: str) -> Optional[str]:
+        """
+        Returns the driver executable path for the browser.
+        None means "let Selenium Manager find it".
+        """
+        match self.mode:
+            case "manager":
+                return self._install(browser)
+            case "offline":
+                return self._resolve_offline(browser)
+            case "cache":
+                return self._resolve_cached(browser)
+            case _:
+                raise ValueError(f"Unsupported driver resolution mode: {self.mode}")
+
+    # ---------- Modes ----------
+
+    def _resolve_cached(self, browser: str) -> str:
+        key = self._manifest_key(browser)
+        if key is None:
+            # Without a version an entry would outlive browser upgrades; ask the manager every time
+            logger.info("Could not detect the %s version, resolving the driver without the manifest", browser)
+            return self._install(browser)
+        path = self._lookup(key)
+        if path:
+            logger.debug("Driver for %s resolved from manifest: %s", key, path)
+            return path
+
+        # Only one xdist worker installs; the others wait and then read its manifest entry
+        with file_lock(self.lock_path):
+            path = self._lookup(key)
+            if path:
+                return path
+            path = self._install(browser)
+            manifest = read_json(self.manifest_path, default={})
+            manifest[key] = path
+            atomic_write_json(self.manifest_path, manifest)
+            logger.info("Recorded driver for %s in manifest: %s", key, path)
+            return path
+
+    def _resolve_offline(self, browser: str) -> Optional[str]:
+        pinned = self.pinned_paths.get(browser)
+        if pinned:
+            if not Path(pinned).is_file():
+                raise FileNotFoundError(f"Pinned {browser} driver not found at: {pinned}")
+            return str(pinned)
+
+        key = self._manifest_key(browser)
+        path = self._lookup(key) if key else None
+        if path:
+            return path
+
+        logger.info("No cached %s driver, falling back to Selenium Manager (offline)", browser)
+        return None
+
+    @contextmanager
+    def driver_start(self, driver_path: Optional[str]) -> Iterator[None]:
+        """
+        Wraps the start of a local driver. When offline mode left the lookup to Selenium
+        Manager (no driver path), SE_OFFLINE is set for this start only and then restored,
+        so it never reaches later lookups or child processes.
+        """
+        if self.mode != "offline" or driver_path is not None:
+            yield
+            return
+        # Selenium Manager reads it from the process environment; starts that need it take turns
+        with _offline_lock:
+            previous = os.environ.get("SE_OFFLINE")
+            os.environ["SE_OFFLINE"] = "true"
+            try:
+                yield
+            finally:
+                if previous is None:
+                    os.environ.pop("SE_OFFLINE", None)
+                else:
+                    os.environ["SE_OFFLINE"] = previous
+
+    # ---------- Helpers ----------
+
+    def _install(self, browser: str) -> str:
+        manager = self.MANAGERS.get(browser)
+        if manager is None:
+            raise ValueError(f"Unsupported browser: {browser}")
+        return manager().install()
+
+    def _lookup(self, key: str) -> Optional[str]:
+        manifest = read_json(self.manifest_path, default={})
+        path = manifest.get(key)
+        if path and Path(path).is_file():
+            return path
+        return None
+
+    def _manifest_key(self, browser: str) -> Optional[str]:
+        """Manifest entry for the installed browser version; None when the version is unknown."""
+        version = self._browser_version(browser)
+        return f"{browser}-{version}" if version else None
+
+    @classmethod
+    def _browser_version(cls, browser: str) -> Optional[str]:
+        return _installed_browser_version(cls.BROWSER_TYPES.get(browser))
+
+
+@lru_cache(maxsize=None)
+def _installed_browser_version(browser_type: Optional[str]) -> Optional[str]:
+    """
+    Reads the installed browser version from the OS (local command, no network).
+    Cached per process since it does not change during a run.
+    """
+    if browser_type is None:
+        return None
+    try:
+        return OperationSystemManager().get_browser_version_from_os(browser_type)
+    except Exception as e:
+        logger.debug("Could not detect %s version: %s", browser_type, e)
+        return None
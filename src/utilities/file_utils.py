@@ -1,7 +1,10 @@
+import json
 import os
+import tempfile
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional, Union
 
 from utilities.logger import get_logger
 
@@ -21,7 +24,7 @@ def wait_for_file_download(
     :param timeout: Maximum time to wait in seconds.
     :return: The absolute path to the file if found, otherwise None.
     """
-    logger.info(f"Waiting for file containing '{filename_contains}' in {directory}")
+    logger.info("Waiting for file containing '%s' in %s", filename_contains, directory)
     end_time = time.time() + timeout
 
     # Common temporary extensions for browsers
@@ -37,19 +40,82 @@ def wait_for_file_download(
                     extension = Path(file_path).suffix
 
                     if extension not in temp_extensions:
-                        logger.info(f"File downloaded successfully: {file}")
+                        logger.info("File downloaded successfully: %s", file)
                         return file_path
 
             # Polling interval
             time.sleep(1)
         except OSError as e:
-            logger.debug(f"Error reading directory: {e}")
+            logger.debug("Error reading directory: %s", e)
             time.sleep(1)
 
-    logger.info(f"File download timeout after {timeout}s for '{filename_contains}'")
+    logger.info("File download timeout after %ss for '%s'", timeout, filename_contains)
     return None
 
 
 def get_file_size(file_path: str) -> int:
     """Returns the size of the file in bytes."""
     return os.path.getsize(file_path) if os.path.exists(file_path) else 0
+
+
+@contextmanager
+def file_lock(lock_path: Union[str, Path], timeout: float = 120, stale_after: float = 300) -> Iterator[None]:
+    """
+    Cross-process lock based on exclusive creation of a lock file.
+    Safe to use between pytest-xdist workers on the same machine.
+
+    :param lock_path: Path of the lock file to create.
+    :param timeout: Maximum time to wait for the lock in seconds.
+    :param stale_after: Age in seconds after which a leftover lock file is considered abandoned.
+    """
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    end_time = time.time() + timeout
+
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > stale_after:
+                    logger.warning("Removing stale lock file: %s", lock_path)
+                    lock_path.unlink(missing_ok=True)
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.time() > end_time:
+                raise TimeoutError(f"Could not acquire lock {lock_path} within {timeout}s")
+            time.sleep(0.1)
+
+    try:
+        yield
+    finally:
+        lock_path.unlink(missing_ok=True)
+
+
+def read_json(file_path: Union[str, Path], default: Any = None) -> Any:
+    """Reads a JSON file, returning default when it is missing or unreadable."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def atomic_write_json(file_path: Union[str, Path], data: Any) -> None:
+    """
+    Writes JSON through a temp file + rename so readers never observe a partial file.
+    """
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,234 @@
+import base64
+import hashlib
+import json
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from utilities.file_utils import atomic_write_json, read_json
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Form fields that change on every run and must not affect request matching
+VOLATILE_FIELDS = frozenset({"csrfmiddlewaretoken"})
+
+
+def request_key(method: str, url: str) -> str:
+    """Loose match key: method + URL without query string."""
+    parts = urlsplit(url)
+    return f"{method.upper()} {parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def request_fingerprint(method: str, url: str, body: bytes = b"", content_type: str = "") -> str:
+    """
+    Exact match key of a request: method, URL (query parameters sorted) and body.
+    Form bodies are compared field by field without VOLATILE_FIELDS, and multipart
+    bodies without their random boundary, so a replayed POST matches its recording.
+    """
+    parts = urlsplit(url)
+    query = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    content_type = content_type.lower()
+
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        fields = parse_qsl(body.decode("utf-8", errors="replace"), keep_blank_values=True)
+        normalized = json.dumps(sorted(field for field in fields if field[0] not in VOLATILE_FIELDS))
+    elif content_type.startswith("multipart/form-data") and "boundary=" in content_type:
+        boundary = content_type.split("boundary=", 1)[1].split(";")[0].strip('"')
+        normalized = hashlib.sha1(body.replace(boundary.encode(), b"")).hexdigest()
+    else:
+        normalized = hashlib.sha1(body).hexdigest()
+
+    key = json.dumps([method.upper(), f"{parts.scheme}://{parts.netloc}{parts.path}", query, normalized])
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def build_entry(method: str, url: str, request_headers: list[tuple[str, str]], request_body: bytes,
+                status: int, reason: str, response_headers: list[tuple[str, str]], response_body: bytes,
+                started: float, elapsed: float) -> dict:
+    """
+    Builds a HAR 1.2 entry. Bodies are stored base64-encoded, exactly as transferred
+    (still compressed when the server used Content-Encoding).
+    """
+    def header_list(headers: list[tuple[str, str]]) -> list[dict]:
+        return [{"name": name, "value": value} for name, value in headers]
+
+    def header(headers: list[tuple[str, str]], wanted: str) -> str:
+        return next((value for name, value in headers if name.lower() == wanted), "")
+
+    request_type = header(request_headers, "content-type")
+    entry = {
+        "startedDateTime": datetime.fromtimestamp(started, timezone.utc).isoformat(),
+        "time": round(elapsed * 1000, 1),
+        "request": {
+            "method": method,
+            "url": url,
+            "httpVersion": "HTTP/1.1",
+            "headers": header_list(request_headers),
+            "queryString": [{"name": k, "value": v} for k, v in parse_qsl(urlsplit(url).query, keep_blank_values=True)],
+            "cookies": [],
+            "headersSize": -1,
+            "bodySize": len(request_body),
+        },
+        "response": {
+            "status": status,
+            "statusText": reason,
+            "httpVersion": "HTTP/1.1",
+            "headers": header_list(response_headers),
+            "cookies": [],
+            "content": {
+                "size": len(response_body),
+                "mimeType": header(response_headers, "content-type"),
+                "text": base64.b64encode(response_body).decode("ascii"),
+                "encoding": "base64",
+            },
+            "redirectURL": header(response_headers, "location"),
+            "headersSize": -1,
+            "bodySize": len(response_body),
+        },
+        "cache": {},
+        "timings": {"send": 0, "wait": round(elapsed * 1000, 1), "receive": 0},
+        "_fingerprint": request_fingerprint(method, url, request_body, request_type),
+        "_key": request_key(method, url),
+    }
+    if request_body:
+        entry["request"]["postData"] = {
+            "mimeType": request_type,
+            "text": request_body.decode("utf-8", errors="replace"),
+        }
+    return entry
+
+
+def response_of(entry: dict) -> tuple[int, str, list[tuple[str, str]], bytes]:
+    """Returns (status, reason, headers, body) of a recorded entry."""
+    response = entry["response"]
+    content = response["content"]
+    text = content.get("text", "")
+    body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode()
+    headers = [(header["name"], header["value"]) for header in response["headers"]]
+    return response["status"], response.get("statusText", ""), headers, body
+
+
+class HarArchive:
+    """
+    Streamable, append-only HAR archive: one HAR entry per line (JSON Lines).
+
+    Entries are written as they are recorded and never held in memory. A sidecar index
+    (<archive>.idx.json) maps request fingerprints and loose keys to byte offsets, so replay
+    seeks straight to a single line. The index is rebuilt by a streaming scan when it is
+    missing or older than the archive. export_har() converts to a standard .har file.
+    """
+
+    SUFFIX = ".har.jsonl"
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx.json")
+        self._writer = None
+        self._reader = None
+        self._exact: Dict[str, list[int]] = defaultdict(list)
+        self._loose: Dict[str, list[int]] = defaultdict(list)
+        self._cursor: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    # ---------- Recording ----------
+
+    def open_for_write(self) -> "HarArchive":
+        """Starts a new recording, replacing any previous archive at this path."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = open(self.path, "wb")
+        self._exact.clear()
+        self._loose.clear()
+        return self
+
+    def append(self, entry: dict) -> None:
+        line = json.dumps(entry, separators=(",", ":")).encode() + b"\n"
+        with self._lock:
+            offset = self._writer.tell()
+            self._writer.write(line)
+            self._writer.flush()
+            self._exact[entry["_fingerprint"]].append(offset)
+            self._loose[entry["_key"]].append(offset)
+
+    # ---------- Replay ----------
+
+    def open_for_read(self) -> "HarArchive":
+        index = read_json(self.index_path, default=None)
+        fresh = index and self.index_path.stat().st_mtime >= self.path.stat().st_mtime
+        if fresh:
+            self._exact = defaultdict(list, index["exact"])
+            self._loose = defaultdict(list, index["loose"])
+        else:
+            self._rebuild_index()
+        self._reader = open(self.path, "rb")
+        return self
+
+    def lookup(self, fingerprint: str, key: str) -> Optional[dict]:
+        """
+        Returns the recorded entry for a request: the next exact fingerprint match, else the
+        next recording of the same method + URL (dynamic values such as generated emails differ
+        between runs). Repeated requests replay their recordings in order; the last one repeats.
+        """
+        with self._lock:
+            for name, offsets in ((f"exact:{fingerprint}", self._exact.get(fingerprint)),
+                                  (f"loose:{key}", self._loose.get(key))):
+                if offsets:
+                    position = min(self._cursor[name], len(offsets) - 1)
+                    self._cursor[name] += 1
+                    return self._read_at(offsets[position])
+        return None
+
+    def entries(self) -> Iterator[dict]:
+        """Streams all entries, one line at a time."""
+        with open(self.path, "rb") as archive:
+            for line in archive:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _read_at(self, offset: int) -> dict:
+        self._reader.seek(offset)
+        return json.loads(self._reader.readline())
+
+    def _rebuild_index(self) -> None:
+        self._exact.clear()
+        self._loose.clear()
+        with open(self.path, "rb") as archive:
+            offset = 0
+            for line in archive:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._exact[entry["_fingerprint"]].append(offset)
+                    self._loose[entry["_key"]].append(offset)
+                offset += len(line)
+        self._write_index()
+
+    def _write_index(self) -> None:
+        atomic_write_json(self.index_path, {"exact": self._exact, "loose": self._loose})
+
+    # ---------- Lifecycle ----------
+
+    def close(self) -> None:
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+            self._write_index()
+        if self._reader:
+            self._reader.close()
+            self._reader = None
+
+    def export_har(self, har_path: Optional[Path] = None) -> Path:
+        """
+        Writes a standard HAR 1.2 file (readable by browser dev tools), streaming entry by entry.
+        """
+        har_path = Path(har_path or str(self.path)[: -len(".jsonl")])
+        with open(har_path, "w", encoding="utf-8") as har:
+            har.write('{"log":{"version":"1.2","creator":{"name":"har_proxy","version":"1.0"},"entries":[')
+            for number, entry in enumerate(self.entries()):
+                entry = {key: value for key, value in entry.items() if not key.startswith("_")}
+                har.write(("," if number else "") + json.dumps(entry, separators=(",", ":")))
+            har.write("]}}")
+        logger.debug("Exported %s", har_path)
+        return har_path
@@ -0,0 +1,555 @@
+import datetime
+import fnmatch
+import http.client
+import ipaddress
+import os
+import re
+import select
+import socket
+import socketserver
+import ssl
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+import certifi
+from selenium.webdriver.chromium.options import ChromiumOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+from utilities.file_utils import file_lock
+from utilities.har_archive import HarArchive, build_entry, request_fingerprint, request_key, response_of
+from utilities.logger import get_logger
+from utilities.request_blocker import RequestBlocker
+
+try:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+except ImportError:  # optional: only needed to record/replay HTTPS sites
+    x509 = None
+
+logger = get_logger(__name__)
+
+
+class HarRecorder:
+    """
+    Record-and-replay of the site's HTTP traffic through a local proxy, configured under 'har'.
+
+    record: the browser (and the requests-based helpers) go through the proxy, which forwards
+            to the real site and appends every exchange of the site's hosts to a per-test archive.
+    replay: the proxy answers from the archives and never opens a network connection.
+            Requests are matched by fingerprint (method, URL, body without volatile fields),
+            then by method + URL for dynamic POSTs such as signups with generated emails.
+
+    HTTPS is intercepted with a local CA (needs the optional 'cryptography' package);
+    browsers accept its certificates through acceptInsecureCerts.
+    """
+
+    MODES = ("off", "record", "replay")
+    ROOT_DIR = Path(__file__).parent.parent.parent
+    DEFAULT_DIR = ROOT_DIR / ".cache" / "har"
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        har = config.get("har") or {}
+        self.mode = (har.get("mode") or "off").lower()
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unsupported har mode: {self.mode}")
+        self.enabled = self.mode != "off"
+        self.directory = Path(har.get("dir") or self.DEFAULT_DIR)
+        self.export_har = bool(har.get("export_har", False))
+        self.hosts = [host.lower() for host in har.get("hosts") or [urlsplit(config["base_url"]).hostname]]
+
+        blocking = config.get("request_blocking") or {}
+        self.block_patterns = (
+            list(blocking.get("patterns") or RequestBlocker.DEFAULT_PATTERNS) if blocking.get("enabled") else []
+        )
+        self.remote_url = config.get("remote_url")
+        self.https = urlsplit(config["base_url"]).scheme == "https"
+
+    def proxy(self) -> "_HarProxy":
+        return _HarProxy.shared(self)
+
+    # ---------- Browser Setup ----------
+
+    def configure_chromium(self, options: ChromiumOptions) -> None:
+        if not self._browser_can_use_proxy():
+            return
+        options.add_argument(f"--proxy-server=http://127.0.0.1:{self.proxy().port}")
+        if self._records_loopback():
+            # Chromium sends loopback hosts (e.g. the stand-in site) around the proxy by default
+            options.add_argument("--proxy-bypass-list=<-loopback>")
+        options.accept_insecure_certs = True
+
+    def configure_firefox(self, options: FirefoxOptions) -> None:
+        """
+        Takes over the proxy preferences; the HAR proxy applies the request blocklist itself.
+        """
+        if not self._browser_can_use_proxy():
+            return
+        port = self.proxy().port
+        options.set_preference("network.proxy.type", 1)
+        for scheme in ("http", "ssl"):
+            options.set_preference(f"network.proxy.{scheme}", "127.0.0.1")
+            options.set_preference(f"network.proxy.{scheme}_port", port)
+        options.set_preference("network.proxy.no_proxies_on", "")
+        if self._records_loopback():
+            options.set_preference("network.proxy.allow_hijacking_localhost", True)
+        options.accept_insecure_certs = True
+
+    def _browser_can_use_proxy(self) -> bool:
+        if not self.enabled:
+            return False
+        if self.remote_url:
+            logger.warning("HAR %s is not available for remote browsers", self.mode)
+            return False
+        return True
+
+    def _records_loopback(self) -> bool:
+        return any(_is_loopback(host) for host in self.hosts)
+
+    # ---------- HTTP Clients ----------
+
+    @contextmanager
+    def route_http_clients(self) -> Iterator[None]:
+        """
+        Sends requests-based helpers (account API, cookie login, product catalog) through the
+        proxy while active, so their traffic is recorded and replayed with the browser's.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        proxy = self.proxy()
+        # Selenium's own connection to the local driver (http://localhost:<port>) must stay direct
+        no_proxy = ["localhost"]
+        if "localhost" in self.hosts:
+            logger.warning("HAR %s: requests to 'localhost' from HTTP helpers bypass the proxy "
+                           "(the driver connection shares the host); use 127.0.0.1 in base_url", self.mode)
+        if "127.0.0.1" not in self.hosts:
+            no_proxy.append("127.0.0.1")
+        if self.remote_url:
+            no_proxy.append(urlsplit(self.remote_url).hostname)
+        env = {"https_proxy": f"http://127.0.0.1:{proxy.port}", "no_proxy": ",".join(no_proxy)}
+        if not self.https:
+            env["http_proxy"] = env["https_proxy"]
+        if proxy.authority:
+            env["REQUESTS_CA_BUNDLE"] = str(proxy.authority.bundle_file)
+        env.update({key.upper(): value for key, value in env.items() if key.islower()})
+
+        previous = {key: os.environ.get(key) for key in env}
+        os.environ.update(env)
+        try:
+            yield
+        finally:
+            for key, value in previous.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+    # ---------- Per-test Archives ----------
+
+    def archive_path(self, test_id: str) -> Path:
+        return self.directory / (re.sub(r"[^\w.-]+", "_", test_id).strip("_") + HarArchive.SUFFIX)
+
+    def begin(self, test_id: str) -> None:
+        """Switches the proxy to the archive of one test (new recording, or replay source)."""
+        self.proxy().use(self.archive_path(test_id))
+
+    def end(self) -> dict:
+        """Closes the test's archive and returns its counters (recorded / replayed / missed)."""
+        return self.proxy().finish(export_har=self.export_har)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class _CertificateAuthority:
+    """
+    Local CA for HTTPS interception. The CA is created once and shared by all workers;
+    leaf certificates are issued per host, in memory, and loaded into server-side TLS contexts.
+    """
+
+    VALID_DAYS = 3650
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ca_file = directory / "ca.pem"
+        self.key_file = directory / "ca.key"
+        self.bundle_file = directory / "ca-bundle.pem"
+
+        with file_lock(directory / "ca.lock"):
+            if not (self.ca_file.exists() and self.key_file.exists()):
+                self._create_ca()
+        self.ca_key = serialization.load_pem_private_key(self.key_file.read_bytes(), password=None)
+        self.ca_cert = x509.load_pem_x509_certificate(self.ca_file.read_bytes())
+        self._leaf_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self._contexts: Dict[str, ssl.SSLContext] = {}
+        self._lock = threading.Lock()
+
+    def _create_ca(self) -> None:
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "UI tests HAR proxy CA")])
+        cert = (
+            self._builder(name, name, key.public_key(), self.VALID_DAYS)
+            .add_extension(x509.BasicConstraints(ca=True, path_length=0), critical=True)
+            .sign(key, hashes.SHA256())
+        )
+        self.key_file.write_bytes(key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ))
+        ca_pem = cert.public_bytes(serialization.Encoding.PEM)
+        self.ca_file.write_bytes(ca_pem)
+        # requests verifies upstream hosts too, so the bundle keeps the public roots
+        self.bundle_file.write_bytes(Path(certifi.where()).read_bytes() + b"\n" + ca_pem)
+        logger.info("Created HAR proxy CA in %s", self.directory)
+
+    @staticmethod
+    def _builder(subject, issuer, public_key, days: int):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return (
+            x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(issuer)
+            .public_key(public_key)
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=days))
+        )
+
+    def server_context(self, host: str) -> ssl.SSLContext:
+        with self._lock:
+            context = self._contexts.get(host)
+            if context is None:
+                context = self._contexts[host] = self._issue(host)
+            return context
+
+    def _issue(self, host: str) -> ssl.SSLContext:
+        cert = (
+            self._builder(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, host)]),
+                          self.ca_cert.subject, self._leaf_key.public_key(), 365)
+            .add_extension(x509.SubjectAlternativeName([x509.DNSName(host)]), critical=False)
+            .sign(self.ca_key, hashes.SHA256())
+        )
+        # ssl can only load certificate chains from files
+        chain_file = self.directory / f"{host}.{os.getpid()}.pem"
+        chain_file.write_bytes(
+            self._leaf_key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                         serialization.NoEncryption())
+            + cert.public_bytes(serialization.Encoding.PEM)
+        )
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(chain_file)
+        chain_file.unlink(missing_ok=True)
+        return context
+
+
+class _HarProxy(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    HTTP/CONNECT proxy on 127.0.0.1 shared by all drivers of the process.
+    Only the recorded hosts are intercepted; other hosts are tunnelled untouched when
+    recording and refused when replaying, so a replay run never touches the network.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    instance: Optional["_HarProxy"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, recorder: HarRecorder) -> None:
+        super().__init__(("127.0.0.1", 0), _HarProxyHandler)
+        self.port = self.server_address[1]
+        self.mode = recorder.mode
+        self.directory = recorder.directory
+        self.hosts = set(recorder.hosts)
+        self.patterns = [pattern.lower() for pattern in recorder.block_patterns]
+        self.authority = _CertificateAuthority(recorder.directory / "ca") if x509 is not None else None
+        if self.authority is None and recorder.https:
+            logger.warning("'cryptography' is not installed: HTTPS traffic cannot be recorded or replayed")
+
+        self.archive: Optional[HarArchive] = None
+        self._library: Optional[list[HarArchive]] = None
+        self.stats: Counter = Counter()
+        self._lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, name="har-proxy", daemon=True).start()
+        logger.info("HAR proxy (%s) listening on 127.0.0.1:%s", self.mode, self.port)
+
+    @classmethod
+    def shared(cls, recorder: HarRecorder) -> "_HarProxy":
+        with cls._instance_lock:
+            if cls.instance is None:
+                cls.instance = cls(recorder)
+            return cls.instance
+
+    # ---------- Archives ----------
+
+    def use(self, path: Path) -> None:
+        with self._lock:
+            self._close_archive()
+            self.stats = Counter()
+            if self.mode == "record":
+                self.archive = HarArchive(path).open_for_write()
+            elif path.exists():
+                self.archive = HarArchive(path).open_for_read()
+            else:
+                self.archive = None
+                logger.warning("No HAR recording at %s; replaying from other recordings only", path)
+
+    def finish(self, export_har: bool = False) -> dict:
+        with self._lock:
+            archive = self.archive
+            self._close_archive()
+            summary = {"mode": self.mode, "archive": str(archive.path) if archive else None, **self.stats}
+        if archive and export_har and self.mode == "record":
+            archive.export_har()
+        return summary
+
+    def _close_archive(self) -> None:
+        if self.archive:
+            self.archive.close()
+            self.archive = None
+
+    def record(self, entry: dict) -> None:
+        with self._lock:
+            if self.archive:
+                self.archive.append(entry)
+                self.stats["recorded"] += 1
+
+    def replay(self, method: str, url: str, body: bytes, content_type: str) -> Optional[dict]:
+        """
+        Looks the request up in the current test's archive, then in every other recording
+        (requests made by session-wide helpers end up in whichever test triggered them).
+        """
+        fingerprint, key = request_fingerprint(method, url, body, content_type), request_key(method, url)
+        with self._lock:
+            entry = self.archive.lookup(fingerprint, key) if self.archive else None
+            if entry is None:
+                for archive in self._other_archives():
+                    entry = archive.lookup(fingerprint, key)
+                    if entry is not None:
+                        break
+            self.stats["replayed" if entry else "missed"] += 1
+        if entry is None:
+            logger.warning("HAR replay miss: %s %s", method, url)
+        return entry
+
+    def _other_archives(self) -> list[HarArchive]:
+        if self._library is None:
+            self._library = [
+                HarArchive(path).open_for_read()
+                for path in sorted(self.directory.glob(f"*{HarArchive.SUFFIX}"))
+            ]
+        current = self.archive.path if self.archive else None
+        return [archive for archive in self._library if archive.path != current]
+
+    # ---------- Routing ----------
+
+    def intercepts(self, host: str) -> bool:
+        return host.lower() in self.hosts
+
+    def is_blocked(self, url: str) -> bool:
+        url = url.lower()
+        return any(fnmatch.fnmatchcase(url, pattern) for pattern in self.patterns)
+
+
+class _HarProxyHandler(socketserver.BaseRequestHandler):
+    UPSTREAM_TIMEOUT = 30
+    FORBIDDEN = b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+    HOP_BY_HOP = frozenset({
+        "connection", "proxy-connection", "keep-alive", "te", "trailer", "transfer-encoding",
+        "upgrade", "proxy-authorization", "proxy-authenticate",
+    })
+
+    def setup(self) -> None:
+        self._upstream: Dict[tuple, http.client.HTTPConnection] = {}
+
+    def finish(self) -> None:
+        for connection in self._upstream.values():
+            connection.close()
+
+    def handle(self) -> None:
+        reader = self.request.makefile("rb")
+        request = self._read_request(reader)
+        if request is None:
+            return
+        method, target, headers, body = request
+
+        if method == "CONNECT":
+            host, _, port = target.rpartition(":")
+            if self.server.is_blocked(f"https://{host}/"):
+                self.request.sendall(self.FORBIDDEN)
+            elif self.server.intercepts(host) and self.server.authority:
+                self.request.sendall(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+                tls = self.server.authority.server_context(host).wrap_socket(self.request, server_side=True)
+                self._serve(tls, "https", host, int(port or 443))
+            elif self.server.mode == "replay":
+                self.request.sendall(self.FORBIDDEN)
+            else:
+                self._tunnel(host, int(port or 443))
+            return
+
+        # Plain HTTP: absolute-form target, one request per connection
+        parts = urlsplit(target)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        if self.server.is_blocked(target) or (self.server.mode == "replay" and not self.server.intercepts(parts.hostname or "")):
+            self.request.sendall(self.FORBIDDEN)
+            return
+        response = self._exchange("http", parts.hostname, parts.port or 80, method, path, headers, body)
+        self._respond(self.request, *response, keep_alive=False)
+
+    # ---------- Exchanges ----------
+
+    def _serve(self, sock: socket.socket, scheme: str, host: str, port: int) -> None:
+        """Serves keep-alive requests on an intercepted TLS connection."""
+        reader = sock.makefile("rb")
+        try:
+            while True:
+                request = self._read_request(reader)
+                if request is None:
+                    return
+                method, path, headers, body = request
+                url = self._url(scheme, host, port, path)
+                if self.server.is_blocked(url):
+                    response = (403, "Forbidden", [], b"")
+                else:
+                    response = self._exchange(scheme, host, port, method, path, headers, body)
+                self._respond(sock, *response, keep_alive=True)
+        except (OSError, ssl.SSLError) as e:
+            logger.debug("HAR proxy connection to %s closed: %s", host, e)
+
+    def _exchange(self, scheme: str, host: str, port: int, method: str, path: str,
+                  headers: list[tuple[str, str]], body: bytes) -> tuple:
+        url = self._url(scheme, host, port, path)
+        content_type = next((value for name, value in headers if name.lower() == "content-type"), "")
+
+        if self.server.mode == "replay":
+            entry = self.server.replay(method, url, body, content_type)
+            if entry is None:
+                return 404, "Not Recorded", [("X-Har-Replay", "miss")], b""
+            return response_of(entry)
+
+        started = time.time()
+        try:
+            status, reason, response_headers, response_body = self._forward(
+                scheme, host, port, method, path, headers, body)
+        except (OSError, http.client.HTTPException) as e:
+            # Answer like _tunnel does, instead of dropping the browser's connection
+            logger.warning("HAR proxy could not reach %s: %s", url, e)
+            return 502, "Bad Gateway", [], b""
+        if self.server.intercepts(host):
+            self.server.record(build_entry(method, url, headers, body, status, reason, response_headers,
+                                           response_body, started, time.time() - started))
+        return status, reason, response_headers, response_body
+
+    def _forward(self, scheme: str, host: str, port: int, method: str, path: str,
+                 headers: list[tuple[str, str]], body: bytes) -> tuple:
+        upstream_headers = {}
+        for name, value in headers:
+            if name.lower() not in self.HOP_BY_HOP:
+                upstream_headers[name] = value
+        for attempt in range(2):
+            connection = self._connection(scheme, host, port, fresh=attempt > 0)
+            try:
+                connection.request(method, path, body=body or None, headers=upstream_headers)
+                response = connection.getresponse()
+                response_body = response.read()
+                response_headers = [(name, value) for name, value in response.getheaders()
+                                    if name.lower() not in self.HOP_BY_HOP]
+                return response.status, response.reason, response_headers, response_body
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if attempt:
+                    raise  # a stale keep-alive connection only gets one retry
+
+    def _connection(self, scheme: str, host: str, port: int, fresh: bool) -> http.client.HTTPConnection:
+        key = (scheme, host, port)
+        if fresh and key in self._upstream:
+            self._upstream.pop(key).close()
+        if key not in self._upstream:
+            if scheme == "https":
+                self._upstream[key] = http.client.HTTPSConnection(
+                    host, port, timeout=self.UPSTREAM_TIMEOUT, context=ssl.create_default_context())
+            else:
+                self._upstream[key] = http.client.HTTPConnection(host, port, timeout=self.UPSTREAM_TIMEOUT)
+        return self._upstream[key]
+
+    def _tunnel(self, host: str, port: int) -> None:
+        try:
+            upstream = socket.create_connection((host, port), timeout=self.UPSTREAM_TIMEOUT)
+        except OSError:
+            self.request.sendall(b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            return
+        with upstream:
+            self.request.sendall(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+            sockets = [self.request, upstream]
+            while True:
+                readable, _, errored = select.select(sockets, [], sockets, 60)
+                if errored or not readable:
+                    return
+                for sock in readable:
+                    data = sock.recv(65536)
+                    if not data:
+                        return
+                    (upstream if sock is self.request else self.request).sendall(data)
+
+    # ---------- HTTP Framing ----------
+
+    @staticmethod
+    def _url(scheme: str, host: str, port: int, path: str) -> str:
+        default = {"http": 80, "https": 443}[scheme]
+        return f"{scheme}://{host}{'' if port == default else f':{port}'}{path}"
+
+    @staticmethod
+    def _read_request(reader) -> Optional[tuple[str, str, list[tuple[str, str]], bytes]]:
+        request_line = reader.readline(65537).decode("latin-1").strip()
+        if not request_line:
+            return None
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError:
+            return None
+
+        headers = []
+        while True:
+            line = reader.readline(65537).decode("latin-1").rstrip("\r\n")
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers.append((name.strip(), value.strip()))
+
+        lowered = {name.lower(): value for name, value in headers}
+        if lowered.get("transfer-encoding", "").lower() == "chunked":
+            body = b""
+            while True:
+                size = int(reader.readline().split(b";")[0], 16)
+                if not size:
+                    reader.readline()
+                    break
+                body += reader.read(size)
+                reader.readline()
+            headers = [(name, value) for name, value in headers if name.lower() != "transfer-encoding"]
+            headers.append(("Content-Length", str(len(body))))
+        else:
+            body = reader.read(int(lowered.get("content-length") or 0))
+        return method.upper(), target, headers, body
+
+    @staticmethod
+    def _respond(sock: socket.socket, status: int, reason: str, headers: list[tuple[str, str]],
+                 body: bytes, keep_alive: bool) -> None:
+        lines = [f"HTTP/1.1 {status} {reason}"]
+        lines += [f"{name}: {value}" for name, value in headers
+                  if name.lower() not in ("content-length", "connection", "transfer-encoding", "keep-alive")]
+        lines.append(f"Content-Length: {len(body)}")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        sock.sendall(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
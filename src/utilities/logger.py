@@ -1,6 +1,14 @@
+import atexit
+import heapq
+import itertools
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import re
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Iterator, Optional
 
 
 # --- Color Codes for Console ---
@@ -24,21 +32,41 @@ class ColoredFormatter(logging.Formatter):
     }
 
     def format(self, record):
+        # Color a copy: the same record goes on to the file handler
+        record = logging.makeLogRecord(record.__dict__)
         color = self.COLORS.get(record.levelno, LogColors.RESET)
         record.levelname = f"{color}{record.levelname}{LogColors.RESET}"
         return super().format(record)
 
 
+# --- Pipeline (one per process) ---
+
+LOG_DIR = Path("logs")
+LOG_FILE = LOG_DIR / "test_run.log"
+WORKER_LOG_DIR = LOG_DIR / "workers"
+
+# Unified formatting
+LOG_FMT = "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(message)s"
+DATE_FMT = "%Y-%m-%d %H:%M:%S"
+# Files keep milliseconds (asctime's default format) and the xdist worker, so worker logs merge in order
+FILE_FMT = "%(asctime)s [{worker}] [%(levelname)s] %(name)s:%(lineno)d - %(message)s"
+RECORD_START = re.compile(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3} ")
+
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+_file_handler: Optional[logging.Handler] = None
+_setup_lock = threading.Lock()
+
+
 def get_logger(name: str = None) -> logging.Logger:
     """
-    Initialize and return a colorized and rotating logger.
-    """
-    LOG_DIR = Path("logs")
-    LOG_FILE = LOG_DIR / "test_run.log"
-
-    # Ensure logs directory exists
-    LOG_DIR.mkdir(exist_ok=True)
+    Returns a logger feeding the process-wide logging queue.
 
+    Records are handed to a queue and written by one listener thread per process: INFO and
+    above to the colored console, everything to the log file. An xdist worker writes its own
+    logs/workers/test_run.<worker>.log (the controller merges them into logs/test_run.log at
+    the end of the run); any other process writes logs/test_run.log directly.
+    """
     logger = logging.getLogger(name or "framework")
 
     # Avoid adding multiple handlers to same logger
@@ -46,30 +74,104 @@ def get_logger(name: str = None) -> logging.Logger:
         return logger
 
     logger.setLevel(logging.DEBUG)
-
-    # Unified formatting
-    log_fmt = "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(message)s"
-    date_fmt = "%Y-%m-%d %H:%M:%S"
-
-    # 1. Console Handler (with Colors)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(ColoredFormatter(fmt=log_fmt, datefmt=date_fmt))
-
-    # 2. File Handler (Rotating, Plain Text)
-    file_handler = RotatingFileHandler(
-        LOG_FILE,
-        maxBytes=5_000_000,  # 5MB
-        backupCount=5,
-        encoding="utf-8"
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter(fmt=log_fmt, datefmt=date_fmt))
-
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(_process_queue_handler())
 
     # Prevent logs from propagating to the root logger
     logger.propagate = False
 
     return logger
+
+
+def _process_queue_handler() -> QueueHandler:
+    """Sets up the queue and its writer thread on first use in this process."""
+    global _queue_handler, _listener, _file_handler
+    with _setup_lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+
+        # 1. Console Handler (with Colors)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(ColoredFormatter(fmt=LOG_FMT, datefmt=DATE_FMT))
+
+        # 2. File Handler (Plain Text): per worker and fresh per run, or rotating for the main process
+        if worker:
+            WORKER_LOG_DIR.mkdir(parents=True, exist_ok=True)
+            _file_handler = logging.FileHandler(WORKER_LOG_DIR / f"test_run.{worker}.log", mode="w", encoding="utf-8")
+        else:
+            LOG_DIR.mkdir(exist_ok=True)
+            _file_handler = RotatingFileHandler(
+                LOG_FILE,
+                maxBytes=5_000_000,  # 5MB
+                backupCount=5,
+                encoding="utf-8"
+            )
+        _file_handler.setLevel(logging.DEBUG)
+        _file_handler.setFormatter(logging.Formatter(fmt=FILE_FMT.format(worker=worker or "main")))
+
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = QueueListener(records, console_handler, _file_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)  # drains the queue before the process exits
+        _queue_handler = QueueHandler(records)
+        return _queue_handler
+
+
+# --- xdist worker logs ---
+
+def clear_worker_logs() -> None:
+    """Removes the previous run's worker logs; called by the controller before workers start."""
+    for path in WORKER_LOG_DIR.glob("test_run.*.log"):
+        path.unlink(missing_ok=True)
+
+
+def merge_worker_logs() -> int:
+    """
+    Appends the records of all worker logs to logs/test_run.log in timestamp order (a record
+    keeps its traceback lines) and returns how many were merged. Records are streamed and the
+    file rolls over at maxBytes like any other write. Called by the controller once the
+    workers have finished.
+    """
+    paths = sorted(WORKER_LOG_DIR.glob("test_run.*.log"))
+    if not paths or _file_handler is None:
+        return 0
+    workers = ", ".join(path.name.split(".")[1] for path in paths)
+    merged = heapq.merge(*(_records(path) for path in paths), key=lambda record: record[:23])
+    first = next(merged, None)
+    if first is None:
+        return 0
+    count = 0
+    _file_handler.acquire()  # the listener thread writes through the same handler
+    try:
+        _write_rolling(_file_handler, f"---------- xdist worker logs ({workers}) ----------\n")
+        for record in itertools.chain([first], merged):
+            _write_rolling(_file_handler, record)
+            count += 1
+        _file_handler.flush()
+    finally:
+        _file_handler.release()
+    return count
+
+
+def _write_rolling(handler: logging.Handler, text: str) -> None:
+    # Same check as RotatingFileHandler.shouldRollover, for text that is already formatted
+    if isinstance(handler, RotatingFileHandler) and handler.maxBytes > 0:
+        handler.stream.seek(0, 2)
+        if handler.stream.tell() + len(text) >= handler.maxBytes:
+            handler.doRollover()
+    handler.stream.write(text)
+
+
+def _records(path: Path) -> Iterator[str]:
+    """Yields the records of one log file; lines not starting with a timestamp belong to the previous record."""
+    record = ""
+    with open(path, encoding="utf-8", errors="replace") as lines:
+        for line in lines:
+            if RECORD_START.match(line) and record:
+                yield record
+                record = ""
+            record += line if line.endswith("\n") else line + "\n"
+    if record:
+        yield record
@@ -0,0 +1,31 @@
+import json
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities.driver_context import get_context
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def read(driver: WebDriver, consumer: str) -> list[dict]:
+    """
+    Returns the Chromium performance log messages ({'method', 'params'}) the consumer
+    has not seen yet.
+
+    WebDriver drains the browser-side log on every read, so entries are buffered on the
+    driver context and each consumer (request blocker, browser cache, ...) keeps its own offset.
+    The buffer is dropped with the context when a pooled driver is handed to the next test.
+    """
+    context = get_context(driver)
+    buffer = context.setdefault("performance_log", [])
+    try:
+        buffer.extend(json.loads(entry["message"])["message"] for entry in driver.get_log("performance"))
+    except WebDriverException as e:
+        logger.debug("Performance log unavailable: %s", e)
+
+    offsets = context.setdefault("performance_log_offsets", {})
+    unseen = buffer[offsets.get(consumer, 0):]
+    offsets[consumer] = len(buffer)
+    return unseen
@@ -0,0 +1,249 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities.driver_context import get_context
+from utilities.file_utils import atomic_write_json, file_lock, read_json
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _CatalogPageParser(HTMLParser):
+    """
+    Extracts product cards and sidebar category/brand links from a products listing page.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.products: list[dict] = []
+        self.categories: Dict[str, str] = {}  # href -> "Women > Dress"
+        self.brands: Dict[str, str] = {}  # href -> "Polo"
+
+        self._card: Optional[dict] = None
+        self._card_depth = 0
+        self._text_target: Optional[str] = None
+        self._panel: Optional[str] = None
+        self._link_href: Optional[str] = None
+        self._link_text: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+
+        if tag == "div":
+            if self._card is not None:
+                self._card_depth += 1
+            elif "productinfo" in classes:
+                self._card = {}
+                self._card_depth = 1
+            if "panel-collapse" in classes and attrs.get("id"):
+                self._panel = attrs["id"]
+
+        if self._card is not None:
+            if tag in ("h2", "p"):
+                self._text_target = tag
+            elif tag == "a" and attrs.get("data-product-id"):
+                self._card["id"] = int(attrs["data-product-id"])
+
+        href = attrs.get("href") or ""
+        if tag == "a" and (href.startswith("/category_products/") or href.startswith("/brand_products/")):
+            self._link_href = href
+            self._link_text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in ("h2", "p"):
+            self._text_target = None
+
+        if tag == "div" and self._card is not None:
+            self._card_depth -= 1
+            if self._card_depth == 0:
+                if "id" in self._card and "name" in self._card:
+                    self.products.append(self._card)
+                self._card = None
+
+        if tag == "a" and self._link_href:
+            # Brand links carry a "(6)" count badge next to the name
+            text = " ".join(t for t in self._link_text if not t.startswith("(")).strip()
+            if self._link_href.startswith("/category_products/"):
+                self.categories[self._link_href] = f"{self._panel} > {text}" if self._panel else text
+            else:
+                self.brands[self._link_href] = text
+            self._link_href = None
+
+    def handle_data(self, data: str) -> None:
+        text = data.strip()
+        if not text:
+            return
+        if self._link_href:
+            self._link_text.append(text)
+        if self._card is not None and self._text_target == "h2":
+            self._card["price"] = int(text.replace("Rs.", "").strip())
+        elif self._card is not None and self._text_target == "p":
+            self._card["name"] = text
+
+
+class ProductCatalog:
+    """
+    Session-level index of the product grid: name -> id, price, category and brand.
+    Built once by scraping /products (plus the category and brand listings) over HTTP,
+    cached to disk with a TTL and shared by all xdist workers. A lazy catalog (see lazy())
+    does this on its first lookup, so runs that never resolve a product never scrape.
+
+    Page objects use it to resolve products through fast id/href CSS selectors
+    instead of XPath text predicates.
+    """
+
+    ROOT_DIR = Path(__file__).parent.parent.parent
+    DEFAULT_CACHE_FILE = ROOT_DIR / ".cache" / "product_catalog.json"
+    REQUEST_TIMEOUT = 15
+
+    def __init__(self, base_url: str, products: Optional[list[dict]] = None,
+                 loader: Optional[Callable[[], list[dict]]] = None) -> None:
+        self.base_url = base_url.rstrip("/")
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._products: Optional[list[dict]] = None
+        self._by_name: Dict[str, dict] = {}
+        if products is not None or loader is None:
+            self._index(products or [])
+
+    @classmethod
+    def lazy(cls, base_url: str, ttl_hours: float = 24, cache_file: Optional[str] = None) -> "ProductCatalog":
+        """A catalog that runs load() on its first lookup."""
+        return cls(base_url, loader=lambda: cls.load(base_url, ttl_hours, cache_file).products)
+
+    @property
+    def loaded(self) -> bool:
+        return self._products is not None
+
+    @property
+    def products(self) -> list[dict]:
+        self._ensure_loaded()
+        return self._products
+
+    def _ensure_loaded(self) -> None:
+        if self._products is None:
+            with self._lock:
+                if self._products is None:
+                    self._index(self._loader())
+
+    def _index(self, products: list[dict]) -> None:
+        self._by_name = {product["name"]: product for product in products}
+        self._products = products
+
+    # ---------- Lookup ----------
+
+    def get(self, name: str) -> Optional[dict]:
+        self._ensure_loaded()
+        return self._by_name.get(name)
+
+    def product_id(self, name: str) -> Optional[int]:
+        product = self.get(name)
+        return product["id"] if product else None
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    # ---------- Driver Registration ----------
+
+    def attach(self, driver: WebDriver) -> None:
+        """Makes the catalog available to the page objects of this driver."""
+        get_context(driver)["product_catalog"] = self
+
+    @staticmethod
+    def for_driver(driver: WebDriver) -> Optional["ProductCatalog"]:
+        return get_context(driver).get("product_catalog")
+
+    # ---------- Loading ----------
+
+    @classmethod
+    def load(cls, base_url: str, ttl_hours: float = 24, cache_file: Optional[str] = None) -> "ProductCatalog":
+        """
+        Returns the catalog from the disk cache when fresh, otherwise scrapes the site and caches it.
+        An unreachable site yields an empty catalog (page objects then fall back to XPath locators).
+        """
+        base_url = base_url.rstrip("/")
+        cache_path = Path(cache_file or cls.DEFAULT_CACHE_FILE)
+
+        cached = cls._read_cache(cache_path, base_url, ttl_hours)
+        if cached is not None:
+            return cached
+
+        with file_lock(cache_path.with_suffix(".lock")):
+            cached = cls._read_cache(cache_path, base_url, ttl_hours)
+            if cached is not None:
+                return cached
+            try:
+                products = cls._scrape(base_url)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning("Could not build product catalog from %s: %s", base_url, e)
+                return cls(base_url, [])
+
+            # Drop expired entries, e.g. left behind by stand-in servers on earlier random ports
+            entries = {
+                url: entry for url, entry in (read_json(cache_path, default={}) or {}).items()
+                if time.time() - entry.get("created_at", 0) <= ttl_hours * 3600
+            }
+            entries[base_url] = {"created_at": time.time(), "products": products}
+            atomic_write_json(cache_path, entries)
+            logger.info("Product catalog built with %s products from %s", len(products), base_url)
+            return cls(base_url, products)
+
+    @classmethod
+    def _read_cache(cls, cache_path: Path, base_url: str, ttl_hours: float) -> Optional["ProductCatalog"]:
+        entry = (read_json(cache_path, default={}) or {}).get(base_url)
+        if not entry or time.time() - entry.get("created_at", 0) > ttl_hours * 3600:
+            return None
+        logger.debug("Product catalog loaded from cache: %s", cache_path)
+        return cls(base_url, entry["products"])
+
+    @classmethod
+    def _scrape(cls, base_url: str) -> list[dict]:
+        with requests.Session() as session:
+            listing = cls._parse(session, f"{base_url}/products")
+            products = {product["id"]: product for product in listing.products}
+
+            def parse_link(href: str) -> _CatalogPageParser:
+                return cls._parse(session, f"{base_url}{href}")
+
+            hrefs = list(listing.categories) + list(listing.brands)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                pages = dict(zip(hrefs, executor.map(parse_link, hrefs)))
+
+        for href, category in listing.categories.items():
+            for product in pages[href].products:
+                products.get(product["id"], {})["category"] = category
+        for href, brand in listing.brands.items():
+            for product in pages[href].products:
+                products.get(product["id"], {})["brand"] = brand
+        return sorted(products.values(), key=lambda product: product["id"])
+
+    @classmethod
+    def _parse(cls, session: requests.Session, url: str) -> _CatalogPageParser:
+        response = session.get(url, timeout=cls.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        parser = _CatalogPageParser()
+        parser.feed(response.text)
+        return parser
+
+
+def load_catalog(config: Dict[str, Any]) -> Optional[ProductCatalog]:
+    """
+    Returns the catalog described by the 'product_catalog' config section, or None when disabled.
+    It is lazy: the site is scraped (or the disk cache read) when a page object first looks up a product.
+    """
+    catalog_config = config.get("product_catalog") or {}
+    if not catalog_config.get("enabled", True):
+        return None
+    return ProductCatalog.lazy(
+        config["base_url"],
+        ttl_hours=catalog_config.get("ttl_hours", 24),
+        cache_file=catalog_config.get("cache_file"),
+    )
@@ -0,0 +1,271 @@
+import fnmatch
+import select
+import socket
+import socketserver
+import threading
+from collections import Counter
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from selenium.webdriver.chromium.options import ChromiumOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities import performance_log
+from utilities.driver_context import get_context
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RequestBlocker:
+    """
+    Blocks ad and analytics requests (Google ad scripts, ad iframes, the #google_vignette
+    interstitial) configured under 'request_blocking' in config.yaml.
+
+    Chromium (Chrome, Edge): CDP Network.setBlockedURLs; blocked requests are counted from
+    the performance log (Network.loadingFailed with a blockedReason).
+    Firefox: a local forwarding proxy that refuses matching hosts/URLs and counts refusals.
+
+    Blocked requests never transfer a body, so bytes saved are estimated per resource type.
+    """
+
+    DEFAULT_PATTERNS = [
+        "*googlesyndication.com*",
+        "*doubleclick.net*",
+        "*googleadservices.com*",
+        "*googletagmanager.com*",
+        "*googletagservices.com*",
+        "*google-analytics.com*",
+        "*adservice.google.*",
+        "*adtrafficquality.google*",
+        "*fundingchoicesmessages.google.com*",
+    ]
+
+    # Rough transfer sizes of third-party resources; the proxy only sees hosts, so it uses Other
+    ESTIMATED_BYTES = {
+        "Script": 90_000,
+        "Document": 60_000,
+        "Image": 15_000,
+        "Stylesheet": 20_000,
+        "Font": 40_000,
+        "XHR": 2_000,
+        "Fetch": 2_000,
+        "Ping": 0,
+        "Other": 20_000,
+    }
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        blocking = config.get("request_blocking") or {}
+        self.enabled = bool(blocking.get("enabled", False))
+        self.report = bool(blocking.get("report", True))
+        self.patterns = list(blocking.get("patterns") or self.DEFAULT_PATTERNS)
+        self.remote = bool(config.get("remote_url"))
+
+    # ---------- Browser Setup ----------
+
+    def configure_chromium(self, options: ChromiumOptions) -> None:
+        """
+        Enables the network part of the performance log, used to count blocked requests.
+        """
+        if not (self.enabled and self.report):
+            return
+        vendor = options.KEY.split(":")[0]  # goog (Chrome) or ms (Edge)
+        options.set_capability(f"{vendor}:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+    def configure_firefox(self, options: FirefoxOptions) -> None:
+        """
+        Routes Firefox through the local blocking proxy.
+        Skipped for remote drivers, which cannot reach a proxy on this machine.
+        """
+        if not self.enabled:
+            return
+        if self.remote:
+            logger.warning("Request blocking is not available for remote Firefox sessions")
+            return
+        port = _BlockingProxy.shared(self.patterns).port
+        options.set_preference("network.proxy.type", 1)
+        for scheme in ("http", "ssl"):
+            options.set_preference(f"network.proxy.{scheme}", "127.0.0.1")
+            options.set_preference(f"network.proxy.{scheme}_port", port)
+        options.set_preference("network.proxy.no_proxies_on", "")
+
+    def apply(self, driver: WebDriver) -> None:
+        """
+        Installs the blocklist on a freshly started Chromium driver. It survives navigations,
+        so pooled drivers keep it between tests.
+        """
+        if not self.enabled or not hasattr(driver, "execute_cdp_cmd"):
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+        logger.info("Blocking %s URL patterns via CDP", len(self.patterns))
+
+    # ---------- Per-test Counters ----------
+
+    def begin(self, driver: WebDriver) -> None:
+        """
+        Starts counting for one test: drains stale performance log entries
+        (or records the proxy counter baseline on Firefox).
+        """
+        if not (self.enabled and self.report):
+            return
+        if hasattr(driver, "execute_cdp_cmd"):
+            performance_log.read(driver, "request_blocker")
+        elif _BlockingProxy.instance is not None:
+            get_context(driver)["blocked_baseline"] = _BlockingProxy.instance.snapshot()
+
+    def collect(self, driver: WebDriver) -> Optional[dict]:
+        """
+        Returns the requests blocked since begin(): total, per resource type, per host
+        and estimated bytes saved. None when blocking or reporting is off.
+        """
+        if not (self.enabled and self.report):
+            return None
+
+        by_type: Counter = Counter()
+        by_host: Counter = Counter()
+        if hasattr(driver, "execute_cdp_cmd"):
+            self._count_blocked_events(performance_log.read(driver, "request_blocker"), by_type, by_host)
+        elif _BlockingProxy.instance is not None:
+            baseline = get_context(driver).get("blocked_baseline", Counter())
+            by_host = _BlockingProxy.instance.snapshot() - baseline
+            by_type["Other"] = sum(by_host.values())
+
+        return {
+            "blocked": sum(by_type.values()),
+            "estimated_bytes_saved": sum(
+                self.ESTIMATED_BYTES.get(kind, self.ESTIMATED_BYTES["Other"]) * count
+                for kind, count in by_type.items()
+            ),
+            "by_type": dict(by_type.most_common()),
+            "by_host": dict(by_host.most_common(10)),
+        }
+
+    @staticmethod
+    def _count_blocked_events(messages: list[dict], by_type: Counter, by_host: Counter) -> None:
+        urls: Dict[str, str] = {}
+        for message in messages:
+            params = message.get("params", {})
+            if message.get("method") == "Network.requestWillBeSent":
+                urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+            elif message.get("method") == "Network.loadingFailed" and params.get("blockedReason"):
+                by_type[params.get("type", "Other")] += 1
+                by_host[urlsplit(urls.get(params.get("requestId"), "")).hostname or "unknown"] += 1
+
+
+class _BlockingProxy(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    Minimal HTTP/CONNECT forwarding proxy on 127.0.0.1 used for Firefox.
+    HTTPS requests are matched as https://<host>/ because only the CONNECT target is visible.
+    One instance per process is shared by all Firefox drivers.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    instance: Optional["_BlockingProxy"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, patterns: list[str]) -> None:
+        super().__init__(("127.0.0.1", 0), _ProxyHandler)
+        self.port = self.server_address[1]
+        self.patterns = [pattern.lower() for pattern in patterns]
+        self._blocked: Counter = Counter()
+        self._lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, name="blocking-proxy", daemon=True).start()
+        logger.info("Blocking proxy listening on 127.0.0.1:%s", self.port)
+
+    @classmethod
+    def shared(cls, patterns: list[str]) -> "_BlockingProxy":
+        with cls._instance_lock:
+            if cls.instance is None:
+                cls.instance = cls(patterns)
+            return cls.instance
+
+    def is_blocked(self, url: str) -> bool:
+        url = url.lower()
+        return any(fnmatch.fnmatchcase(url, pattern) for pattern in self.patterns)
+
+    def record_block(self, host: str) -> None:
+        with self._lock:
+            self._blocked[host] += 1
+
+    def snapshot(self) -> Counter:
+        with self._lock:
+            return Counter(self._blocked)
+
+
+class _ProxyHandler(socketserver.BaseRequestHandler):
+    MAX_HEAD = 64 * 1024
+    CONNECT_TIMEOUT = 15
+    FORBIDDEN = b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+
+    def handle(self) -> None:
+        head, body = self._read_head()
+        if not head:
+            return
+        request_line, _, header_block = head.partition(b"\r\n")
+        try:
+            method, target, version = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            return
+
+        if method.upper() == "CONNECT":
+            host, _, port = target.rpartition(":")
+            url = f"https://{host}/" if port == "443" else f"https://{target}/"
+        else:
+            parts = urlsplit(target)
+            host, port, url = parts.hostname or "", str(parts.port or 80), target
+
+        if self.server.is_blocked(url):
+            self.server.record_block(host)
+            self.request.sendall(self.FORBIDDEN)
+            return
+
+        try:
+            upstream = socket.create_connection((host, int(port)), timeout=self.CONNECT_TIMEOUT)
+        except OSError:
+            self.request.sendall(b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            return
+
+        with upstream:
+            if method.upper() == "CONNECT":
+                self.request.sendall(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+            else:
+                upstream.sendall(self._origin_form(method, target, version, header_block) + body)
+            self._relay(upstream)
+
+    def _read_head(self) -> tuple[bytes, bytes]:
+        data = b""
+        while b"\r\n\r\n" not in data and len(data) < self.MAX_HEAD:
+            chunk = self.request.recv(8192)
+            if not chunk:
+                return b"", b""
+            data += chunk
+        head, _, body = data.partition(b"\r\n\r\n")
+        return head, body
+
+    @staticmethod
+    def _origin_form(method: str, target: str, version: str, header_block: bytes) -> bytes:
+        # Absolute-form target -> origin-form path; one request per upstream connection
+        parts = urlsplit(target)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        headers = [
+            line for line in header_block.split(b"\r\n")
+            if line and not line.lower().startswith((b"proxy-connection:", b"connection:"))
+        ]
+        headers.append(b"Connection: close")
+        return f"{method} {path} {version}\r\n".encode("latin-1") + b"\r\n".join(headers) + b"\r\n\r\n"
+
+    def _relay(self, upstream: socket.socket) -> None:
+        sockets = [self.request, upstream]
+        while True:
+            readable, _, errored = select.select(sockets, [], sockets, 60)
+            if errored or not readable:
+                return
+            for sock in readable:
+                data = sock.recv(65536)
+                if not data:
+                    return
+                (upstream if sock is self.request else self.request).sendall(data)
@@ -1,28 +1,30 @@
+import requests
+
+from pages.home_page import HomePage
+from pages.login_page import LoginPage
+from utilities.cookie_login import LoginFailed
 from utilities.data_generator import DataGenerator
 from utilities.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-def register_user(app, base_url, user_profile):
+def register_user(app, user_profile):
     """
     Business action to register a new user via the UI.
     Now uses the 'app' (Navigator) fixture directly.
     """
     logger.info("Starting background user registration process")
 
-    # 1. Open Site directly from the app controller
-    home_page = app.open_site(base_url)
-
-    # 2. Navigate to Log in/Signup Page via Header
-    login_page = home_page.header.click_signup_login()
+    # 1-2. Deep-link to the Log in/Signup Page (no home page load or header click-through)
+    login_page = app.goto(LoginPage)
 
     # 3. Generate unique credentials
     username = DataGenerator.unique_username("user")
     email = DataGenerator.unique_email("reg")
     password = user_profile["password"]
 
-    logger.info(f"Registering user with email: {email}")
+    logger.info("Registering user with email: %s", email)
 
     # 4. Initial Signup
     login_page.enter_name(username)
@@ -44,3 +46,49 @@ def register_user(app, base_url, user_profile):
         "password": password,
         "username": username
     }
+
+
+def create_user_via_api(api_client, user_profile):
+    """
+    Business action to register a new user through /api/createAccount.
+    Returns the same credentials dict as register_user, without any page load.
+    """
+    username = DataGenerator.unique_username("user")
+    email = DataGenerator.unique_email("reg")
+    password = user_profile["password"]
+
+    logger.info("Registering user via API with email: %s", email)
+    user_profile["name"] = username
+    api_client.create_account(username, email, user_profile)
+
+    return {
+        "email": email,
+        "password": password,
+        "username": username
+    }
+
+
+def login_with_cookies(app, cookie_login, email, password, target=HomePage):
+    """
+    Business action to start a test already authenticated: injects the user's HTTP session
+    cookies and opens the target page directly.
+    Returns the target page, or None when the session is rejected (caller falls back to UI login).
+    """
+    try:
+        cookies = cookie_login.cookies_for(email, password)
+    except (LoginFailed, requests.RequestException) as e:
+        logger.warning("HTTP login failed for %s: %s", email, e)
+        return None
+
+    cookie_login.inject(app.driver, cookies)
+    page = app.goto(target)
+
+    # Verification hook: the header is server-rendered, so the label is there once the page is ready
+    if page.header.is_logged_user_visible(timeout=0):
+        logger.info("Logged in via injected session cookies: %s", email)
+        return page
+
+    logger.warning("Injected session for %s was rejected", email)
+    cookie_login.forget(email)
+    cookie_login.clear(app.driver)
+    return None
@@ -1,17 +1,21 @@
-from typing import Dict, Any
+from typing import Any, Callable, Dict
 
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.options import ArgOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
+from utilities.browser_cache import BrowserCache
+from utilities.command_profiler import CommandProfiler
+from utilities.driver_resolver import DriverResolver
+from utilities.har_proxy import HarRecorder
 from utilities.logger import get_logger
+from utilities.request_blocker import RequestBlocker
 
 logger = get_logger(__name__)
 
@@ -24,6 +28,11 @@ class WebDriverFactory:
     def __init__(self, config: Dict[str, Any], download_dir: str | None = None) -> None:
         self.config = config
         self.download_dir = download_dir
+        self.resolver = DriverResolver(config)
+        self.blocker = RequestBlocker(config)
+        self.har = HarRecorder(config)
+        self.browser_cache = BrowserCache(config)
+        self.profiler = CommandProfiler(config)
         logger.info("WebDriverFactory initialized for browser: %s", config.get("browser"))
 
     def get_driver(self) -> webdriver.Remote:
@@ -44,6 +53,21 @@ class WebDriverFactory:
             case _:
                 raise ValueError(f"Unsupported browser: {browser}")
 
+    def start_prewarm(self, size: int):
+        """
+        Starts a background pool that keeps `size` spare drivers launched ahead of demand.
+        Drivers are created by this factory, so they carry the same browser options.
+        """
+        from utilities.driver_pool import PrewarmPool
+
+        def create(download_dir: str | None = None) -> webdriver.Remote:
+            factory = WebDriverFactory(self.config, download_dir) if download_dir else self
+            driver = factory.get_driver()
+            self.maximize_window(driver)
+            return driver
+
+        return PrewarmPool(create, size=size)
+
     def _get_chrome_options(self) -> ChromeOptions:
         options = ChromeOptions()
         if self.config.get("headless"):
@@ -61,40 +85,49 @@ class WebDriverFactory:
                 "download.prompt_for_downloads": False,
                 "safebrowsing.enabled": True,
             })
+        self.blocker.configure_chromium(options)
+        self.har.configure_chromium(options)
+        self.browser_cache.configure_chromium(options)
         return options
 
     def _get_firefox_options(self) -> FirefoxOptions:
         options = FirefoxOptions()
         if self.config.get("headless"):
             options.add_argument("-headless")
+        self.blocker.configure_firefox(options)
+        self.har.configure_firefox(options)
+        self.browser_cache.configure_firefox(options)
         return options
 
     def _get_edge_options(self) -> EdgeOptions:
         options = EdgeOptions()
         if self.config.get("headless"):
             options.add_argument("--headless=new")
+        self.blocker.configure_chromium(options)
+        self.har.configure_chromium(options)
+        self.browser_cache.configure_chromium(options)
         return options
 
     def _create_chrome_driver(self) -> webdriver.Chrome:
         logger.info("Initializing Chrome (local)...")
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=self._get_chrome_options())
-        self._post_setup(driver)
-        return driver
+        driver_path = self.resolver.resolve("chrome")
+        service = ChromeService(driver_path)
+        options = self._get_chrome_options()
+        return self._launch(lambda: self._start_local(webdriver.Chrome, driver_path, service, options), options)
 
     def _create_firefox_driver(self) -> webdriver.Firefox:
         logger.info("Initializing Firefox (local)...")
-        service = FirefoxService(GeckoDriverManager().install())
-        driver = webdriver.Firefox(service=service, options=self._get_firefox_options())
-        self._post_setup(driver)
-        return driver
+        driver_path = self.resolver.resolve("firefox")
+        service = FirefoxService(driver_path)
+        options = self._get_firefox_options()
+        return self._launch(lambda: self._start_local(webdriver.Firefox, driver_path, service, options), options)
 
     def _create_edge_driver(self) -> webdriver.Edge:
         logger.info("Initializing Edge (local)...")
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        driver = webdriver.Edge(service=service, options=self._get_edge_options())
-        self._post_setup(driver)
-        return driver
+        driver_path = self.resolver.resolve("edge")
+        service = EdgeService(driver_path)
+        options = self._get_edge_options()
+        return self._launch(lambda: self._start_local(webdriver.Edge, driver_path, service, options), options)
 
     def _create_remote_driver(self, browser: str, remote_url: str) -> webdriver.Remote:
         logger.info("Initializing Remote Driver (%s) at %s", browser, remote_url)
@@ -112,11 +145,55 @@ class WebDriverFactory:
 
         options = get_options_func()
 
-        driver = webdriver.Remote(command_executor=remote_url, options=options)
+        return self._launch(lambda: webdriver.Remote(command_executor=remote_url, options=options), options)
+
+    def _start_local(self, driver_cls: type, driver_path: str | None, service: Any, options: ArgOptions) -> webdriver.Remote:
+        with self.resolver.driver_start(driver_path):
+            return driver_cls(service=service, options=options)
+
+    def _launch(self, start: Callable[[], webdriver.Remote], options: ArgOptions) -> webdriver.Remote:
+        try:
+            driver = start()
+        except Exception:
+            slot = self.browser_cache.slot_of(options)
+            if slot:
+                self.browser_cache.release(slot)
+            raise
+        self.profiler.attach(driver)
         self._post_setup(driver)
+        self.browser_cache.attach(driver, options)
         return driver
 
+    @staticmethod
+    def maximize_window(driver: webdriver.Remote) -> None:
+        try:
+            driver.maximize_window()
+        except WebDriverException:
+            logger.debug("maximize_window not supported by driver/platform")
+
+    @staticmethod
+    def can_redirect_downloads(driver: webdriver.Remote) -> bool:
+        """
+        Only local Chromium browsers can change their download directory at runtime (through CDP).
+        Pools start a new browser with the directory for the others.
+        """
+        return hasattr(driver, "execute_cdp_cmd")
+
+    @staticmethod
+    def set_download_dir(driver: webdriver.Remote, download_dir: str) -> None:
+        """
+        Redirects downloads of an already running browser (used by pooled drivers).
+        """
+        if not WebDriverFactory.can_redirect_downloads(driver):
+            logger.warning("Cannot change download directory at runtime for %s", driver.name)
+            return
+        driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+            "behavior": "allow",
+            "downloadPath": download_dir,
+        })
+
     def _post_setup(self, driver: webdriver.Remote) -> None:
-        implicit_wait = self.config.get("implicit_wait", 5)
-        driver.implicitly_wait(implicit_wait)
-        logger.info("Driver setup complete. Implicit wait: %ss", implicit_wait)
+        # Implicit wait stays at 0: BasePage owns all waiting, so explicit waits never stack on it
+        driver.implicitly_wait(0)
+        self.blocker.apply(driver)
+        logger.info("Driver setup complete. Implicit wait disabled")
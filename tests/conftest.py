@@ -1,20 +1,37 @@
+import json
 import os
 import shutil
 import tempfile
 
 import allure
 import pytest
-from selenium.common.exceptions import WebDriverException
 
+from pages.base_page import BasePage, WaitStats
+from pages.login_page import LoginPage
 from pages.navigator import Navigator
+from plugins.durations import DurationPlugin
+from plugins.sharding import ShardPlugin, parse_shard
+from stand_in.server import StandInServer
+from utilities.account_pool import load_account_pool
+from utilities.api_client import AccountApiClient
+from utilities.browser_cache import BrowserCache, summarize_metrics
+from utilities.command_profiler import CommandProfiler
 from utilities.config_reader import ConfigReader
+from utilities.cookie_login import load_cookie_login
 from utilities.data_loader import DataLoader
-from utilities.logger import get_logger
-from utilities.user_action import register_user
+from utilities.driver_context import get_context
+from utilities.driver_pool import DriverPool, summarize_checkouts
+from utilities.har_proxy import HarRecorder
+from utilities.logger import clear_worker_logs, get_logger, merge_worker_logs
+from utilities.product_catalog import load_catalog
+from utilities.request_blocker import RequestBlocker
+from utilities.user_action import create_user_via_api, login_with_cookies, register_user
 from utilities.webdriver_factory import WebDriverFactory
 
 logger = get_logger(__name__)
 
+STAND_IN_SERVER = pytest.StashKey[StandInServer]()
+
 
 # --- Pytest Configuration ---
 
@@ -25,6 +42,125 @@ def pytest_addoption(parser):
         default=None,
         help="Environment to run tests against (overrides TEST_ENV). Example: --env=staging"
     )
+    parser.addoption(
+        "--shard",
+        action="store",
+        type=parse_shard,
+        default=None,
+        help="Run shard i of n, balanced by test durations. Example: --shard=2/4"
+    )
+    parser.addoption(
+        "--shard-manifest",
+        action="store",
+        default=None,
+        help="Where to write the shard manifest (default: reports/shard-<i>-of-<n>.json)"
+    )
+    parser.addoption(
+        "--durations-file",
+        action="store",
+        default=None,
+        help="JSON file of test durations to plan from instead of .pytest_cache (same file on every shard)"
+    )
+    parser.addoption(
+        "--stand-in",
+        action="store_true",
+        default=False,
+        help="Run against the local stand-in site instead of base_url (same as 'stand_in.enabled: true')"
+    )
+
+
+def _load_config(pytestconfig):
+    cli_env = pytestconfig.getoption("env")
+    if cli_env:
+        os.environ["TEST_ENV"] = cli_env
+        logger.info("Overriding TEST_ENV via CLI: %s", cli_env)
+    config = ConfigReader().get_config()
+
+    stand_in_url = _stand_in_url(pytestconfig)
+    if stand_in_url:
+        config = {**config, "base_url": stand_in_url}
+    return config
+
+
+def _stand_in_url(pytestconfig):
+    workerinput = getattr(pytestconfig, "workerinput", None)
+    if workerinput is not None:
+        return workerinput.get("stand_in_url")
+    server = pytestconfig.stash.get(STAND_IN_SERVER, None)
+    return server.url if server else None
+
+
+def pytest_configure(config):
+    """
+    Registers sharding ('--shard') in every process. In the controller (or the only process
+    without xdist): clears the previous run's worker logs, registers duration-based scheduling
+    when '-n' starts workers, and starts the local stand-in site once per run when it is requested; base_url then
+    points at it
+    """
+    if config.getoption("shard"):
+        config.pluginmanager.register(ShardPlugin(config), ShardPlugin.NAME)
+    if hasattr(config, "workerinput"):
+        return
+    clear_worker_logs()
+    if config.getoption("numprocesses", None):
+        config.pluginmanager.register(DurationPlugin(config), DurationPlugin.NAME)
+    if _stand_in_requested(config):
+        config.stash[STAND_IN_SERVER] = StandInServer().start()
+
+
+def _stand_in_requested(config):
+    """
+    The only place that decides whether the stand-in site runs: '--stand-in', or
+    'stand_in.enabled' in the selected environment (e.g. '--env=offline'). Off by default.
+    """
+    return config.getoption("stand_in") or bool((_load_config(config).get("stand_in") or {}).get("enabled"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    Hands the stand-in URL to each xdist worker, so all workers share its accounts and carts
+    """
+    server = node.config.stash.get(STAND_IN_SERVER, None)
+    if server:
+        node.workerinput["stand_in_url"] = server.url
+
+
+def pytest_unconfigure(config):
+    """
+    Stops the stand-in site and, in the controller, merges the xdist workers' log files
+    into logs/test_run.log (the workers have exited and flushed them by now)
+    """
+    server = config.stash.get(STAND_IN_SERVER, None)
+    if server:
+        server.stop()
+    if not hasattr(config, "workerinput"):
+        merge_worker_logs()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Reaps the shared account pool once, in the controller (or the only process without xdist)
+    """
+    if hasattr(session.config, "workerinput"):
+        return
+    config = _load_config(session.config)
+    if not (config.get("account_pool") or {}).get("enabled"):
+        return
+    with AccountApiClient(config["base_url"]) as api_client:
+        load_account_pool(config, api_client).reap()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Browser cache warm/cold and driver prewarm checkout totals over all tests
+    (teardown reports carry the final user_properties)
+    """
+    properties = [prop for report in terminalreporter.getreports("")
+                  if report.when == "teardown" for prop in report.user_properties]
+    for summary in (summarize_metrics(properties), summarize_checkouts(properties)):
+        if summary:
+            terminalreporter.write_line(summary)
 
 
 @pytest.hookimpl(hookwrapper=True, tryfirst=True)
@@ -44,12 +180,112 @@ def config(pytestconfig):
     """
     Returns merged config dictionary
     """
-    cli_env = pytestconfig.getoption("env")
-    if cli_env:
-        os.environ["TEST_ENV"] = cli_env
-        logger.info("Overriding TEST_ENV via CLI: %s", cli_env)
+    return _load_config(pytestconfig)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def wait_backend(config):
+    """
+    Selects the BasePage wait backend ('observer' or 'polling') from config
+    """
+    BasePage.WAIT_BACKEND = config.get("wait_backend", BasePage.WAIT_BACKEND)
+    logger.info("Using '%s' wait backend", BasePage.WAIT_BACKEND)
+    return BasePage.WAIT_BACKEND
+
+
+@pytest.fixture(scope="session")
+def product_catalog(config):
+    """
+    Product name -> id/price/category/brand index, scraped on the first lookup and cached on disk.
+    None when disabled via 'product_catalog.enabled'.
+    """
+    return load_catalog(config)
+
+
+@pytest.fixture(scope="session")
+def api_client(config):
+    """
+    Pooled HTTP client for the account API (/api/createAccount, /api/verifyLogin, /api/deleteAccount)
+    """
+    with AccountApiClient(config["base_url"]) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def cookie_login(config):
+    """
+    HTTP login + session cookie injection for logged_in_user (None when 'login.mode' is 'ui')
+    """
+    return load_cookie_login(config)
+
+
+@pytest.fixture(scope="session")
+def account_pool(config, api_client, cookie_login):
+    """
+    Cross-worker pool of pre-registered accounts (None unless 'account_pool.enabled')
+    """
+    return load_account_pool(config, api_client, cookie_login)
+
+
+@pytest.fixture(scope="session")
+def request_blocker(config):
+    """
+    Ad/analytics blocklist from 'request_blocking' in config, used to report blocked requests per test.
+    None when blocking is disabled.
+    """
+    blocker = RequestBlocker(config)
+    return blocker if blocker.enabled else None
+
+
+@pytest.fixture(scope="session")
+def browser_cache(config):
+    """
+    Shared browser disk cache from 'browser_cache' in config, used to report warm/cold requests per test.
+    None when the cache is disabled (or the browser is remote).
+    """
+    cache = BrowserCache(config)
+    return cache if cache.active else None
+
+
+@pytest.fixture(scope="session")
+def command_profiler(config):
+    """
+    WebDriver command profiler from 'profiler' in config (None unless 'profiler.enabled')
+    """
+    profiler = CommandProfiler(config)
+    return profiler if profiler.enabled else None
 
-    return ConfigReader().get_config()
+
+@pytest.fixture(scope="session")
+def har_recorder(config):
+    """
+    HAR record/replay proxy from 'har' in config (None when 'har.mode' is off).
+    While active, the requests-based helpers are routed through the proxy as well.
+    """
+    recorder = HarRecorder(config)
+    if not recorder.enabled:
+        yield None
+        return
+    with recorder.route_http_clients():
+        yield recorder
+
+
+@pytest.fixture(autouse=True)
+def har_archive(request, har_recorder):
+    """
+    Records (or replays) each test's traffic into its own archive
+    """
+    if not har_recorder:
+        yield None
+        return
+
+    har_recorder.begin(request.node.nodeid)
+    yield
+    summary = har_recorder.end()
+    logger.info("HAR %s for %s: %s", summary["mode"], request.node.name, summary)
+    for key in ("recorded", "replayed", "missed"):
+        if key in summary:
+            request.node.user_properties.append((f"har_{key}", summary[key]))
 
 
 @pytest.fixture
@@ -62,21 +298,97 @@ def download_dir():
     shutil.rmtree(path, ignore_errors=True)
 
 
-@pytest.fixture
-def driver(request, config, download_dir):
+@pytest.fixture(scope="session")
+def driver_prewarm(config):
     """
-    Creates WebDriver and handles failure attachments to Allure
+    Background spawner keeping 'driver_prewarm.size' spare browsers ready, with or without the driver pool.
+    Yields None when prewarming is disabled.
     """
-    factory = WebDriverFactory(config=config, download_dir=download_dir)
-    driver = factory.get_driver()
+    size = (config.get("driver_prewarm") or {}).get("size", 0)
+    if not size:
+        yield None
+        return
+
+    prewarm = WebDriverFactory(config=config).start_prewarm(size)
+    yield prewarm
+    prewarm.close()
 
-    try:
-        driver.maximize_window()
-    except WebDriverException:
-        logger.debug("maximize_window not supported by driver/platform")
+
+@pytest.fixture(scope="session")
+def driver_pool(config, driver_prewarm):
+    """
+    Session-wide pool of live browsers, enabled via 'driver_pool.enabled' in config.
+    Yields None when pooling is disabled.
+    """
+    pool_config = config.get("driver_pool") or {}
+    if not pool_config.get("enabled"):
+        yield None
+        return
+
+    pool = DriverPool(WebDriverFactory(config=config), size=pool_config.get("size", 1), spawner=driver_prewarm)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(request, config, download_dir, driver_pool, driver_prewarm, product_catalog, request_blocker,
+           browser_cache, command_profiler):
+    """
+    Creates WebDriver (or checks one out of the pool) and handles failure attachments to Allure
+    """
+    if driver_pool:
+        driver = driver_pool.acquire(download_dir=download_dir)
+    elif driver_prewarm:
+        driver = driver_prewarm.checkout(download_dir=download_dir)
+    else:
+        factory = WebDriverFactory(config=config, download_dir=download_dir)
+        driver = factory.get_driver()
+        WebDriverFactory.maximize_window(driver)
+    checkout = get_context(driver).get("prewarm_checkout")
+    if checkout:
+        request.node.user_properties.append((f"prewarm_{checkout}", 1))
+
+    if product_catalog is not None:  # lazy: a truth test would load it
+        product_catalog.attach(driver)
+    if request_blocker:
+        request_blocker.begin(driver)
+    if browser_cache:
+        browser_cache.begin(driver)
+    if command_profiler:
+        command_profiler.begin(driver)
 
     yield driver
 
+    profile = command_profiler.collect(driver, request.node.nodeid) if command_profiler else None
+    if profile is not None:
+        logger.info("Command profile for %s: %s commands, %ss wire of %ss wall", request.node.name,
+                    profile["commands"], profile["wire_seconds"], profile["wall_seconds"])
+        summary = {key: value for key, value in profile.items() if key != "log"}
+        allure.attach(json.dumps(summary, indent=2), name="command_profile",
+                      attachment_type=allure.attachment_type.JSON)
+
+    blocked = request_blocker.collect(driver) if request_blocker else None
+    if blocked is not None:
+        logger.info("Blocked %s requests for %s (~%s bytes saved)", blocked["blocked"],
+                    request.node.name, blocked["estimated_bytes_saved"])
+        request.node.user_properties.append(("blocked_requests", blocked["blocked"]))
+        request.node.user_properties.append(("blocked_bytes_estimate", blocked["estimated_bytes_saved"]))
+        allure.attach(json.dumps(blocked, indent=2), name="blocked_requests",
+                      attachment_type=allure.attachment_type.JSON)
+
+    cache_metrics = browser_cache.collect(driver) if browser_cache else None
+    if cache_metrics is not None:
+        logger.info("Browser cache for %s: %s warm, %s cold (~%s bytes saved)", request.node.name,
+                    cache_metrics["cache_warm"], cache_metrics["cache_cold"], cache_metrics["cache_bytes_saved"])
+        request.node.user_properties.extend(cache_metrics.items())
+
+    wait_summary = WaitStats.for_driver(driver).summary()
+    logger.info("Wait stats for %s: %s waits, %ss total, %s timeouts (%ss)", request.node.name,
+                wait_summary["waits"], wait_summary["total_seconds"],
+                wait_summary["timeouts"], wait_summary["timeout_seconds"])
+    allure.attach(json.dumps(wait_summary, indent=2), name="wait_stats",
+                  attachment_type=allure.attachment_type.JSON)
+
     rep_call = getattr(request.node, "rep_call", None)
     if rep_call and rep_call.failed:
         try:
@@ -86,48 +398,77 @@ def driver(request, config, download_dir):
                 attachment_type=allure.attachment_type.PNG,
             )
         except Exception as e:
-            logger.error(f"Failed to capture failure screenshot: {e}")
+            logger.error("Failed to capture failure screenshot: %s", e)
 
-    driver.quit()
+    if driver_pool:
+        driver_pool.release(driver)
+    else:
+        driver.quit()
 
 
 @pytest.fixture
-def app(driver):
+def app(driver, config):
     """
     Returns the Navigator instance (Application Controller)
     """
-    return Navigator(driver)
+    return Navigator.for_driver(driver, base_url=config["base_url"])
 
 
 # --- Business Flow Fixtures (Data & State) ---
 
 @pytest.fixture
-def registered_user(app, config, user_profile):
+def registered_user(request, config, user_profile):
     """
-    Registers a new user and returns the profile data
+    Registers a new user and returns the profile data.
+    'provisioning.mode' selects the backend: 'api' (HTTP, default) or 'ui' (signup form).
+    In api mode the account is leased from the account pool when it is enabled; otherwise
+    API-created accounts are deleted after the test unless 'provisioning.cleanup' is false.
     """
-    user = register_user(
-        app=app,
-        base_url=config["base_url"],
-        user_profile=user_profile
-    )
+    provisioning = config.get("provisioning") or {}
+    mode = provisioning.get("mode", "api").lower()
+
+    if mode == "ui":
+        app = request.getfixturevalue("app")
+        yield register_user(app=app, user_profile=user_profile)
+        return
+    if mode != "api":
+        raise ValueError(f"Unsupported provisioning mode: {mode}")
+
+    api_client = request.getfixturevalue("api_client")
+    pool = request.getfixturevalue("account_pool")
+    if pool:
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        user = pool.lease(worker, lambda: create_user_via_api(api_client, user_profile))
+        yield user
+        pool.release(user)
+        return
+
+    user = create_user_via_api(api_client, user_profile)
     yield user
 
+    if provisioning.get("cleanup", True):
+        api_client.delete_account(user["email"], user["password"])
+
 
 @pytest.fixture
-def logged_in_user(app, config, registered_user):
+def logged_in_user(app, registered_user, cookie_login):
     """
-    Navigates to site, performs login, and returns the HomePage instance
+    Logs the registered user in and returns the HomePage instance.
+    'login.mode: cookie' injects an HTTP session and opens the home page directly;
+    the UI login form is used for 'login.mode: ui' or when the injected session is rejected.
     """
-    # 1. Open site and get HomePage (as Guest)
-    home_page = app.open_site(config["base_url"])
-
-    # 2. Use Navigator to get Login Page and perform Login
-    login_page = home_page.header.click_signup_login()
-    home_page = login_page.login(
-        registered_user["email"],
-        registered_user["password"]
-    )
+    email, password = registered_user["email"], registered_user["password"]
+
+    # 1. Fast path: inject the HTTP session cookies
+    if cookie_login:
+        home_page = login_with_cookies(app, cookie_login, email, password)
+        if home_page:
+            return home_page
+        logger.warning("Cookie login rejected, falling back to UI login")
+
+    # 2. Deep-link to the Login Page (as Guest) and perform Login
+    login_page = app.goto(LoginPage)
+    home_page = login_page.login(email, password)
 
     # 3. Quick sanity check
     assert home_page.is_logged_user_visible(), "User should be logged in successfully"
@@ -0,0 +1,60 @@
+# Stubbed WebDriver for unit tests of page objects and command instrumentation; no browser needed.
+# Test modules import the fixture: from stub_driver import stub_driver
+import json
+
+import pytest
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.base_page import BasePage
+from utilities.command_profiler import ELEMENT_KEY
+
+# Stubbed page content: cart table rows as CART_SNAPSHOT_JS returns them, and the texts a
+# bulk read script returns per CSS selector (any other selector reads as two values)
+STUB_CART_ROWS = [
+    {"product_id": "1", "name": "Blue Top", "price": "Rs. 500", "quantity": "1", "total": "Rs. 500"},
+    {"product_id": "2", "name": "Men Tshirt", "price": "Rs. 400", "quantity": "2", "total": "Rs. 800"},
+]
+STUB_TEXTS = {
+    ".productinfo p": ["Blue Top", "Men Tshirt", "Sleeveless Dress"],
+    "#address_delivery li": ["Your delivery address", "Mr. Jane Doe", "4 Privet Drive", "United Kingdom"],
+    "#address_invoice li": ["Your billing address", "Mr. Jane Doe", "4 Privet Drive", "United Kingdom"],
+}
+
+
+def _browser_response(method, url, body=None):
+    """
+    Minimal W3C driver: one session, every locator matches two displayed elements,
+    the cart snapshot script returns STUB_CART_ROWS and bulk read scripts return STUB_TEXTS
+    """
+    path = url.split("/session", 1)[1]
+    if not path:
+        return {"value": {"sessionId": "stub", "capabilities": {"browserName": "chrome"}}}
+    if path.endswith("/elements"):
+        return {"value": [{ELEMENT_KEY: "e1"}, {ELEMENT_KEY: "e2"}]}
+    if path.endswith("/element"):
+        return {"value": {ELEMENT_KEY: "e1"}}
+    if path.endswith("/execute/sync"):
+        command = json.loads(body)
+        if "isDisplayed" in command["script"]:
+            return {"value": True}
+        if "cart_info_table" in command["script"]:
+            return {"value": STUB_CART_ROWS}
+        selector = command["args"][1] if len(command["args"]) > 1 else None
+        return {"value": STUB_TEXTS.get(selector, ["first", "second"])}
+    return {"value": None}
+
+
+@pytest.fixture
+def stub_driver(monkeypatch):
+    """
+    WebDriver talking to a stubbed W3C endpoint (RemoteConnection._request patched), for unit checks
+    of page objects and command instrumentation without a browser
+    """
+    monkeypatch.setattr(RemoteConnection, "_request", lambda self, method, url, body=None:
+                        _browser_response(method, url, body))
+    monkeypatch.setattr(BasePage, "WAIT_BACKEND", "polling")
+    connection = RemoteConnection(client_config=ClientConfig(remote_server_addr="http://127.0.0.1:9"))
+    return WebDriver(command_executor=connection, options=ChromeOptions())
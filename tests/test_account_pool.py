@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+import pytest
+
+from stand_in.server import StandInServer
+from utilities.account_pool import AccountPool
+from utilities.api_client import AccountApiClient
+from utilities.cookie_login import CookieLogin
+from utilities.data_loader import DataLoader
+from utilities.user_action import create_user_via_api
+
+
+@pytest.fixture
+def pool(tmp_path):
+    with StandInServer() as server, AccountApiClient(server.url) as api_client:
+        yield AccountPool(api_client, CookieLogin(server.url), db_path=str(tmp_path / "pool.sqlite"))
+
+
+def _create(pool):
+    profile = DataLoader.get_user_data()["default_registration_profile"].copy()
+    return lambda: create_user_via_api(pool.api_client, profile)
+
+
+def _cart(pool, account):
+    # A fresh login each time, independent of the pool's cached cookies
+    base_url = pool.cookie_login.base_url
+    with CookieLogin(base_url).http_session(account["email"], account["password"]) as session:
+        return AccountPool.CART_ROW_PATTERN.findall(session.get(f"{base_url}/view_cart").text)
+
+
+@allure.feature("Account Pool")
+@allure.story("Lease and release")
+@pytest.mark.parametrize("logged_out", [False, True], ids=["logged_in", "logged_out_in_ui"])
+def test_released_account_comes_back_with_an_empty_cart(pool, logged_out):
+    account = pool.lease("gw0", _create(pool))
+    with pool.cookie_login.http_session(account["email"], account["password"]) as session:
+        session.get(f"{pool.cookie_login.base_url}/add_to_cart/2")
+        if logged_out:
+            # The cached cookies now belong to a guest session
+            session.get(f"{pool.cookie_login.base_url}/logout")
+    assert _cart(pool, account) == ["2"]
+
+    pool.release(account)
+    leased_again = pool.lease("gw1", _create(pool))
+
+    assert leased_again["email"] == account["email"]
+    assert _cart(pool, leased_again) == []
+
+
+@allure.feature("Account Pool")
+@allure.story("Lease and release")
+def test_concurrent_leases_never_share_an_account(pool):
+    for account in [pool.lease("setup", _create(pool)) for _ in range(3)]:
+        pool.release(account)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        leased = list(executor.map(lambda index: pool.lease(f"gw{index}", _create(pool)), range(6)))
+
+    emails = [account["email"] for account in leased]
+    assert len(set(emails)) == 6
+    assert pool.reap() == 6
+    assert not pool.db_path.exists()
@@ -0,0 +1,106 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import allure
+import pytest
+
+from utilities.api_client import AccountApiClient, ApiError
+from utilities.data_loader import DataLoader
+from utilities.user_action import create_user_via_api
+
+
+class _StubAccountApi(BaseHTTPRequestHandler):
+    """
+    In-memory stand-in for the AutomationExercise account API.
+    Mirrors the real site: HTTP 200 with the outcome in 'responseCode', served as text/html.
+    """
+
+    accounts: dict = {}
+
+    def do_POST(self):
+        form = self._form()
+        if self.path == "/api/createAccount":
+            if form["email"] in self.accounts:
+                return self._reply(400, "Email already exists!")
+            self.accounts[form["email"]] = form
+            return self._reply(201, "User created!")
+        if self.path == "/api/verifyLogin":
+            account = self.accounts.get(form.get("email"))
+            if account and account["password"] == form.get("password"):
+                return self._reply(200, "User exists!")
+            return self._reply(404, "User not found!")
+        self.send_error(404)
+
+    def do_DELETE(self):
+        form = self._form()
+        if self.path != "/api/deleteAccount":
+            return self.send_error(404)
+        account = self.accounts.get(form.get("email"))
+        if account and account["password"] == form.get("password"):
+            del self.accounts[form["email"]]
+            return self._reply(200, "Account deleted!")
+        return self._reply(404, "Account not found!")
+
+    def _form(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return {key: values[0] for key, values in parse_qs(self.rfile.read(length).decode()).items()}
+
+    def _reply(self, code: int, message: str) -> None:
+        body = json.dumps({"responseCode": code, "message": message}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api():
+    _StubAccountApi.accounts = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubAccountApi)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with AccountApiClient(f"http://127.0.0.1:{server.server_address[1]}") as client:
+        yield client
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def profile():
+    return DataLoader.get_user_data()["default_registration_profile"].copy()
+
+
+@allure.feature("User Provisioning")
+@allure.story("Account API client")
+def test_create_verify_and_delete_account(stub_api, profile):
+    user = create_user_via_api(stub_api, profile)
+
+    created = _StubAccountApi.accounts[user["email"]]
+    assert created["name"] == user["username"]
+    assert created["title"] == "Mr"
+    assert created["birth_month"] == str(profile["date_of_birth"]["month"])
+    assert created["mobile_number"] == profile["contact"]["mobile_number"]
+
+    assert stub_api.verify_login(user["email"], user["password"])
+    assert not stub_api.verify_login(user["email"], "wrong-password")
+
+    assert stub_api.delete_account(user["email"], user["password"])
+    assert not stub_api.verify_login(user["email"], user["password"])
+    assert not stub_api.delete_account(user["email"], user["password"])
+
+
+@allure.feature("User Provisioning")
+@allure.story("Account API client")
+def test_create_existing_account_raises(stub_api, profile):
+    stub_api.create_account("first", "taken@example.com", profile)
+
+    with pytest.raises(ApiError) as error:
+        stub_api.create_account("second", "taken@example.com", profile)
+
+    assert error.value.response_code == 400
+    assert "already exists" in error.value.message
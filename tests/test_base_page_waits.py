@@ -0,0 +1,39 @@
+import allure
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage, WaitStats
+
+from stub_driver import stub_driver  # noqa: F401 (fixture)
+
+ROWS = (By.CSS_SELECTOR, "#cart_info_table tbody tr")
+
+
+@allure.feature("Waits")
+@allure.story("Wait statistics")
+def test_observer_fallback_records_the_requested_timeout(stub_driver, monkeypatch):
+    monkeypatch.setattr(BasePage, "WAIT_BACKEND", "observer")
+    monkeypatch.setattr(BasePage, "_observe", lambda self, kind, locator, condition, deadline: None)
+
+    BasePage(stub_driver).find(ROWS, timeout=5)
+
+    assert [(record["kind"], record["timeout"]) for record in WaitStats.for_driver(stub_driver).records] == [
+        ("present", 5)]
+
+
+@allure.feature("Waits")
+@allure.story("Transient errors")
+def test_find_all_retries_transient_webdriver_errors(stub_driver, monkeypatch):
+    find_elements = stub_driver.find_elements
+    calls = []
+
+    def flaky_find_elements(by, value):
+        calls.append(value)
+        if len(calls) == 1:
+            raise WebDriverException("document unloaded while searching")
+        return find_elements(by, value)
+
+    monkeypatch.setattr(stub_driver, "find_elements", flaky_find_elements)
+
+    assert len(BasePage(stub_driver).find_all(ROWS, timeout=2)) == 2
+    assert len(calls) == 2
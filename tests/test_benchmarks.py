@@ -0,0 +1,63 @@
+import urllib.request
+
+import allure
+
+from benchmarks.primitives import CASES, FixtureServer, compare_results, summarize, time_case
+from benchmarks.scenarios import BASELINE, _merge, format_table
+from pages.base_page import BasePage
+
+from stub_driver import stub_driver  # noqa: F401 (fixture)
+
+
+def _results(machine: dict, **medians) -> dict:
+    return {"machine": machine,
+            "results": {name: {"median_ms": median, "commands": commands} for name, (median, commands) in medians.items()}}
+
+
+@allure.feature("Benchmarks")
+@allure.story("Baseline comparison")
+def test_regressions_beyond_threshold_or_extra_commands_are_flagged():
+    baseline = _results({"host": "ci-1", "browser_version": "130.0"},
+                        find=(10.0, 2), click=(20.0, 3), get_text=(15.0, 3), hover=(12.0, 3))
+    current = _results({"host": "ci-1", "browser_version": "131.0"},
+                       find=(11.0, 2), click=(25.0, 3), get_text=(15.0, 4), hover=(8.0, 3), send_keys=(9.0, 4))
+
+    comparison = compare_results(current, baseline, threshold=0.2)
+
+    assert {row["name"]: row["status"] for row in comparison["rows"]} == {
+        "find": "ok", "click": "regressed", "get_text": "regressed", "hover": "improved", "send_keys": "new",
+    }
+    assert comparison["regressions"] == ["click", "get_text"]
+    assert comparison["machine_differences"] == {"browser_version": ["130.0", "131.0"]}
+
+
+@allure.feature("Benchmarks")
+@allure.story("Primitive timing")
+def test_fixtures_are_served_and_primitives_are_timed(stub_driver):
+    with FixtureServer() as server:
+        for fixture in {case.fixture for case in CASES}:
+            with urllib.request.urlopen(f"{server.url}/{fixture}") as response:
+                assert response.status == 200
+
+    case = next(case for case in CASES if case.name == "is_displayed")
+    result = time_case(BasePage(stub_driver), case, iterations=5, warmup=1)
+
+    assert result["iterations"] == 5
+    assert result["commands"] == 2  # findElement + isDisplayed script
+    assert result["min_ms"] <= result["median_ms"] <= result["p95_ms"]
+    assert summarize([3.0, 1.0, 2.0], commands=1)["median_ms"] == 2.0
+
+
+@allure.feature("Benchmarks")
+@allure.story("Execution modes")
+def test_modes_change_one_baseline_setting_and_table_compares_to_first():
+    assert _merge(BASELINE, {"driver_pool": {"size": 2}})["driver_pool"] == {"enabled": False, "size": 2}
+    assert BASELINE["driver_pool"]["enabled"] is False
+
+    table = format_table({
+        "baseline": {"description": "fresh", "wall_seconds": 40.0, "commands": 800, "page_loads": 30, "passed": 5, "tests": 5},
+        "pooled": {"description": "reused", "wall_seconds": 30.0, "commands": 790, "page_loads": 30, "passed": 5, "tests": 5},
+    }).splitlines()
+
+    assert table[1].split()[:6] == ["baseline", "40.0", "+0%", "800", "30", "5/5"]
+    assert table[2].split()[:6] == ["pooled", "30.0", "-25%", "790", "30", "5/5"]
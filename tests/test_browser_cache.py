@@ -0,0 +1,48 @@
+import allure
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from utilities.browser_cache import BrowserCache, cache_metrics, summarize_metrics
+
+
+@allure.feature("Browser Cache")
+@allure.story("Cache slots")
+def test_slots_are_exclusive_reused_and_evicted(tmp_path):
+    cache = BrowserCache({"browser_cache": {"enabled": True, "dir": str(tmp_path), "scope": "machine",
+                                            "max_mb": 1, "max_total_mb": 1}})
+    options = ChromeOptions()
+    cache.configure_chromium(options)
+    first = cache.slot_of(options)
+    second = cache.lease()
+    assert first != second
+    assert f"--disk-cache-size={1024 * 1024}" in options.arguments
+
+    (first / "data_1").write_bytes(b"x" * 1024 * 1024)
+    (second / "data_1").write_bytes(b"x" * 1024)
+    cache.release(first)
+    cache.release(second)
+
+    # Over max_total_mb: the least recently used free slot goes first
+    assert cache.lease() == first
+    assert not (first / "data_1").exists()
+    assert (second / "data_1").exists()
+
+
+@allure.feature("Browser Cache")
+@allure.story("Warm/cold metrics")
+def test_metrics_split_cached_and_network_responses():
+    def request(request_id, start, end, cached, size):
+        messages = [
+            {"method": "Network.requestWillBeSent", "params": {"requestId": request_id, "timestamp": start}},
+            {"method": "Network.responseReceived",
+             "params": {"requestId": request_id, "response": {"fromDiskCache": cached}}},
+            {"method": "Network.dataReceived", "params": {"requestId": request_id, "dataLength": size}},
+            {"method": "Network.loadingFinished", "params": {"requestId": request_id, "timestamp": end}},
+        ]
+        return messages
+
+    metrics = cache_metrics(request("1", 0.0, 0.5, False, 100) + request("2", 1.0, 1.1, True, 4000)
+                            + request("3", 2.0, 2.1, True, 6000))
+
+    assert metrics == {"cache_warm": 2, "cache_cold": 1, "cache_bytes_saved": 10000,
+                       "cache_latency_saved_ms": 800}
+    assert summarize_metrics(metrics.items()).startswith("Browser cache: 2/3 responses warm (67%)")
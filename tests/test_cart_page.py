@@ -0,0 +1,23 @@
+import allure
+import pytest
+
+from pages.cart_page import CartPage
+
+from stub_driver import stub_driver  # noqa: F401 (fixture)
+
+
+@allure.feature("Cart")
+@allure.story("Row verification")
+def test_row_totals_are_verified_by_one_based_index(stub_driver):
+    page = CartPage(stub_driver)
+
+    assert page.verify_product_price_quantity_total(1)
+    assert page.verify_product_price_quantity_total(2)
+
+
+@allure.feature("Cart")
+@allure.story("Row verification")
+@pytest.mark.parametrize("index", [0, 3, -1])
+def test_missing_row_index_is_rejected(stub_driver, index):
+    with pytest.raises(ValueError, match=f"Cart has 2 product rows, there is no row {index}"):
+        CartPage(stub_driver).verify_product_price_quantity_total(index)
@@ -0,0 +1,90 @@
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.products_page import ProductsPage
+from utilities.command_budget import CommandBudgetExceeded, command_budget
+
+from stub_driver import stub_driver  # noqa: F401 (fixture)
+
+ROW_NAMES = (By.CSS_SELECTOR, "#cart_info_table .cart_description h4 a")
+
+
+@allure.feature("Command Budget")
+@allure.story("Within budget")
+def test_bulk_read_stays_within_budget(stub_driver):
+    page = CartPage(stub_driver)
+
+    with command_budget(max_commands=1) as budget:
+        assert page.get_texts(ROW_NAMES) == ["first", "second"]
+
+    assert [record["command"] for record in budget.commands] == ["w3cExecuteScript"]
+    assert budget.commands[0]["method"] == "BasePage.get_texts"
+
+
+@allure.feature("Command Budget")
+@allure.story("Budget exceeded")
+def test_per_element_round_trips_exceed_budget(stub_driver):
+    page = CartPage(stub_driver)
+
+    @command_budget(max_commands=2)
+    def texts_one_by_one():
+        return [element.text for element in page.find_all(ROW_NAMES)]
+
+    with pytest.raises(CommandBudgetExceeded) as failure:
+        texts_one_by_one()
+
+    report = str(failure.value).splitlines()
+    assert report[0].endswith("texts_one_by_one issued 3 WebDriver commands, budget is 2 (+1)")
+    assert report[3].startswith("+   3  getElementText")
+    assert report[-1] == "  repeated 2x: getElementText css selector=#cart_info_table .cart_description h4 a"
+
+
+# Page-object reads moved to one script execution; these budgets keep them there
+
+@allure.feature("Command Budget")
+@allure.story("Page objects")
+def test_cart_snapshot_is_one_round_trip(stub_driver):
+    page = CartPage(stub_driver)
+
+    with command_budget(max_commands=1) as budget:
+        rows = page.snapshot()
+
+    assert [(row.name, row.quantity, row.total) for row in rows] == [("Blue Top", 1, 500), ("Men Tshirt", 2, 800)]
+    assert budget.commands[0]["method"] == "CartPage.snapshot"
+
+
+@allure.feature("Command Budget")
+@allure.story("Page objects")
+def test_cart_getters_share_one_snapshot(stub_driver):
+    page = CartPage(stub_driver)
+
+    with command_budget(max_commands=1):
+        assert page.get_cart_product_names() == ["Blue Top", "Men Tshirt"]
+        assert page.get_cart_item_count() == 2
+        assert page.get_quantity_of_item("Men Tshirt") == "2"
+        assert page.verify_product_price_quantity_total(2)
+
+    with command_budget(max_commands=0):
+        assert page.get_cart_product_names() == ["Blue Top", "Men Tshirt"]
+
+
+@allure.feature("Command Budget")
+@allure.story("Page objects")
+def test_product_names_are_one_round_trip(stub_driver):
+    page = ProductsPage(stub_driver)
+
+    with command_budget(max_commands=1):
+        assert page.get_displayed_product_names() == ["Blue Top", "Men Tshirt", "Sleeveless Dress"]
+
+
+@allure.feature("Command Budget")
+@allure.story("Page objects")
+@pytest.mark.parametrize("getter", ["get_delivery_address_details", "get_billing_address_details"])
+def test_checkout_addresses_are_one_round_trip(stub_driver, getter):
+    page = CheckoutPage(stub_driver)
+
+    with command_budget(max_commands=1):
+        assert getattr(page, getter)() == ["Mr. Jane Doe", "4 Privet Drive", "United Kingdom"]
@@ -0,0 +1,31 @@
+import json
+
+import allure
+
+from pages.home_page import HomePage
+from utilities.command_profiler import CommandProfiler
+
+from stub_driver import stub_driver  # noqa: F401 (fixture)
+
+
+@allure.feature("Command Profiler")
+@allure.story("Per-test profile")
+def test_commands_are_attributed_to_page_object_methods(stub_driver, tmp_path):
+    profiler = CommandProfiler({"profiler": {"enabled": True, "dir": str(tmp_path)}})
+    profiler.attach(stub_driver)
+    profiler.begin(stub_driver)
+
+    assert HomePage(stub_driver).header.is_header_visible()
+    profile = profiler.collect(stub_driver, "tests/test_home.py::test_header")
+
+    assert [(record["command"], record["locator"], record["method"], record["primitive"])
+            for record in profile["log"]] == [
+        ("findElement", "css selector=.header-middle", "HeaderComponent.is_header_visible", "BasePage.find_visible"),
+        ("w3cExecuteScript", "css selector=.header-middle", "HeaderComponent.is_header_visible",
+         "BasePage.find_visible"),
+    ]
+    assert profile["categories"].keys() == {"find", "script"}
+    assert profile["top_methods"][0]["method"] == "HeaderComponent.is_header_visible"
+
+    written = json.loads((tmp_path / "tests_test_home.py_test_header.json").read_text())
+    assert written["commands"] == 2
@@ -0,0 +1,89 @@
+import time
+
+import allure
+import pytest
+
+from utilities.driver_pool import PrewarmPool, summarize_checkouts
+
+
+class _FirefoxDriver:
+    """A running browser as far as the pools can tell; no CDP, so downloads cannot be redirected."""
+    name = "firefox"
+    current_url = "about:blank"
+
+    def __init__(self, download_dir=None):
+        self.download_dir = download_dir
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+class _ChromeDriver(_FirefoxDriver):
+    name = "chrome"
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.download_dir = params["downloadPath"]
+
+
+def _prewarmed(driver_cls):
+    launched = []
+
+    def create(download_dir=None):
+        launched.append(driver_cls(download_dir))
+        return launched[-1]
+
+    pool = PrewarmPool(create, size=1)
+    deadline = time.monotonic() + 5
+    while pool._ready.qsize() < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return pool, launched
+
+
+@pytest.fixture
+def pools():
+    started = []
+
+    def start(driver_cls):
+        pool, launched = _prewarmed(driver_cls)
+        started.append(pool)
+        return pool, launched
+
+    yield start
+    for pool in started:
+        pool.close()
+
+
+@allure.feature("Driver Pool")
+@allure.story("Download directory")
+def test_spare_that_cannot_redirect_downloads_is_kept_for_the_next_test(pools):
+    pool, launched = pools(_FirefoxDriver)
+    spare = launched[0]
+
+    driver = pool.checkout(download_dir="/tmp/downloads")
+    assert driver is not spare and driver.download_dir == "/tmp/downloads"
+
+    assert pool.checkout() is spare
+    assert pool.stats() == {"size": 1, "hit": 1, "miss": 0, "fresh": 1, "hit_rate": 0.5}
+
+
+@allure.feature("Driver Pool")
+@allure.story("Download directory")
+def test_chromium_spare_is_redirected_at_runtime(pools):
+    pool, launched = pools(_ChromeDriver)
+
+    driver = pool.checkout(download_dir="/tmp/downloads")
+
+    assert driver is launched[0] and driver.download_dir == "/tmp/downloads"
+    assert pool.stats()["hit"] == 1
+
+
+@allure.feature("Driver Pool")
+@allure.story("Run summary")
+def test_checkouts_are_summed_over_tests():
+    properties = [("prewarm_hit", 1), ("prewarm_hit", 1), ("prewarm_miss", 1), ("prewarm_fresh", 1),
+                  ("cache_warm", 12)]
+
+    assert summarize_checkouts(properties) == (
+        "Driver prewarm: 2/4 checkouts hit a ready spare (50%), 1 missed, 1 launched with a download directory")
+    assert summarize_checkouts([("cache_warm", 12)]) is None
@@ -0,0 +1,69 @@
+import json
+import os
+
+import allure
+import pytest
+
+from utilities.driver_resolver import DriverResolver
+
+
+class _StubManager:
+    installs = []
+
+    def install(self) -> str:
+        path = _StubManager.directory / f"chromedriver-{len(_StubManager.installs)}"
+        path.write_text("")
+        _StubManager.installs.append(str(path))
+        return str(path)
+
+
+@pytest.fixture
+def resolver(tmp_path, monkeypatch):
+    _StubManager.installs = []
+    _StubManager.directory = tmp_path
+    monkeypatch.setattr(DriverResolver, "MANAGERS", {"chrome": _StubManager})
+    versions = {"chrome": "130.0.1"}
+    monkeypatch.setattr(DriverResolver, "_browser_version", classmethod(lambda cls, browser: versions[browser]))
+
+    def create(mode: str = "cache") -> DriverResolver:
+        return DriverResolver({"driver_resolution": {"mode": mode, "manifest": str(tmp_path / "manifest.json")}})
+
+    create.versions = versions
+    return create
+
+
+@allure.feature("Driver Resolution")
+@allure.story("Manifest")
+def test_manifest_is_keyed_by_browser_version(resolver, tmp_path):
+    first = resolver().resolve("chrome")
+    assert resolver().resolve("chrome") == first
+    assert len(_StubManager.installs) == 1
+
+    resolver.versions["chrome"] = "131.0.2"  # browser upgrade
+    upgraded = resolver().resolve("chrome")
+    assert upgraded != first
+    assert json.loads((tmp_path / "manifest.json").read_text()) == {"chrome-130.0.1": first,
+                                                                    "chrome-131.0.2": upgraded}
+
+    resolver.versions["chrome"] = None  # detection failed: never cached, never served from the manifest
+    resolver().resolve("chrome")
+    resolver().resolve("chrome")
+    assert len(_StubManager.installs) == 4
+    assert len(json.loads((tmp_path / "manifest.json").read_text())) == 2
+
+
+@allure.feature("Driver Resolution")
+@allure.story("Offline mode")
+def test_offline_fallback_sets_se_offline_only_during_the_start(resolver, monkeypatch):
+    monkeypatch.delenv("SE_OFFLINE", raising=False)
+    offline = resolver("offline")
+
+    assert offline.resolve("chrome") is None
+    assert "SE_OFFLINE" not in os.environ
+    with offline.driver_start(None):
+        assert os.environ["SE_OFFLINE"] == "true"
+    assert "SE_OFFLINE" not in os.environ
+
+    with offline.driver_start("/pinned/chromedriver"):
+        assert "SE_OFFLINE" not in os.environ
+    assert _StubManager.installs == []
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import allure
+
+from plugins.durations import DurationPlugin, DurationStore, longest_first_makespan
+
+
+@allure.feature("Duration Scheduling")
+@allure.story("Estimates")
+def test_unknown_tests_are_estimated_from_their_module(pytestconfig):
+    store = DurationStore(pytestconfig)
+    store.durations = {
+        "tests/test_checkout.py::test_place_order": 60.0,
+        "tests/test_checkout.py::test_download_invoice": 40.0,
+        "tests/test_home.py::test_subscription": 5.0,
+    }
+
+    estimates = store.estimate(["tests/test_checkout.py::test_new_flow", "tests/test_new.py::test_other",
+                                "tests/test_home.py::test_subscription"])
+
+    assert estimates == {"tests/test_checkout.py::test_new_flow": 50.0,
+                         "tests/test_new.py::test_other": 40.0,
+                         "tests/test_home.py::test_subscription": 5.0}
+
+
+@allure.feature("Duration Scheduling")
+@allure.story("Makespan")
+def test_longest_first_makespan():
+    assert longest_first_makespan([1, 7, 3, 4, 5], workers=2) == 10
+    assert longest_first_makespan([2, 2], workers=4) == 2
+    assert longest_first_makespan([], workers=2) == 0
+
+
+def _report(nodeid, when, outcome, duration):
+    return SimpleNamespace(nodeid=nodeid, when=when, outcome=outcome, duration=duration)
+
+
+@allure.feature("Duration Scheduling")
+@allure.story("Recording")
+def test_only_passed_attempts_are_recorded(pytestconfig):
+    plugin = DurationPlugin(pytestconfig)
+    reports = [
+        _report("tests/test_a.py::test_passes", "setup", "passed", 1.0),
+        _report("tests/test_a.py::test_passes", "call", "passed", 2.0),
+        _report("tests/test_a.py::test_passes", "teardown", "passed", 0.5),
+        # pytest-rerunfailures: the first attempt timed out and is reported as a rerun, the second passes
+        _report("tests/test_a.py::test_flaky", "setup", "passed", 1.0),
+        _report("tests/test_a.py::test_flaky", "call", "rerun", 30.0),
+        _report("tests/test_a.py::test_flaky", "setup", "passed", 1.0),
+        _report("tests/test_a.py::test_flaky", "call", "passed", 3.0),
+        _report("tests/test_a.py::test_flaky", "teardown", "passed", 0.5),
+        _report("tests/test_a.py::test_fails", "setup", "passed", 1.0),
+        _report("tests/test_a.py::test_fails", "call", "failed", 30.0),
+        _report("tests/test_a.py::test_fails", "teardown", "passed", 0.5),
+        _report("tests/test_a.py::test_skipped", "setup", "skipped", 0.0),
+        _report("tests/test_a.py::test_skipped", "teardown", "passed", 0.0),
+    ]
+    for report in reports:
+        plugin.pytest_runtest_logreport(report)
+
+    assert plugin.measured == {"tests/test_a.py::test_passes": 3.5, "tests/test_a.py::test_flaky": 4.5}
+    assert plugin.worker_busy == {"main": sum(report.duration for report in reports)}
@@ -0,0 +1,101 @@
+import os
+import socket
+
+import allure
+import pytest
+import requests
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from stand_in.server import StandInServer
+from utilities.har_archive import HarArchive, request_fingerprint
+from utilities.har_proxy import HarRecorder, _HarProxy
+
+TEST_ID = "tests/test_example.py::test_cart"
+
+
+def _session(proxy: _HarProxy) -> requests.Session:
+    session = requests.Session()
+    session.trust_env = False
+    session.proxies = {"http": f"http://127.0.0.1:{proxy.port}"}
+    return session
+
+
+@pytest.fixture
+def recorder_config(tmp_path):
+    def build(base_url: str, mode: str) -> HarRecorder:
+        return HarRecorder({"base_url": base_url, "har": {"mode": mode, "dir": str(tmp_path), "export_har": True}})
+    return build
+
+
+@allure.feature("HAR Record/Replay")
+@allure.story("Replay without the site")
+def test_replay_serves_recorded_responses_offline(recorder_config):
+    with StandInServer() as server:
+        recorder = recorder_config(server.url, "record")
+        proxy = _HarProxy(recorder)
+        proxy.use(recorder.archive_path(TEST_ID))
+        with _session(proxy) as session:
+            session.get(f"{server.url}/add_to_cart/1")
+            recorded_cart = session.get(f"{server.url}/view_cart").text
+            session.post(f"{server.url}/api/verifyLogin", data={"email": "first@example.com", "password": "x"})
+        assert proxy.finish(export_har=True)["recorded"] == 3
+        proxy.shutdown()
+        proxy.server_close()
+    # The site is gone from here on
+
+    recorder = recorder_config(server.url, "replay")
+    proxy = _HarProxy(recorder)
+    proxy.use(recorder.archive_path(TEST_ID))
+    with _session(proxy) as session:
+        assert session.get(f"{server.url}/view_cart").text == recorded_cart
+        # Dynamic POST bodies fall back to method + URL matching
+        verify = session.post(f"{server.url}/api/verifyLogin", data={"email": "other@example.com", "password": "x"})
+        assert "User not found!" in verify.text
+        assert session.get(f"{server.url}/not_recorded").headers["X-Har-Replay"] == "miss"
+
+    assert proxy.finish() == {"mode": "replay", "archive": str(recorder.archive_path(TEST_ID)),
+                              "replayed": 2, "missed": 1}
+    proxy.shutdown()
+    proxy.server_close()
+
+    archive = HarArchive(recorder.archive_path(TEST_ID))
+    assert [entry["request"]["url"].rsplit("/", 1)[1] for entry in archive.entries()] == [
+        "1", "view_cart", "verifyLogin"]
+    assert archive.path.with_suffix("").exists()  # exported .har
+
+
+@allure.feature("HAR Record/Replay")
+@allure.story("Request fingerprint")
+def test_fingerprint_ignores_csrf_token_and_field_order():
+    form = "application/x-www-form-urlencoded"
+    first = request_fingerprint("POST", "https://site/login", b"csrfmiddlewaretoken=a&email=x&password=y", form)
+    second = request_fingerprint("POST", "https://site/login", b"password=y&email=x&csrfmiddlewaretoken=b", form)
+    other = request_fingerprint("POST", "https://site/login", b"email=z&password=y", form)
+
+    assert first == second
+    assert first != other
+
+
+@allure.feature("HAR Record/Replay")
+@allure.story("Loopback sites")
+def test_loopback_site_goes_through_the_proxy_and_unreachable_upstream_gets_502(recorder_config, monkeypatch):
+    with socket.socket() as closed:
+        closed.bind(("127.0.0.1", 0))
+        base_url = f"http://127.0.0.1:{closed.getsockname()[1]}"  # nothing listens here
+    recorder = recorder_config(base_url, "record")
+    proxy = _HarProxy(recorder)
+    monkeypatch.setattr(_HarProxy, "shared", classmethod(lambda cls, har: proxy))
+
+    options = ChromeOptions()
+    recorder.configure_chromium(options)
+    assert "--proxy-bypass-list=<-loopback>" in options.arguments
+    with recorder.route_http_clients():
+        assert os.environ["no_proxy"] == "localhost"
+        assert os.environ["http_proxy"] == f"http://127.0.0.1:{proxy.port}"
+
+    proxy.use(recorder.archive_path(TEST_ID))
+    with _session(proxy) as session:
+        assert session.get(f"{base_url}/view_cart").status_code == 502
+    proxy.finish()
+    proxy.shutdown()
+    proxy.server_close()
@@ -0,0 +1,63 @@
+import logging
+from logging.handlers import RotatingFileHandler
+
+import allure
+
+from utilities import logger as log_pipeline
+
+
+@allure.feature("Logging")
+@allure.story("xdist worker logs")
+def test_worker_logs_merge_in_timestamp_order_keeping_tracebacks(tmp_path, monkeypatch):
+    workers = tmp_path / "workers"
+    workers.mkdir()
+    (workers / "test_run.gw0.log").write_text(
+        "2026-01-01 10:00:00,100 [gw0] [INFO] a:1 - first\n"
+        "2026-01-01 10:00:00,300 [gw0] [ERROR] a:2 - failed\n"
+        "Traceback (most recent call last):\n"
+        "ValueError: boom\n", encoding="utf-8")
+    (workers / "test_run.gw1.log").write_text(
+        "2026-01-01 10:00:00,200 [gw1] [INFO] b:1 - second\n"
+        "2026-01-01 10:00:00,400 [gw1] [INFO] b:2 - last", encoding="utf-8")
+    main_log = tmp_path / "test_run.log"
+    file_handler = logging.FileHandler(main_log, encoding="utf-8")
+    monkeypatch.setattr(log_pipeline, "WORKER_LOG_DIR", workers)
+    monkeypatch.setattr(log_pipeline, "_file_handler", file_handler)
+
+    try:
+        assert log_pipeline.merge_worker_logs() == 4
+    finally:
+        file_handler.close()
+
+    assert main_log.read_text(encoding="utf-8").splitlines() == [
+        "---------- xdist worker logs (gw0, gw1) ----------",
+        "2026-01-01 10:00:00,100 [gw0] [INFO] a:1 - first",
+        "2026-01-01 10:00:00,200 [gw1] [INFO] b:1 - second",
+        "2026-01-01 10:00:00,300 [gw0] [ERROR] a:2 - failed",
+        "Traceback (most recent call last):",
+        "ValueError: boom",
+        "2026-01-01 10:00:00,400 [gw1] [INFO] b:2 - last",
+    ]
+
+
+@allure.feature("Logging")
+@allure.story("xdist worker logs")
+def test_merged_worker_logs_roll_the_main_log_over(tmp_path, monkeypatch):
+    workers = tmp_path / "workers"
+    workers.mkdir()
+    (workers / "test_run.gw0.log").write_text(
+        "".join(f"2026-01-01 10:00:00,{index:03d} [gw0] [INFO] a:1 - record {index}\n" for index in range(20)),
+        encoding="utf-8")
+    main_log = tmp_path / "test_run.log"
+    file_handler = RotatingFileHandler(main_log, maxBytes=500, backupCount=5, encoding="utf-8")
+    monkeypatch.setattr(log_pipeline, "WORKER_LOG_DIR", workers)
+    monkeypatch.setattr(log_pipeline, "_file_handler", file_handler)
+
+    try:
+        assert log_pipeline.merge_worker_logs() == 20
+    finally:
+        file_handler.close()
+
+    files = [main_log] + sorted(tmp_path.glob("test_run.log.*"))
+    assert len(files) > 1
+    assert all(path.stat().st_size <= 500 for path in files)
@@ -0,0 +1,17 @@
+import allure
+
+from pages.cart_page import CartPage
+from pages.products_page import ProductsPage
+
+from stub_driver import stub_driver  # noqa: F401 (fixture)
+
+
+@allure.feature("Page Components")
+@allure.story("Lazy components")
+def test_component_is_bound_to_the_page_it_is_accessed_through(stub_driver):
+    cart, products = CartPage(stub_driver), ProductsPage(stub_driver)
+
+    assert cart.header.base is cart
+    assert products.header.base is products
+    assert cart.header is cart.header
+    assert cart.header is not products.header
@@ -0,0 +1,22 @@
+import allure
+
+from stand_in.server import StandInServer
+from utilities.product_catalog import load_catalog
+
+
+@allure.feature("Product Catalog")
+@allure.story("Lazy loading")
+def test_catalog_scrapes_on_first_lookup(tmp_path):
+    cache_file = tmp_path / "product_catalog.json"
+    with StandInServer() as server:
+        catalog = load_catalog({"base_url": server.url, "product_catalog": {"cache_file": str(cache_file)}})
+        assert not catalog.loaded
+        assert server.page_loads() == {}
+
+        assert catalog.product_id("Blue Top") == 1
+        assert catalog.get("Blue Top")["brand"] == "Polo"
+        assert catalog.product_id("Not A Product") is None
+        products_page_loads = server.page_loads()["/products"]
+
+    assert catalog.loaded and cache_file.exists()
+    assert products_page_loads == 1
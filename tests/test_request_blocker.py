@@ -0,0 +1,112 @@
+import json
+import socket
+from collections import Counter
+
+import allure
+import pytest
+
+from utilities.request_blocker import RequestBlocker, _BlockingProxy
+
+
+def _event(method, **params):
+    return {"method": method, "params": params}
+
+
+def _sent(request_id, url):
+    return _event("Network.requestWillBeSent", requestId=request_id, request={"url": url})
+
+
+class _ChromiumDriver:
+    """Just enough of a Chromium driver for the performance log: get_log returns the queued messages once."""
+
+    def __init__(self, messages):
+        self.messages = messages
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def get_log(self, log_type):
+        entries = [{"message": json.dumps({"message": message})} for message in self.messages]
+        self.messages = []
+        return entries
+
+
+@pytest.fixture
+def blocking_proxy():
+    proxy = _BlockingProxy(RequestBlocker.DEFAULT_PATTERNS)
+    yield proxy
+    proxy.shutdown()
+    proxy.server_close()
+
+
+@allure.feature("Request Blocking")
+@allure.story("Counting blocked requests")
+def test_blocked_requests_are_counted_by_type_and_host():
+    by_type, by_host = Counter(), Counter()
+    RequestBlocker._count_blocked_events([
+        _sent("1", "https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js"),
+        _sent("2", "https://googleads.g.doubleclick.net/pagead/ads"),
+        _sent("3", "https://pagead2.googlesyndication.com/pagead/show_ads_impl.js"),
+        _sent("4", "https://automationexercise.com/static/css/main.css"),
+        _event("Network.loadingFailed", requestId="1", type="Script", blockedReason="inspector"),
+        _event("Network.loadingFailed", requestId="2", type="Document", blockedReason="inspector"),
+        _event("Network.loadingFailed", requestId="3", type="Script", blockedReason="inspector"),
+        # Failed without being blocked, and blocked before its requestWillBeSent was seen
+        _event("Network.loadingFailed", requestId="4", type="Stylesheet", errorText="net::ERR_ABORTED"),
+        _event("Network.loadingFailed", requestId="9", type="Image", blockedReason="inspector"),
+    ], by_type, by_host)
+
+    assert by_type == {"Script": 2, "Document": 1, "Image": 1}
+    assert by_host == {"pagead2.googlesyndication.com": 2, "googleads.g.doubleclick.net": 1, "unknown": 1}
+
+
+@allure.feature("Request Blocking")
+@allure.story("Counting blocked requests")
+def test_collect_estimates_bytes_per_resource_type():
+    blocker = RequestBlocker({"request_blocking": {"enabled": True}})
+    driver = _ChromiumDriver([_sent("stale", "https://www.google-analytics.com/analytics.js")])
+    blocker.begin(driver)  # drains what came before the test
+    driver.messages = [
+        _sent("1", "https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js"),
+        _sent("2", "https://googleads.g.doubleclick.net/pagead/ads"),
+        _sent("3", "https://www.google-analytics.com/collect"),
+        _event("Network.loadingFailed", requestId="1", type="Script", blockedReason="inspector"),
+        _event("Network.loadingFailed", requestId="2", type="Document", blockedReason="inspector"),
+        _event("Network.loadingFailed", requestId="3", type="Media", blockedReason="inspector"),
+    ]
+
+    assert blocker.collect(driver) == {
+        "blocked": 3,
+        "estimated_bytes_saved": 90_000 + 60_000 + 20_000,  # Media has no estimate and counts as Other
+        "by_type": {"Script": 1, "Document": 1, "Media": 1},
+        "by_host": {"pagead2.googlesyndication.com": 1, "googleads.g.doubleclick.net": 1,
+                    "www.google-analytics.com": 1},
+    }
+    assert blocker.collect(driver)["blocked"] == 0
+
+
+@allure.feature("Request Blocking")
+@allure.story("Firefox proxy")
+def test_proxy_matches_connect_targets_by_host(blocking_proxy):
+    assert blocking_proxy.is_blocked("https://pagead2.googlesyndication.com/")
+    assert blocking_proxy.is_blocked("https://ADSERVICE.GOOGLE.com/")
+    assert blocking_proxy.is_blocked("http://www.googletagmanager.com/gtm.js?id=GTM-1")
+    assert not blocking_proxy.is_blocked("https://automationexercise.com/")
+    assert not blocking_proxy.is_blocked("https://fonts.googleapis.com/")
+
+
+@allure.feature("Request Blocking")
+@allure.story("Firefox proxy")
+@pytest.mark.parametrize("request_head", [
+    b"CONNECT pagead2.googlesyndication.com:443 HTTP/1.1\r\nHost: pagead2.googlesyndication.com:443\r\n\r\n",
+    b"GET http://pagead2.googlesyndication.com/pagead/js HTTP/1.1\r\nHost: pagead2.googlesyndication.com\r\n\r\n",
+], ids=["connect", "absolute-form"])
+def test_proxy_refuses_blocked_hosts_with_403(blocking_proxy, request_head):
+    with socket.create_connection(("127.0.0.1", blocking_proxy.port), timeout=5) as client:
+        client.sendall(request_head)
+        response = b""
+        while chunk := client.recv(4096):
+            response += chunk
+
+    assert response.startswith(b"HTTP/1.1 403 Forbidden\r\n")
+    assert blocking_proxy.snapshot() == {"pagead2.googlesyndication.com": 1}
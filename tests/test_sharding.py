@@ -0,0 +1,40 @@
+import argparse
+
+import allure
+import pytest
+
+from plugins.sharding import assign_shards, parse_shard
+
+
+@pytest.fixture
+def estimates():
+    return {f"tests/test_module_{number % 7}.py::test_{number}": float(1 + number % 13) for number in range(120)}
+
+
+@allure.feature("Sharding")
+@allure.story("Balanced partition")
+def test_shards_are_balanced_by_duration(estimates):
+    assignment = assign_shards(estimates, 4)
+
+    loads = [sum(estimates[test] for test, shard in assignment.items() if shard == index) for index in range(4)]
+    assert set(assignment.values()) == {0, 1, 2, 3}
+    assert max(loads) <= sum(loads) / 4 * 1.1
+
+
+@allure.feature("Sharding")
+@allure.story("Stable partition")
+def test_adding_a_test_moves_few_others(estimates):
+    before = assign_shards(estimates, 4)
+    after = assign_shards({**estimates, "tests/test_new.py::test_checkout": 9.0}, 4)
+
+    moved = [test for test in before if before[test] != after[test]]
+    assert len(moved) <= len(estimates) // 10
+
+
+@allure.feature("Sharding")
+@allure.story("Option parsing")
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    for value in ("0/4", "5/4", "2-4"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(value)
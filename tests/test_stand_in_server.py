@@ -0,0 +1,64 @@
+import allure
+import pytest
+import requests
+
+from stand_in.server import StandInServer
+from utilities.account_pool import AccountPool
+from utilities.api_client import AccountApiClient
+from utilities.cookie_login import CookieLogin
+from utilities.data_loader import DataLoader
+from utilities.product_catalog import ProductCatalog
+from utilities.user_action import create_user_via_api
+
+
+@pytest.fixture
+def stand_in():
+    with StandInServer() as server:
+        yield server
+
+
+@pytest.fixture
+def profile():
+    return DataLoader.get_user_data()["default_registration_profile"].copy()
+
+
+@allure.feature("Stand-in Site")
+@allure.story("Product catalog")
+def test_catalog_scrape_resolves_categories_and_brands(stand_in):
+    catalog = ProductCatalog(stand_in.url, ProductCatalog._scrape(stand_in.url))
+
+    assert catalog.get("Blue Top") == {"id": 1, "name": "Blue Top", "price": 500,
+                                       "category": "Women > Tops", "brand": "Polo"}
+    assert catalog.get("Sleeves Top and Short - Blue & Pink")["brand"] == "Babyhug"
+
+    searched = requests.get(f"{stand_in.url}/products", params={"search": "jeans"}).text
+    assert searched.count('class="productinfo') == 3
+
+
+@allure.feature("Stand-in Site")
+@allure.story("Accounts and carts")
+def test_guest_cart_moves_to_account_on_login(stand_in, profile):
+    with AccountApiClient(stand_in.url) as api_client:
+        user = create_user_via_api(api_client, profile)
+
+        with requests.Session() as browser:
+            browser.get(f"{stand_in.url}/add_to_cart/1", params={"quantity": 2})
+            login = browser.get(f"{stand_in.url}/login").text
+            token = CookieLogin.CSRF_PATTERN.search(login).group(1)
+            home = browser.post(f"{stand_in.url}/login", data={
+                "csrfmiddlewaretoken": token, "email": user["email"], "password": user["password"],
+            })
+            assert f"Logged in as <b>{user['username']}</b>" in home.text
+
+            cart = browser.get(f"{stand_in.url}/view_cart").text
+            assert AccountPool.CART_ROW_PATTERN.findall(cart) == ["1"]
+            assert '<button class="disabled">2</button>' in cart
+
+            done = browser.post(f"{stand_in.url}/payment", data={"name_on_card": "Test"})
+            assert done.url.endswith("/payment_done/1000")
+            invoice = browser.get(f"{stand_in.url}/download_invoice/1000")
+            assert "invoice" in invoice.headers["Content-Disposition"]
+
+        assert api_client.delete_account(user["email"], user["password"])
+
+    assert stand_in.page_loads()["/view_cart"] == 1